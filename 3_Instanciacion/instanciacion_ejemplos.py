@@ -11,15 +11,22 @@ incluyendo las clases de los ejemplos anteriores.
 """
 
 # Importar las clases de los ejercicios anteriores
-import sys
-import os
+if __package__:
+    # Importado como parte del paquete clases_objetos: import relativo,
+    # sin tocar sys.path
+    from .persona import Persona
+    from .curso_estudiante import Estudiante, Curso
+else:
+    # Ejecutado directamente como script (python instanciacion_ejemplos.py):
+    # agregar las rutas de los módulos anteriores
+    import sys
+    import os
 
-# Agregar las rutas de los módulos anteriores
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '1_Creacion_Clases'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '2_Agregacion_Composicion'))
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '1_Creacion_Clases'))
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '2_Agregacion_Composicion'))
 
-from persona import Persona
-from curso_estudiante import Estudiante, Curso
+    from persona import Persona
+    from curso_estudiante import Estudiante, Curso
 
 
 """
@@ -266,11 +266,18 @@ class Perro(Mamifero):
         self.trucos.append(truco)
         return f"{self.nombre} aprendió el truco: {truco}"
     
-    def hacer_truco(self):
-        """Ejecuta un truco aleatorio."""
+    def hacer_truco(self, aleatorio=None):
+        """
+        Ejecuta un truco aleatorio.
+
+        Parámetros:
+            aleatorio (random.Random): generador de números aleatorios a usar
+                                       (opcional). Permite repetir la misma
+                                       secuencia de trucos usando una semilla.
+        """
         if self.trucos:
             import random
-            truco = random.choice(self.trucos)
+            truco = (aleatorio or random).choice(self.trucos)
             return f"{self.nombre} hace el truco: {truco} ⭐"
         return f"{self.nombre} aún no sabe trucos"
 
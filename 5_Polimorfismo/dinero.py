@@ -0,0 +1,420 @@
+"""
+DINERO EN CENTAVOS ENTEROS (aritmética de punto fijo)
+=====================================================
+
+Los float son binarios: 0.1 no existe exactamente, y al sumar millones de
+salarios los errores de cada operación se acumulan y el total se desvía en
+centavos. Decimal es exacto pero lento.
+
+Dinero guarda el monto como un ENTERO de centavos. Las sumas y restas son
+sumas de enteros: exactas y rápidas.
+
+REGLAS DE REDONDEO:
+- Al crear Dinero desde un número se usa su valor decimal tal como se
+  escribe (repr del float: 0.1 es "0.1") y se redondea al centavo
+- Al multiplicar por un factor (horas, porcentajes, recargos) se calcula el
+  producto EXACTO y se redondea UNA vez al centavo; por(a, b, ...) multiplica
+  varios factores y redondea una sola vez al final
+- Al dividir entre un número se redondea el cociente exacto al centavo
+- Los empates (medio centavo) se redondean hacia arriba (hacia +∞):
+  0.005 -> 0.01, -0.005 -> -0.00
+
+Esa regla se puede aplicar a columnas enteras de centavos con map() y el
+módulo operator (ver redondear_columna), así que el cálculo por columnas
+da exactamente los mismos centavos que el cálculo objeto por objeto.
+
+Uso:
+    salario = Dinero("3500.00")
+    pago = Dinero(25) * 160 + Dinero(25).por(20, 1.5)
+    print(f"${pago:,.2f}")
+
+Benchmark float / Decimal / Dinero / columnas de centavos:
+    python dinero.py
+"""
+
+import functools
+import math
+import operator
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from itertools import repeat
+
+
+# Centavos por unidad de moneda
+CENTAVOS_POR_UNIDAD = 100
+
+# Los float menores que esto (en unidades) se convierten sin pasar por Decimal
+_LIMITE_RAPIDO = 2.0 ** 40 / CENTAVOS_POR_UNIDAD
+
+
+@functools.lru_cache(maxsize=4096)
+def _fraccion_decimal(texto):
+    """Numerador y denominador exactos del número decimal escrito en texto."""
+    decimal = Decimal(texto)
+    if not decimal.is_finite():
+        raise ValueError(f"Monto no válido: {texto}")
+    return decimal.as_integer_ratio()
+
+
+@functools.lru_cache(maxsize=4096)
+def _fraccion_float(valor):
+    # Los valores iguales (1.0 == 1) comparten entrada: tienen la misma fracción
+    return _fraccion_decimal(repr(valor))
+
+
+def fraccion(valor):
+    """
+    Convierte un número en una fracción exacta (numerador, denominador).
+
+    Los float se toman por su representación decimal (repr), que es el
+    valor que la persona escribió: 0.1 -> (1, 10), no el binario más cercano.
+
+    Parámetros:
+        valor (int | float | str | Decimal): número a convertir
+
+    Returns:
+        tuple: (numerador, denominador) con denominador > 0
+    """
+    tipo = type(valor)
+    if tipo is float:
+        return _fraccion_float(valor)
+    if tipo is int:
+        return valor, 1
+    if isinstance(valor, int):
+        return int(valor), 1
+    if isinstance(valor, float):
+        return _fraccion_float(float(valor))
+    if isinstance(valor, (str, Decimal)):
+        return _fraccion_decimal(str(valor).strip())
+    if isinstance(valor, Fraction):
+        return valor.numerator, valor.denominator
+    raise TypeError(f"No se puede usar {type(valor).__name__} como cantidad de dinero")
+
+
+def redondear(numerador, denominador):
+    """
+    Redondea numerador / denominador al entero más cercano (empates hacia +∞).
+
+    Parámetros:
+        numerador (int): numerador exacto
+        denominador (int): denominador positivo
+
+    Returns:
+        int: resultado redondeado
+    """
+    return (2 * numerador + denominador) // (2 * denominador)
+
+
+def redondear_columna(numeradores, denominador):
+    """
+    Versión por columnas de redondear(): aplica la misma regla a muchos valores.
+
+    Todo ocurre en funciones de C (map + operator), sin una llamada de Python
+    por elemento.
+
+    Parámetros:
+        numeradores (iterable): enteros (por ejemplo, un array("q"))
+        denominador (int): denominador positivo común
+
+    Returns:
+        iterator: valores redondeados
+    """
+    if denominador % 2 == 0:
+        # (2n + d) // 2d == (n + d/2) // d cuando d es par: un paso menos
+        return map(operator.floordiv, map(operator.add, numeradores, repeat(denominador // 2)),
+                   repeat(denominador))
+    dobles = map(operator.mul, numeradores, repeat(2))
+    return map(operator.floordiv, map(operator.add, dobles, repeat(denominador)),
+               repeat(2 * denominador))
+
+
+def escalar(valor, escala):
+    """
+    Retorna valor × escala como entero si es exacto, o None si no lo es.
+
+    Sirve para guardar cantidades decimales (horas, porcentajes) en columnas
+    de enteros: escalar(7.25, 10_000) -> 72500, escalar(1/3, 10_000) -> None.
+    """
+    numerador, denominador = fraccion(valor)
+    producto = numerador * escala
+    if producto % denominador:
+        return None
+    return producto // denominador
+
+
+@functools.total_ordering
+class Dinero:
+    """
+    Monto de dinero inmutable guardado como centavos enteros.
+
+    Atributos:
+        centavos (int): monto en centavos
+    """
+
+    __slots__ = ("centavos",)
+
+    def __init__(self, valor=0):
+        """
+        Crea un monto a partir de un número.
+
+        Parámetros:
+            valor (Dinero | int | float | str | Decimal): monto en unidades
+                   de moneda (no en centavos); se redondea al centavo
+        """
+        tipo = type(valor)
+        if tipo is float and -_LIMITE_RAPIDO < valor < _LIMITE_RAPIDO:
+            # Camino rápido: valor × 100 en float difiere del valor decimal
+            # exacto en mucho menos de una milésima de centavo, así que si no
+            # está cerca de un empate el redondeo no es ambiguo
+            escalado = valor * CENTAVOS_POR_UNIDAD
+            entero = math.floor(escalado)
+            resto = escalado - entero
+            if abs(resto - 0.5) > 1e-3:
+                self.centavos = entero + (resto > 0.5)
+                return
+        if isinstance(valor, Dinero):
+            self.centavos = valor.centavos
+        elif isinstance(valor, int):
+            self.centavos = valor * CENTAVOS_POR_UNIDAD
+        else:
+            numerador, denominador = fraccion(valor)
+            self.centavos = redondear(numerador * CENTAVOS_POR_UNIDAD, denominador)
+
+    @classmethod
+    def de_centavos(cls, centavos):
+        """Crea un monto directamente desde una cantidad entera de centavos."""
+        monto = _nuevo(cls)
+        monto.centavos = centavos
+        return monto
+
+    @classmethod
+    def sumar(cls, montos):
+        """
+        Suma muchos montos de una vez (más rápido que sum() con objetos).
+
+        Parámetros:
+            montos (iterable): objetos Dinero o números
+
+        Returns:
+            Dinero: suma exacta
+        """
+        return cls.de_centavos(sum(
+            m.centavos if type(m) is Dinero else Dinero(m).centavos for m in montos
+        ))
+
+    # ------------------------------------------------------------------
+    # Aritmética
+    # ------------------------------------------------------------------
+
+    def __add__(self, otro):
+        if type(otro) is Dinero:
+            return _de_centavos(self.centavos + otro.centavos)
+        if isinstance(otro, (int, float, Decimal, Fraction)):
+            return _de_centavos(self.centavos + Dinero(otro).centavos)
+        return NotImplemented
+
+    __radd__ = __add__  # permite sum(montos), que empieza en 0
+
+    def __sub__(self, otro):
+        if type(otro) is Dinero:
+            return _de_centavos(self.centavos - otro.centavos)
+        if isinstance(otro, (int, float, Decimal, Fraction)):
+            return _de_centavos(self.centavos - Dinero(otro).centavos)
+        return NotImplemented
+
+    def __rsub__(self, otro):
+        if isinstance(otro, (int, float, Decimal, Fraction)):
+            return _de_centavos(Dinero(otro).centavos - self.centavos)
+        return NotImplemented
+
+    def __neg__(self):
+        return _de_centavos(-self.centavos)
+
+    def __abs__(self):
+        return _de_centavos(abs(self.centavos))
+
+    def __mul__(self, factor):
+        """Monto × factor, redondeado una vez al centavo."""
+        tipo = type(factor)
+        if tipo is float:
+            numerador, denominador = _fraccion_float(factor)
+        elif tipo is int:
+            return _de_centavos(self.centavos * factor)
+        elif isinstance(factor, Dinero):
+            return NotImplemented
+        else:
+            numerador, denominador = fraccion(factor)
+        # redondear() en línea: esta es la operación más frecuente de la nómina
+        return _de_centavos((2 * self.centavos * numerador + denominador) // (2 * denominador))
+
+    __rmul__ = __mul__
+
+    def por(self, *factores):
+        """
+        Multiplica por varios factores y redondea una sola vez al final.
+
+        Ejemplo: tarifa.por(horas_extra, 1.5)
+
+        Returns:
+            Dinero: producto redondeado al centavo
+        """
+        numerador, denominador = self.centavos, 1
+        for factor in factores:
+            n, d = fraccion(factor)
+            numerador *= n
+            denominador *= d
+        return _de_centavos(redondear(numerador, denominador))
+
+    def __truediv__(self, divisor):
+        """
+        Monto / número -> Dinero redondeado al centavo.
+        Monto / Dinero -> float (proporción entre dos montos).
+        """
+        if isinstance(divisor, Dinero):
+            return self.centavos / divisor.centavos
+        numerador, denominador = fraccion(divisor)
+        if numerador == 0:
+            raise ZeroDivisionError("División de dinero entre cero")
+        if numerador < 0:
+            numerador, denominador = -numerador, -denominador
+        return _de_centavos(redondear(self.centavos * denominador, numerador))
+
+    # ------------------------------------------------------------------
+    # Comparación y conversión
+    # ------------------------------------------------------------------
+
+    def _comparable(self, otro):
+        """(propio, otro) en una escala común, o None si no se pueden comparar."""
+        if isinstance(otro, Dinero):
+            return self.centavos, otro.centavos
+        if isinstance(otro, int):
+            return self.centavos, otro * CENTAVOS_POR_UNIDAD
+        if isinstance(otro, (float, Decimal, Fraction)):
+            # Comparación EXACTA, como la de Decimal y Fraction con float:
+            # Dinero("0.10") != 0.1 (el float es 0.1000000000000000055...).
+            # Así los montos iguales tienen el mismo hash (ver __hash__)
+            return Fraction(self.centavos, CENTAVOS_POR_UNIDAD), otro
+        return None
+
+    def __eq__(self, otro):
+        pareja = self._comparable(otro)
+        if pareja is None:
+            return NotImplemented
+        return pareja[0] == pareja[1]
+
+    def __lt__(self, otro):
+        pareja = self._comparable(otro)
+        if pareja is None:
+            return NotImplemented
+        return pareja[0] < pareja[1]
+
+    def __hash__(self):
+        # Igual al hash del número equivalente, para que Dinero(5) == 5 y
+        # Dinero("2.50") == 2.5 funcionen también como clave de diccionario
+        if self.centavos % CENTAVOS_POR_UNIDAD == 0:
+            return hash(self.centavos // CENTAVOS_POR_UNIDAD)
+        return hash(Fraction(self.centavos, CENTAVOS_POR_UNIDAD))
+
+    def __bool__(self):
+        return self.centavos != 0
+
+    def __float__(self):
+        return self.centavos / CENTAVOS_POR_UNIDAD
+
+    def a_decimal(self):
+        """Retorna el monto como Decimal exacto."""
+        return Decimal(self.centavos).scaleb(-2)
+
+    def __format__(self, especificacion):
+        """Formatea como número: f"{monto:,.2f}" -> "1,234.56" (exacto)."""
+        if not especificacion:
+            return str(self)
+        return format(self.a_decimal(), especificacion)
+
+    def __str__(self):
+        return f"${self:,.2f}"
+
+    def __repr__(self):
+        return f"Dinero('{self.a_decimal()}')"
+
+    def __reduce__(self):
+        return (Dinero.de_centavos, (self.centavos,))
+
+
+_nuevo = object.__new__
+
+
+def _de_centavos(centavos):
+    # Igual que Dinero.de_centavos, sin el costo de la llamada al classmethod
+    monto = _nuevo(Dinero)
+    monto.centavos = centavos
+    return monto
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def medir(cantidad=1_000_000):
+    """
+    Compara el pago por horas (horas × tarifa + extra × tarifa × 1.5) y su
+    suma con float, Decimal, Dinero y columnas de centavos.
+
+    Parámetros:
+        cantidad (int): número de empleados simulados
+
+    Returns:
+        dict: {método: (segundos, total)}
+    """
+    from array import array
+
+    tarifas = [10 + (i % 3000) / 100 for i in range(cantidad)]
+    horas = [100 + (i % 97) / 4 for i in range(cantidad)]
+    extras = [(i % 21) / 2 for i in range(cantidad)]
+    resultados = {}
+
+    inicio = time.perf_counter()
+    total = 0.0
+    for t, h, e in zip(tarifas, horas, extras):
+        total += h * t + e * t * 1.5
+    resultados["float"] = (time.perf_counter() - inicio, total)
+
+    tarifas_d = [Decimal(repr(t)) for t in tarifas]
+    horas_d = [Decimal(repr(h)) for h in horas]
+    extras_d = [Decimal(repr(e)) for e in extras]
+    centavo, recargo = Decimal("0.01"), Decimal("1.5")
+    inicio = time.perf_counter()
+    total = Decimal(0)
+    for t, h, e in zip(tarifas_d, horas_d, extras_d):
+        total += (h * t).quantize(centavo, ROUND_HALF_UP) \
+            + (e * t * recargo).quantize(centavo, ROUND_HALF_UP)
+    resultados["Decimal"] = (time.perf_counter() - inicio, total)
+
+    tarifas_m = [Dinero(t) for t in tarifas]
+    inicio = time.perf_counter()
+    total = Dinero(0)
+    for t, h, e in zip(tarifas_m, horas, extras):
+        total += t * h + t.por(e, 1.5)
+    resultados["Dinero"] = (time.perf_counter() - inicio, total)
+
+    escala = 10_000
+    columna_t = array("q", (m.centavos for m in tarifas_m))
+    columna_h = array("q", (escalar(h, escala) for h in horas))
+    columna_e = array("q", (escalar(e, escala) for e in extras))
+    recargo_n, recargo_d = fraccion(1.5)
+    inicio = time.perf_counter()
+    normal = redondear_columna(map(operator.mul, columna_h, columna_t), escala)
+    extra = redondear_columna(
+        map(operator.mul, map(operator.mul, columna_e, columna_t), repeat(recargo_n)),
+        escala * recargo_d,
+    )
+    total = Dinero.de_centavos(sum(map(operator.add, normal, extra)))
+    resultados["columnas de centavos"] = (time.perf_counter() - inicio, total)
+    return resultados
+
+
+if __name__ == "__main__":
+    print(f"{'Método':<22}{'Segundos':>10}   Total")
+    for metodo, (segundos, total) in medir().items():
+        print(f"{metodo:<22}{segundos:>10.3f}   {total:,.2f}")
@@ -22,10 +22,47 @@ TIPOS DE POLIMORFISMO EN PYTHON:
 
 Este ejemplo usa un sistema de nómina con diferentes tipos de empleados
 para demostrar el polimorfismo.
+
+Los montos se manejan con Dinero (centavos enteros, ver dinero.py) para que
+los totales de nómina no acumulen errores de redondeo de los float.
 """
 
+from array import array
+from collections import deque, namedtuple
+from fractions import Fraction
+
+if __package__:
+    # Importado como parte del paquete clases_objetos
+    from .dinero import Dinero, fraccion, redondear
+    from .orden_estadistico import ListaOrdenada
+else:
+    # Ejecutado directamente como script
+    from dinero import Dinero, fraccion, redondear
+    from orden_estadistico import ListaOrdenada
 
-class Empleado:
+
+class _TipoEmpleado(type):
+    """
+    Metaclase de Empleado: invalida los salarios en caché cuando se cambia
+    en la clase un parámetro del que depende calcular_salario()
+    (PARAMETROS_SALARIO, como RECARGO_HORAS_EXTRA).
+    
+    Asignar un atributo a la clase no pasa por el __setattr__ de las
+    instancias, así que sin esto el salario en caché quedaría desactualizado.
+    """
+    
+    def __setattr__(cls, nombre, valor):
+        type.__setattr__(cls, nombre, valor)
+        if nombre in cls.PARAMETROS_SALARIO:
+            Empleado.invalidar_parametros()
+    
+    def __delattr__(cls, nombre):
+        type.__delattr__(cls, nombre)
+        if nombre in cls.PARAMETROS_SALARIO:
+            Empleado.invalidar_parametros()
+
+
+class Empleado(metaclass=_TipoEmpleado):
     """
     CLASE BASE: Empleado
     
@@ -36,6 +73,23 @@ class Empleado:
     # Contador de empleados
     contador_empleados = 0
     
+    # Atributos de los que depende calcular_salario(); asignarlos invalida
+    # el salario en caché. Cada subclase declara los suyos.
+    CAMPOS_SALARIO = frozenset()
+    
+    # Atributos DE CLASE de los que depende calcular_salario(); asignarlos
+    # (en la clase o en una subclase) invalida los salarios en caché de
+    # todos los empleados
+    PARAMETROS_SALARIO = frozenset()
+    
+    # Aumenta cada vez que cambia el salario de CUALQUIER empleado; permite
+    # saber sin recorrer a nadie si las estadísticas siguen vigentes
+    version_salarios = 0
+    
+    # Aumenta cada vez que cambia un parámetro de clase; los salarios en
+    # caché de una versión anterior se vuelven a calcular
+    version_parametros = 0
+    
     def __init__(self, nombre, identificacion, fecha_ingreso):
         """
         Constructor base para todos los empleados.
@@ -55,6 +109,65 @@ class Empleado:
         
         print(f"✓ Empleado #{self.numero_empleado} registrado: {nombre}")
     
+    def __setattr__(self, nombre, valor):
+        """
+        Invalida el salario en caché al cambiar un dato de pago, y avisa a
+        los sistemas de nómina cuando cambia el estado (activo).
+        """
+        object.__setattr__(self, nombre, valor)
+        if nombre in self.CAMPOS_SALARIO:
+            self.invalidar_salario()
+        elif nombre == "activo":
+            for sistema in self.__dict__.get("_sistemas", ()):
+                sistema._actualizar_estado(self)
+    
+    def __getstate__(self):
+        """Al copiar o serializar no se llevan los sistemas a los que pertenece."""
+        estado = self.__dict__.copy()
+        estado.pop("_sistemas", None)
+        return estado
+    
+    def invalidar_salario(self):
+        """
+        Marca el salario en caché como desactualizado.
+        
+        Los métodos que modifican listas internas (ventas, proyectos...)
+        deben llamarlo, porque agregar a una lista no pasa por __setattr__.
+        """
+        self.__dict__["_salario_cache"] = None
+        Empleado.version_salarios += 1
+        # Anotarlo en el diario de cambios de los sistemas que lo contienen
+        for sistema in self.__dict__.get("_sistemas", ()):
+            sistema.diario_cambios[self] = None
+    
+    @staticmethod
+    def invalidar_parametros():
+        """
+        Marca como desactualizados los salarios en caché de TODOS los empleados.
+        
+        La llama la metaclase al cambiar un parámetro de PARAMETROS_SALARIO.
+        No recorre a nadie: cada caché guarda la versión de los parámetros
+        con la que se calculó, y los sistemas de nómina recalculan a todos
+        sus empleados en el siguiente recalcular_nomina().
+        """
+        Empleado.version_parametros += 1
+        Empleado.version_salarios += 1
+    
+    def salario_actual(self):
+        """
+        Retorna calcular_salario() usando el valor en caché si sigue vigente.
+        
+        Returns:
+            Dinero: salario del empleado
+        """
+        cache = self.__dict__.get("_salario_cache")
+        version = Empleado.version_parametros
+        if cache is not None and cache[1] == version:
+            return cache[0]
+        salario = self.calcular_salario()
+        self.__dict__["_salario_cache"] = (salario, version)
+        return salario
+    
     def calcular_salario(self):
         """
         Método BASE que debe ser implementado por cada subclase.
@@ -63,7 +176,7 @@ class Empleado:
         Cada tipo de empleado calculará su salario de forma diferente.
         
         Returns:
-            float: salario calculado
+            Dinero: salario calculado
         
         Nota: En una implementación real, este sería un método abstracto
         que OBLIGA a las subclases a implementarlo.
@@ -74,16 +187,48 @@ class Empleado:
         """
         Muestra información básica del empleado.
         
-        Este método puede ser sobrescrito por las subclases para agregar más información.
+        Une las líneas de lineas_informacion(); las subclases extienden ese
+        método en lugar de concatenar texto con +=.
         """
-        return f"""
-        --- Empleado #{self.numero_empleado} ---
-        Tipo: {self.__class__.__name__}
-        Nombre: {self.nombre}
-        ID: {self.identificacion}
-        Fecha de ingreso: {self.fecha_ingreso}
-        Estado: {'Activo' if self.activo else 'Inactivo'}
+        return "".join(self.lineas_informacion())
+    
+    def lineas_informacion(self):
+        """
+        Genera, una a una, las líneas del bloque de mostrar_informacion().
+        
+        Este método puede ser sobrescrito por las subclases para agregar más
+        información (con yield from super().lineas_informacion()).
+        
+        Yields:
+            str: fragmentos de texto del bloque
         """
+        yield "\n"
+        yield f"        --- Empleado #{self.numero_empleado} ---\n"
+        yield f"        Tipo: {self.__class__.__name__}\n"
+        yield f"        Nombre: {self.nombre}\n"
+        yield f"        ID: {self.identificacion}\n"
+        yield f"        Fecha de ingreso: {self.fecha_ingreso}\n"
+        yield f"        Estado: {'Activo' if self.activo else 'Inactivo'}\n"
+        yield "        "  # sangría final del bloque original
+    
+    def datos_reporte(self):
+        """
+        Retorna los datos del empleado para exportar (CSV, JSON Lines).
+        
+        Las subclases agregan sus propios campos.
+        
+        Returns:
+            dict: campo -> valor (texto, número o Dinero)
+        """
+        return {
+            "numero": self.numero_empleado,
+            "tipo": self.__class__.__name__,
+            "nombre": self.nombre,
+            "identificacion": self.identificacion,
+            "fecha_ingreso": self.fecha_ingreso,
+            "activo": self.activo,
+            "salario": self.salario_actual(),
+        }
     
     def trabajar(self):
         """Método común a todos los empleados."""
@@ -107,6 +252,8 @@ class EmpleadoTiempoCompleto(Empleado):
     POLIMORFISMO: Implementa calcular_salario() de forma específica.
     """
     
+    CAMPOS_SALARIO = frozenset({"salario_mensual", "beneficios"})
+    
     def __init__(self, nombre, identificacion, fecha_ingreso, salario_mensual):
         """
         Constructor para empleado de tiempo completo.
@@ -118,7 +265,7 @@ class EmpleadoTiempoCompleto(Empleado):
             salario_mensual (float): salario mensual fijo
         """
         super().__init__(nombre, identificacion, fecha_ingreso)
-        self.salario_mensual = salario_mensual
+        self.salario_mensual = Dinero(salario_mensual)
         self.beneficios = []
         print(f"  → Tipo: Tiempo Completo | Salario mensual: ${salario_mensual:,.2f}")
     
@@ -129,9 +276,9 @@ class EmpleadoTiempoCompleto(Empleado):
         Para empleados de tiempo completo, el salario es simplemente el salario mensual.
         
         Returns:
-            float: salario mensual fijo
+            Dinero: salario mensual fijo
         """
-        return self.salario_mensual
+        return Dinero(self.salario_mensual)
     
     def agregar_beneficio(self, beneficio, valor):
         """
@@ -141,7 +288,8 @@ class EmpleadoTiempoCompleto(Empleado):
             beneficio (str): nombre del beneficio
             valor (float): valor monetario del beneficio
         """
-        self.beneficios.append({"nombre": beneficio, "valor": valor})
+        self.beneficios.append({"nombre": beneficio, "valor": Dinero(valor)})
+        self.invalidar_salario()
         print(f"Beneficio agregado a {self.nombre}: {beneficio} (${valor:,.2f})")
     
     def calcular_salario_con_beneficios(self):
@@ -149,22 +297,32 @@ class EmpleadoTiempoCompleto(Empleado):
         Calcula el salario total incluyendo beneficios.
         
         Returns:
-            float: salario mensual + beneficios
+            Dinero: salario mensual + beneficios
         """
         salario_base = self.calcular_salario()
-        total_beneficios = sum(b["valor"] for b in self.beneficios)
+        total_beneficios = Dinero.sumar(b["valor"] for b in self.beneficios)
         return salario_base + total_beneficios
     
-    def mostrar_informacion(self):
+    def lineas_informacion(self):
         """SOBRESCRITURA que extiende el método base."""
-        info = super().mostrar_informacion()
-        info += f"        Salario mensual: ${self.salario_mensual:,.2f}\n"
+        yield from super().lineas_informacion()
+        yield f"        Salario mensual: ${self.salario_mensual:,.2f}\n"
         if self.beneficios:
-            info += "        Beneficios:\n"
+            yield "        Beneficios:\n"
             for beneficio in self.beneficios:
-                info += f"          - {beneficio['nombre']}: ${beneficio['valor']:,.2f}\n"
-            info += f"        Salario total: ${self.calcular_salario_con_beneficios():,.2f}\n"
-        return info
+                yield f"          - {beneficio['nombre']}: ${beneficio['valor']:,.2f}\n"
+            yield f"        Salario total: ${self.calcular_salario_con_beneficios():,.2f}\n"
+    
+    def datos_reporte(self):
+        """SOBRESCRITURA que extiende el método base."""
+        datos = super().datos_reporte()
+        datos["salario_mensual"] = self.salario_mensual
+        datos["beneficios"] = Dinero.sumar(b["valor"] for b in self.beneficios)
+        return datos
+
+
+# Registro de un período de pago cerrado de un empleado por horas
+PeriodoHoras = namedtuple("PeriodoHoras", "etiqueta horas_normales horas_extra salario")
 
 
 class EmpleadoPorHoras(Empleado):
@@ -176,6 +334,12 @@ class EmpleadoPorHoras(Empleado):
     POLIMORFISMO: Implementa calcular_salario() basándose en horas trabajadas.
     """
     
+    CAMPOS_SALARIO = frozenset({"tarifa_por_hora", "horas_trabajadas", "horas_extra"})
+    PARAMETROS_SALARIO = frozenset({"RECARGO_HORAS_EXTRA"})
+    
+    # Las horas extra se pagan con este factor sobre la tarifa normal
+    RECARGO_HORAS_EXTRA = 1.5
+    
     def __init__(self, nombre, identificacion, fecha_ingreso, tarifa_por_hora):
         """
         Constructor para empleado por horas.
@@ -187,9 +351,10 @@ class EmpleadoPorHoras(Empleado):
             tarifa_por_hora (float): pago por cada hora trabajada
         """
         super().__init__(nombre, identificacion, fecha_ingreso)
-        self.tarifa_por_hora = tarifa_por_hora
+        self.tarifa_por_hora = Dinero(tarifa_por_hora)
         self.horas_trabajadas = 0
         self.horas_extra = 0
+        self.periodos = []  # Historial de períodos cerrados (solo se agrega)
         print(f"  → Tipo: Por Horas | Tarifa: ${tarifa_por_hora:,.2f}/hora")
     
     def registrar_horas(self, horas, son_extra=False):
@@ -207,34 +372,183 @@ class EmpleadoPorHoras(Empleado):
             self.horas_trabajadas += horas
             print(f"✓ {horas} horas normales registradas para {self.nombre}")
     
+    def registrar_horas_lote(self, horas_normales, horas_extra=0):
+        """
+        Registra de una vez horas normales y extra ya acumuladas
+        (por ejemplo, de un archivo de marcaciones), con un solo mensaje.
+        
+        Parámetros:
+            horas_normales (float): horas normales a sumar
+            horas_extra (float): horas extra a sumar
+        """
+        if horas_normales:
+            self.horas_trabajadas += horas_normales
+        if horas_extra:
+            self.horas_extra += horas_extra
+        print(f"✓ {horas_normales} horas normales y {horas_extra} EXTRA registradas para {self.nombre}")
+    
     def calcular_salario(self):
         """
         IMPLEMENTACIÓN POLIMÓRFICA de calcular_salario().
         
         Para empleados por horas, el salario depende de las horas trabajadas.
         Las horas extra se pagan al 150% (1.5x la tarifa normal).
+        Cada parte se redondea una vez al centavo.
         
         Returns:
-            float: salario calculado según horas trabajadas
+            Dinero: salario calculado según horas trabajadas
         """
-        salario_normal = self.horas_trabajadas * self.tarifa_por_hora
-        salario_extra = self.horas_extra * self.tarifa_por_hora * 1.5
+        tarifa = Dinero(self.tarifa_por_hora)
+        salario_normal = tarifa * self.horas_trabajadas
+        salario_extra = tarifa.por(self.horas_extra, self.RECARGO_HORAS_EXTRA)
         return salario_normal + salario_extra
     
-    def resetear_horas(self):
-        """Reinicia el contador de horas para el nuevo período."""
+    def cerrar_periodo(self, etiqueta=None):
+        """
+        Cierra el período de pago actual y empieza uno nuevo.
+        
+        Las horas y el salario del período se guardan en self.periodos
+        (historial de solo agregar) y los contadores vuelven a cero.
+        
+        Parámetros:
+            etiqueta (str): nombre del período (default: "Período N")
+        
+        Returns:
+            PeriodoHoras: registro del período cerrado
+        """
+        periodo = PeriodoHoras(
+            etiqueta or f"Período {len(self.periodos) + 1}",
+            self.horas_trabajadas,
+            self.horas_extra,
+            self.calcular_salario(),
+        )
+        self.periodos.append(periodo)
         self.horas_trabajadas = 0
         self.horas_extra = 0
+        return periodo
+    
+    def resetear_horas(self):
+        """Reinicia el contador de horas para el nuevo período (guarda el anterior)."""
+        self.cerrar_periodo()
         print(f"Horas de {self.nombre} reiniciadas para nuevo período")
     
-    def mostrar_informacion(self):
+    def lineas_informacion(self):
         """SOBRESCRITURA que extiende el método base."""
-        info = super().mostrar_informacion()
-        info += f"        Tarifa por hora: ${self.tarifa_por_hora:,.2f}\n"
-        info += f"        Horas normales trabajadas: {self.horas_trabajadas}\n"
-        info += f"        Horas extra trabajadas: {self.horas_extra}\n"
-        info += f"        Salario calculado: ${self.calcular_salario():,.2f}\n"
-        return info
+        yield from super().lineas_informacion()
+        yield f"        Tarifa por hora: ${self.tarifa_por_hora:,.2f}\n"
+        yield f"        Horas normales trabajadas: {self.horas_trabajadas}\n"
+        yield f"        Horas extra trabajadas: {self.horas_extra}\n"
+        yield f"        Salario calculado: ${self.salario_actual():,.2f}\n"
+    
+    def datos_reporte(self):
+        """SOBRESCRITURA que extiende el método base."""
+        datos = super().datos_reporte()
+        datos["tarifa_por_hora"] = self.tarifa_por_hora
+        datos["horas_trabajadas"] = self.horas_trabajadas
+        datos["horas_extra"] = self.horas_extra
+        return datos
+
+
+class RegistroVentas:
+    """
+    Ventas de un período: arreglo de centavos de solo agregar, con su total.
+    
+    El total se actualiza al agregar cada venta, así que consultarlo es O(1)
+    sin importar cuántas ventas haya. Cada venta ocupa 8 bytes.
+    """
+    
+    # __weakref__: permite seguir el registro con referencias débiles (censo)
+    __slots__ = ("centavos", "total_centavos", "__weakref__")
+    
+    def __init__(self, montos=()):
+        """
+        Parámetros:
+            montos (iterable): ventas iniciales (Dinero o números)
+        """
+        self.centavos = array("q")
+        self.total_centavos = 0
+        self.extender(montos)
+    
+    def agregar(self, monto):
+        """Agrega una venta."""
+        centavos = Dinero(monto).centavos
+        self.centavos.append(centavos)
+        self.total_centavos += centavos
+    
+    def extender(self, montos):
+        """Agrega muchas ventas de una vez."""
+        nuevas = array("q", (Dinero(monto).centavos for monto in montos))
+        self.centavos.extend(nuevas)
+        self.total_centavos += sum(nuevas)
+    
+    @property
+    def total(self):
+        """Total de las ventas (Dinero), en O(1)."""
+        return Dinero.de_centavos(self.total_centavos)
+    
+    def __len__(self):
+        return len(self.centavos)
+    
+    def __iter__(self):
+        return map(Dinero.de_centavos, self.centavos)
+    
+    def __getitem__(self, indice):
+        return Dinero.de_centavos(self.centavos[indice])
+
+
+class EscalaComision:
+    """
+    Comisión escalonada sobre las ventas ACUMULADAS del período.
+    
+    Cada tramo paga su porcentaje solo sobre la parte de las ventas que cae
+    dentro de él (como los tramos de un impuesto):
+    
+        EscalaComision([(0, 0.05), (50_000, 0.08), (100_000, 0.12)])
+        ventas = 120,000 -> 50,000×5% + 50,000×8% + 20,000×12%
+    
+    La comisión se calcula en una sola pasada por los tramos, de forma exacta,
+    y se redondea una vez al centavo.
+    """
+    
+    def __init__(self, tramos):
+        """
+        Parámetros:
+            tramos (list): [(desde, porcentaje)] con "desde" creciente y el
+                           primer tramo desde 0
+        """
+        self.tramos = tuple((Dinero(desde), porcentaje) for desde, porcentaje in tramos)
+        if not self.tramos or self.tramos[0][0] != 0:
+            raise ValueError("El primer tramo debe empezar en 0")
+        limites = [desde for desde, _ in self.tramos]
+        if any(a >= b for a, b in zip(limites, limites[1:])):
+            raise ValueError("Los tramos deben estar en orden creciente")
+        self._tramos = [
+            (desde.centavos, Fraction(*fraccion(porcentaje))) for desde, porcentaje in self.tramos
+        ]
+    
+    def calcular(self, total_ventas):
+        """
+        Calcula la comisión para un total de ventas acumuladas.
+        
+        Parámetros:
+            total_ventas (Dinero): ventas acumuladas del período
+        
+        Returns:
+            Dinero: comisión redondeada al centavo
+        """
+        total = Dinero(total_ventas).centavos
+        comision = Fraction(0)
+        for i, (desde, porcentaje) in enumerate(self._tramos):
+            if total <= desde:
+                break
+            hasta = self._tramos[i + 1][0] if i + 1 < len(self._tramos) else total
+            comision += (min(total, hasta) - desde) * porcentaje
+        return Dinero.de_centavos(redondear(comision.numerator, comision.denominator))
+    
+    def __str__(self):
+        return ", ".join(
+            f"desde ${desde:,.2f}: {porcentaje*100}%" for desde, porcentaje in self.tramos
+        )
 
 
 class EmpleadoPorComision(Empleado):
@@ -246,7 +560,10 @@ class EmpleadoPorComision(Empleado):
     POLIMORFISMO: Implementa calcular_salario() basándose en ventas realizadas.
     """
     
-    def __init__(self, nombre, identificacion, fecha_ingreso, salario_base, porcentaje_comision):
+    CAMPOS_SALARIO = frozenset({"salario_base", "porcentaje_comision", "ventas", "escala_comision"})
+    
+    def __init__(self, nombre, identificacion, fecha_ingreso, salario_base, porcentaje_comision,
+                 escala_comision=None):
         """
         Constructor para empleado por comisión.
         
@@ -256,11 +573,14 @@ class EmpleadoPorComision(Empleado):
             fecha_ingreso (str): fecha de ingreso
             salario_base (float): salario base mínimo
             porcentaje_comision (float): porcentaje de comisión sobre ventas (ej: 0.05 = 5%)
+            escala_comision (EscalaComision): tramos de comisión opcionales; si
+                                              se indican, reemplazan al porcentaje fijo
         """
         super().__init__(nombre, identificacion, fecha_ingreso)
-        self.salario_base = salario_base
+        self.salario_base = Dinero(salario_base)
         self.porcentaje_comision = porcentaje_comision
-        self.ventas = []  # Lista de montos de ventas realizadas
+        self.escala_comision = escala_comision
+        self.ventas = RegistroVentas()  # Ventas realizadas, con total acumulado
         print(f"  → Tipo: Comisión | Base: ${salario_base:,.2f} + {porcentaje_comision*100}% comisión")
     
     def registrar_venta(self, monto):
@@ -270,26 +590,44 @@ class EmpleadoPorComision(Empleado):
         Parámetros:
             monto (float): monto de la venta
         """
-        self.ventas.append(monto)
+        self.ventas.agregar(monto)
+        self.invalidar_salario()
         print(f"✓ Venta de ${monto:,.2f} registrada para {self.nombre}")
     
+    def registrar_ventas(self, montos):
+        """
+        Registra muchas ventas de una vez (un solo mensaje para todas).
+        
+        Parámetros:
+            montos (iterable): montos de las ventas
+        """
+        cantidad_antes = len(self.ventas)
+        self.ventas.extender(montos)
+        self.invalidar_salario()
+        print(f"✓ {len(self.ventas) - cantidad_antes} ventas registradas para {self.nombre}")
+    
     def calcular_total_ventas(self):
         """
-        Calcula el total de ventas realizadas.
+        Retorna el total de ventas realizadas (acumulado, O(1)).
         
         Returns:
-            float: suma total de ventas
+            Dinero: suma total de ventas
         """
-        return sum(self.ventas)
+        ventas = self.ventas
+        if isinstance(ventas, RegistroVentas):
+            return ventas.total
+        return Dinero.sumar(ventas)  # ventas asignadas a mano como lista
     
     def calcular_comision(self):
         """
         Calcula la comisión ganada sobre las ventas.
         
         Returns:
-            float: comisión calculada
+            Dinero: comisión calculada (redondeada al centavo)
         """
         total_ventas = self.calcular_total_ventas()
+        if self.escala_comision is not None:
+            return self.escala_comision.calcular(total_ventas)
         return total_ventas * self.porcentaje_comision
     
     def calcular_salario(self):
@@ -300,24 +638,139 @@ class EmpleadoPorComision(Empleado):
         salario_base + (ventas_totales * porcentaje_comision)
         
         Returns:
-            float: salario base + comisiones
+            Dinero: salario base + comisiones
         """
-        return self.salario_base + self.calcular_comision()
+        return Dinero(self.salario_base) + self.calcular_comision()
     
     def resetear_ventas(self):
-        """Reinicia el registro de ventas para el nuevo período."""
-        self.ventas = []
+        """Reinicia el registro de ventas para el nuevo período (O(1))."""
+        self.ventas = RegistroVentas()
         print(f"Ventas de {self.nombre} reiniciadas para nuevo período")
     
-    def mostrar_informacion(self):
+    def lineas_informacion(self):
+        """SOBRESCRITURA que extiende el método base."""
+        yield from super().lineas_informacion()
+        yield f"        Salario base: ${self.salario_base:,.2f}\n"
+        if self.escala_comision is not None:
+            yield f"        Comisión escalonada: {self.escala_comision}\n"
+        else:
+            yield f"        Porcentaje de comisión: {self.porcentaje_comision*100}%\n"
+        yield f"        Total de ventas: ${self.calcular_total_ventas():,.2f}\n"
+        yield f"        Comisión ganada: ${self.calcular_comision():,.2f}\n"
+        yield f"        Salario total: ${self.salario_actual():,.2f}\n"
+    
+    def datos_reporte(self):
         """SOBRESCRITURA que extiende el método base."""
-        info = super().mostrar_informacion()
-        info += f"        Salario base: ${self.salario_base:,.2f}\n"
-        info += f"        Porcentaje de comisión: {self.porcentaje_comision*100}%\n"
-        info += f"        Total de ventas: ${self.calcular_total_ventas():,.2f}\n"
-        info += f"        Comisión ganada: ${self.calcular_comision():,.2f}\n"
-        info += f"        Salario total: ${self.calcular_salario():,.2f}\n"
-        return info
+        datos = super().datos_reporte()
+        datos["salario_base"] = self.salario_base
+        datos["comision"] = (str(self.escala_comision) if self.escala_comision is not None
+                             else self.porcentaje_comision)
+        datos["total_ventas"] = self.calcular_total_ventas()
+        datos["comision_ganada"] = self.calcular_comision()
+        return datos
+
+
+class Proyecto(namedtuple("Proyecto", "nombre pago completado")):
+    """
+    Registro de un proyecto (solo lectura).
+    
+    Admite también proyecto["nombre"], como los diccionarios que se usaban antes.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, clave):
+        if isinstance(clave, str):
+            return getattr(self, clave)
+        return super().__getitem__(clave)
+
+
+class LibroProyectos:
+    """
+    Proyectos de un freelancer guardados en columnas compactas e indexados por nombre.
+    
+    - nombres, pagos (centavos) y estado van en tres arreglos paralelos
+    - Para cada nombre se guarda la cola de sus proyectos PENDIENTES, así que
+      completar un proyecto es O(1) (se completa el más antiguo con ese nombre)
+    - Los totales completado y pendiente se actualizan en cada cambio
+    """
+    
+    def __init__(self):
+        self.nombres = []
+        self.pagos = array("q")           # centavos
+        self.completados = bytearray()    # 1 = completado
+        self._pendientes = {}             # nombre -> deque de posiciones pendientes
+        self.total_completado_centavos = 0
+        self.total_pendiente_centavos = 0
+        self.cantidad_completados = 0
+    
+    def agregar(self, nombre, pago):
+        """
+        Agrega un proyecto pendiente.
+        
+        Returns:
+            int: posición del proyecto en el libro
+        """
+        centavos = Dinero(pago).centavos
+        posicion = len(self.nombres)
+        self.nombres.append(nombre)
+        self.pagos.append(centavos)
+        self.completados.append(0)
+        self._pendientes.setdefault(nombre, deque()).append(posicion)
+        self.total_pendiente_centavos += centavos
+        return posicion
+    
+    def completar(self, nombre):
+        """
+        Marca como completado el proyecto pendiente más antiguo con ese nombre.
+        
+        Returns:
+            bool: False si no hay ningún proyecto pendiente con ese nombre
+        """
+        cola = self._pendientes.get(nombre)
+        if not cola:
+            return False
+        posicion = cola.popleft()
+        if not cola:
+            del self._pendientes[nombre]
+        centavos = self.pagos[posicion]
+        self.completados[posicion] = 1
+        self.total_pendiente_centavos -= centavos
+        self.total_completado_centavos += centavos
+        self.cantidad_completados += 1
+        return True
+    
+    @property
+    def total_completado(self):
+        """Pago total de los proyectos completados (Dinero), en O(1)."""
+        return Dinero.de_centavos(self.total_completado_centavos)
+    
+    @property
+    def total_pendiente(self):
+        """Pago total de los proyectos pendientes (Dinero), en O(1)."""
+        return Dinero.de_centavos(self.total_pendiente_centavos)
+    
+    @property
+    def cantidad_pendientes(self):
+        return len(self.nombres) - self.cantidad_completados
+    
+    def __len__(self):
+        return len(self.nombres)
+    
+    def __getitem__(self, posicion):
+        return Proyecto(self.nombres[posicion], Dinero.de_centavos(self.pagos[posicion]),
+                        bool(self.completados[posicion]))
+    
+    def __iter__(self):
+        for posicion in range(len(self.nombres)):
+            yield self[posicion]
+    
+    def filtrar(self, completado):
+        """Genera los proyectos completados (True) o pendientes (False), en orden."""
+        marca = 1 if completado else 0
+        for posicion, estado in enumerate(self.completados):
+            if estado == marca:
+                yield self[posicion]
 
 
 class EmpleadoFreelance(Empleado):
@@ -329,10 +782,12 @@ class EmpleadoFreelance(Empleado):
     POLIMORFISMO: Implementa calcular_salario() basándose en proyectos completados.
     """
     
+    CAMPOS_SALARIO = frozenset({"proyectos"})
+    
     def __init__(self, nombre, identificacion, fecha_ingreso):
         """Constructor para empleado freelance."""
         super().__init__(nombre, identificacion, fecha_ingreso)
-        self.proyectos = []  # Lista de proyectos: {"nombre": str, "pago": float, "completado": bool}
+        self.proyectos = LibroProyectos()  # Proyectos indexados por nombre, con totales
         print(f"  → Tipo: Freelance | Pago por proyecto")
     
     def agregar_proyecto(self, nombre_proyecto, pago):
@@ -343,12 +798,8 @@ class EmpleadoFreelance(Empleado):
             nombre_proyecto (str): nombre del proyecto
             pago (float): pago acordado por el proyecto
         """
-        proyecto = {
-            "nombre": nombre_proyecto,
-            "pago": pago,
-            "completado": False
-        }
-        self.proyectos.append(proyecto)
+        self.proyectos.agregar(nombre_proyecto, pago)
+        self.invalidar_salario()
         print(f"✓ Proyecto '{nombre_proyecto}' asignado a {self.nombre} (${pago:,.2f})")
     
     def completar_proyecto(self, nombre_proyecto):
@@ -358,11 +809,10 @@ class EmpleadoFreelance(Empleado):
         Parámetros:
             nombre_proyecto (str): nombre del proyecto a marcar como completado
         """
-        for proyecto in self.proyectos:
-            if proyecto["nombre"] == nombre_proyecto and not proyecto["completado"]:
-                proyecto["completado"] = True
-                print(f"✓ Proyecto '{nombre_proyecto}' completado por {self.nombre}")
-                return True
+        if self.proyectos.completar(nombre_proyecto):
+            self.invalidar_salario()
+            print(f"✓ Proyecto '{nombre_proyecto}' completado por {self.nombre}")
+            return True
         print(f"❌ Proyecto '{nombre_proyecto}' no encontrado o ya completado")
         return False
     
@@ -370,34 +820,36 @@ class EmpleadoFreelance(Empleado):
         """
         IMPLEMENTACIÓN POLIMÓRFICA de calcular_salario().
         
-        Para freelancers, el salario es la suma de todos los proyectos completados.
+        Para freelancers, el salario es la suma de todos los proyectos completados
+        (el libro de proyectos la lleva al día, así que es O(1)).
         
         Returns:
-            float: suma del pago de proyectos completados
+            Dinero: suma del pago de proyectos completados
         """
-        total = sum(p["pago"] for p in self.proyectos if p["completado"])
-        return total
+        return self.proyectos.total_completado
     
-    def mostrar_informacion(self):
+    def lineas_informacion(self):
         """SOBRESCRITURA que extiende el método base."""
-        info = super().mostrar_informacion()
-        info += f"        Total de proyectos: {len(self.proyectos)}\n"
-        
-        proyectos_completados = [p for p in self.proyectos if p["completado"]]
-        proyectos_pendientes = [p for p in self.proyectos if not p["completado"]]
+        yield from super().lineas_informacion()
+        yield f"        Total de proyectos: {len(self.proyectos)}\n"
         
-        info += f"        Proyectos completados: {len(proyectos_completados)}\n"
-        if proyectos_completados:
-            for p in proyectos_completados:
-                info += f"          ✓ {p['nombre']}: ${p['pago']:,.2f}\n"
+        yield f"        Proyectos completados: {self.proyectos.cantidad_completados}\n"
+        for p in self.proyectos.filtrar(completado=True):
+            yield f"          ✓ {p.nombre}: ${p.pago:,.2f}\n"
         
-        info += f"        Proyectos pendientes: {len(proyectos_pendientes)}\n"
-        if proyectos_pendientes:
-            for p in proyectos_pendientes:
-                info += f"          ○ {p['nombre']}: ${p['pago']:,.2f}\n"
+        yield f"        Proyectos pendientes: {self.proyectos.cantidad_pendientes}\n"
+        for p in self.proyectos.filtrar(completado=False):
+            yield f"          ○ {p.nombre}: ${p.pago:,.2f}\n"
         
-        info += f"        Salario total (completados): ${self.calcular_salario():,.2f}\n"
-        return info
+        yield f"        Salario total (completados): ${self.salario_actual():,.2f}\n"
+    
+    def datos_reporte(self):
+        """SOBRESCRITURA que extiende el método base."""
+        datos = super().datos_reporte()
+        datos["proyectos"] = len(self.proyectos)
+        datos["proyectos_completados"] = self.proyectos.cantidad_completados
+        datos["proyectos_pendientes"] = self.proyectos.cantidad_pendientes
+        return datos
 
 
 # ============================================================================
@@ -420,11 +872,47 @@ class SistemaNomina:
             nombre_empresa (str): nombre de la empresa
         """
         self.nombre_empresa = nombre_empresa
-        self.empleados = []
+        # Empleados en orden de ingreso (dict usado como conjunto ordenado:
+        # quitar uno es O(1)); la propiedad empleados da la lista
+        self._empleados = {}
+        self._lista_empleados = None
+        # Estadísticas en caché: (version_salarios, cantidad de empleados, valores)
+        self._estadisticas = None
+        # Diario de cambios: empleados cuyo salario cambió desde el último
+        # recalcular_nomina() (dict usado como conjunto ordenado)
+        self.diario_cambios = {}
+        # Versión de los parámetros de clase (Empleado.version_parametros)
+        # con la que se calcularon los salarios de _salarios
+        self._version_parametros = Empleado.version_parametros
+        self._salarios = {}      # empleado -> último salario usado en _total
+        self._total = Dinero(0)
+        # Índice por tipo: clase -> empleados (dict usado como conjunto
+        # ordenado), separados en activos e inactivos
+        self._activos = {}
+        self._inactivos = {}
+        # Salarios ordenados para rangos, percentiles y top-k: {None: todos,
+        # clase: los de ese tipo}, con valores (centavos, numero_empleado,
+        # id(empleado)): el id desempata a dos empleados con el mismo número
+        # (una copia de otro). Se crean en la primera consulta y luego los
+        # actualiza recalcular_nomina()
+        self._ordenes = None
+        self._por_id = {}        # id(empleado) -> empleado ordenado
         print(f"\n{'='*70}")
         print(f"Sistema de Nómina Inicializado: {nombre_empresa}")
         print(f"{'='*70}\n")
     
+    @property
+    def empleados(self):
+        """
+        Lista de los empleados en orden de ingreso.
+        
+        Se arma una vez después de cada cambio y se reutiliza; modificarla
+        no cambia el sistema (usar agregar_empleado / quitar_empleado).
+        """
+        if self._lista_empleados is None:
+            self._lista_empleados = list(self._empleados)
+        return self._lista_empleados
+    
     def agregar_empleado(self, empleado):
         """
         Agrega un empleado al sistema.
@@ -433,7 +921,15 @@ class SistemaNomina:
             empleado (Empleado): cualquier objeto que herede de Empleado
         """
         if isinstance(empleado, Empleado):
-            self.empleados.append(empleado)
+            if empleado in self._empleados:
+                print(f"❌ Error: {empleado.nombre} ya está en el sistema de nómina")
+                return
+            self._empleados[empleado] = None
+            self._lista_empleados = None
+            empleado.__dict__.setdefault("_sistemas", []).append(self)
+            self.diario_cambios[empleado] = None
+            indice = self._activos if empleado.activo else self._inactivos
+            indice.setdefault(type(empleado), {})[empleado] = None
             print(f"✓ {empleado.nombre} agregado al sistema de nómina")
         else:
             print("❌ Error: Solo se pueden agregar objetos de tipo Empleado")
@@ -449,17 +945,17 @@ class SistemaNomina:
         de forma diferente, según su propia implementación.
         
         Returns:
-            float: suma total de todos los salarios
+            Dinero: suma total de todos los salarios
         """
-        total = 0
+        total = Dinero(0)
         print(f"\n{'─'*70}")
         print(f"Calculando nómina para: {self.nombre_empresa}")
         print(f"{'─'*70}")
         
-        for empleado in self.empleados:
+        for empleado in self._empleados:
             # AQUÍ OCURRE EL POLIMORFISMO:
             # calcular_salario() se ejecuta de forma diferente según el tipo de empleado
-            salario = empleado.calcular_salario()
+            salario = empleado.salario_actual()
             total += salario
             
             # Mostrar desglose
@@ -472,6 +968,139 @@ class SistemaNomina:
         
         return total
     
+    def recalcular_nomina(self):
+        """
+        Actualiza la nómina total procesando SOLO los empleados que cambiaron.
+        
+        Cada empleado anota en diario_cambios cuándo cambia su salario
+        (horas, ventas, proyectos, datos de pago); aquí se recalculan solo
+        esos y el total se corrige con la diferencia de cada uno. El costo
+        depende de la cantidad de cambios, no de la cantidad de empleados.
+        
+        Returns:
+            Dinero: nómina total (igual a calcular_nomina_total())
+        """
+        if self._version_parametros != Empleado.version_parametros:
+            # Cambió un parámetro de clase (RECARGO_HORAS_EXTRA...): puede
+            # afectar a cualquiera, así que se recalculan todos
+            self._version_parametros = Empleado.version_parametros
+            self.diario_cambios.update(dict.fromkeys(self._empleados))
+        if not self.diario_cambios:
+            return self._total
+        total = self._total.centavos
+        anteriores = self._salarios
+        ordenes = self._ordenes
+        for empleado in self.diario_cambios:
+            salario = empleado.salario_actual()
+            if type(salario) is not Dinero:
+                salario = Dinero(salario)  # subclases propias pueden retornar float
+            anterior = anteriores.get(empleado)  # None: empleado nuevo
+            if anterior is None:
+                total += salario.centavos
+            else:
+                total += salario.centavos - anterior.centavos
+            anteriores[empleado] = salario
+            if ordenes is not None and (anterior is None or salario != anterior):
+                self._reordenar(empleado, anterior, salario)
+        self.diario_cambios.clear()
+        self._total = Dinero.de_centavos(total)
+        return self._total
+    
+    def _reordenar(self, empleado, anterior, nuevo):
+        """Cambia el salario de un empleado en las listas ordenadas (O(log n))."""
+        numero = empleado.numero_empleado
+        identidad = id(empleado)
+        tipo = type(empleado)
+        por_tipo = self._ordenes.get(tipo)
+        if por_tipo is None:
+            por_tipo = self._ordenes[tipo] = ListaOrdenada()
+        esta_ordenado = anterior is not None and self._por_id.get(identidad) is empleado
+        for orden in (self._ordenes[None], por_tipo):
+            if esta_ordenado:
+                orden.quitar((anterior.centavos, numero, identidad))
+            if nuevo is not None:
+                orden.agregar((nuevo.centavos, numero, identidad))
+        if nuevo is None:
+            self._por_id.pop(identidad, None)
+        else:
+            self._por_id[identidad] = empleado
+    
+    def _orden(self, tipo=None):
+        """
+        Lista ordenada de salarios (de todos o de un tipo), al día.
+        
+        La primera llamada ordena todos los salarios (O(n log n)); después
+        solo se aplican los cambios del diario.
+        """
+        self.recalcular_nomina()
+        if self._ordenes is None:
+            grupos = {None: []}
+            for empleado, salario in self._salarios.items():
+                valor = (salario.centavos, empleado.numero_empleado, id(empleado))
+                grupos[None].append(valor)
+                grupos.setdefault(type(empleado), []).append(valor)
+                self._por_id[id(empleado)] = empleado
+            self._ordenes = {clave: ListaOrdenada(valores) for clave, valores in grupos.items()}
+        return self._ordenes.get(tipo) or ListaOrdenada()
+    
+    def top_salarios(self, cantidad=100, tipo=None):
+        """
+        Los empleados mejor pagados, de mayor a menor salario.
+        
+        Parámetros:
+            cantidad (int): cuántos empleados retornar
+            tipo (type): solo empleados de esta clase (default: todos)
+        
+        Returns:
+            list: [(empleado, Dinero)] (O(cantidad + log n))
+        """
+        orden = self._orden(tipo)
+        return [(self._por_id[identidad], Dinero.de_centavos(centavos))
+                for centavos, _, identidad in orden.mayores(cantidad)]
+    
+    def percentil_salario(self, porcentaje, tipo=None):
+        """
+        Percentil de los salarios con interpolación lineal (50 = mediana).
+        
+        Parámetros:
+            porcentaje (float): entre 0 y 100
+            tipo (type): solo empleados de esta clase (default: todos)
+        
+        Returns:
+            Dinero: salario del percentil (redondeado al centavo), o None si
+                    no hay empleados
+        """
+        if not 0 <= porcentaje <= 100:
+            raise ValueError("El porcentaje debe estar entre 0 y 100")
+        orden = self._orden(tipo)
+        if not len(orden):
+            return None
+        posicion = Fraction(*fraccion(porcentaje)) * (len(orden) - 1) / 100
+        abajo = posicion.numerator // posicion.denominator
+        valor_abajo = orden[abajo][0]
+        if abajo == posicion:
+            return Dinero.de_centavos(valor_abajo)
+        valor_arriba = orden[abajo + 1][0]
+        exacto = valor_abajo + (valor_arriba - valor_abajo) * (posicion - abajo)
+        return Dinero.de_centavos(redondear(exacto.numerator, exacto.denominator))
+    
+    def rango_salario(self, empleado, tipo=None):
+        """
+        Puesto del empleado por salario (1 = el mejor pagado).
+        
+        Los empleados con el mismo salario comparten puesto.
+        
+        Parámetros:
+            empleado (Empleado): empleado del sistema
+            tipo (type): comparar solo con empleados de esta clase
+        
+        Returns:
+            int: 1 + cantidad de empleados con salario mayor (O(log n))
+        """
+        orden = self._orden(tipo)
+        centavos = Dinero(empleado.salario_actual()).centavos
+        return 1 + orden.contar_mayores((centavos, float("inf")))
+    
     def generar_reporte_detallado(self):
         """
         Genera un reporte detallado de todos los empleados.
@@ -483,49 +1112,177 @@ class SistemaNomina:
         print(f"REPORTE DETALLADO DE EMPLEADOS - {self.nombre_empresa}")
         print(f"{'='*70}")
         
-        for empleado in self.empleados:
+        for empleado in self._empleados:
             # Polimorfismo: cada tipo de empleado muestra su información de forma específica
             print(empleado.mostrar_informacion())
     
-    def listar_empleados_por_tipo(self):
-        """Lista empleados agrupados por tipo."""
-        from collections import defaultdict
+    def quitar_empleado(self, empleado):
+        """
+        Quita un empleado del sistema (y de la nómina acumulada).
         
-        por_tipo = defaultdict(list)
-        for emp in self.empleados:
-            tipo = emp.__class__.__name__
-            por_tipo[tipo].append(emp)
+        Parámetros:
+            empleado (Empleado): empleado a quitar
         
+        Returns:
+            bool: True si el empleado estaba en el sistema
+        """
+        indice = self._activos if empleado.activo else self._inactivos
+        grupo = indice.get(type(empleado))
+        if grupo is None or empleado not in grupo:
+            return False
+        del grupo[empleado]
+        if not grupo:
+            del indice[type(empleado)]
+        del self._empleados[empleado]
+        self._lista_empleados = None
+        empleado.__dict__["_sistemas"].remove(self)
+        self.diario_cambios.pop(empleado, None)
+        anterior = self._salarios.pop(empleado, None)
+        if anterior is not None:
+            self._total -= anterior
+            if self._ordenes is not None:
+                self._reordenar(empleado, anterior, None)
+        self._estadisticas = None
+        print(f"✓ {empleado.nombre} quitado del sistema de nómina")
+        return True
+    
+    def desactivar_empleado(self, empleado):
+        """Marca un empleado como inactivo (sigue en el sistema)."""
+        empleado.activo = False
+    
+    def activar_empleado(self, empleado):
+        """Marca un empleado como activo."""
+        empleado.activo = True
+    
+    def _actualizar_estado(self, empleado):
+        """Mueve un empleado entre los índices de activos e inactivos."""
+        if empleado.activo:
+            origen, destino = self._inactivos, self._activos
+        else:
+            origen, destino = self._activos, self._inactivos
+        grupo = origen.get(type(empleado))
+        if grupo is None or empleado not in grupo:
+            return  # ya estaba en el índice correcto
+        del grupo[empleado]
+        if not grupo:
+            del origen[type(empleado)]
+        destino.setdefault(type(empleado), {})[empleado] = None
+    
+    def contar_por_tipo(self, incluir_inactivos=False):
+        """
+        Cantidad de empleados de cada tipo (O(tipos), sin recorrer empleados).
+        
+        Parámetros:
+            incluir_inactivos (bool): contar también los inactivos
+        
+        Returns:
+            dict: {clase: cantidad}
+        """
+        conteo = {clase: len(grupo) for clase, grupo in self._activos.items()}
+        if incluir_inactivos:
+            for clase, grupo in self._inactivos.items():
+                conteo[clase] = conteo.get(clase, 0) + len(grupo)
+        return conteo
+    
+    def empleados_de_tipo(self, clase, incluir_inactivos=False, incluir_subclases=False):
+        """
+        Empleados de un tipo, tomados del índice.
+        
+        Parámetros:
+            clase (type): tipo de empleado (también subclases creadas en tiempo
+                          de ejecución)
+            incluir_inactivos (bool): incluir también los inactivos
+            incluir_subclases (bool): incluir los de las subclases de clase
+        
+        Returns:
+            list: empleados (activos primero, cada grupo en orden de ingreso)
+        """
+        indices = (self._activos, self._inactivos) if incluir_inactivos else (self._activos,)
+        resultado = []
+        for indice in indices:
+            if incluir_subclases:
+                for tipo, grupo in indice.items():
+                    if issubclass(tipo, clase):
+                        resultado.extend(grupo)
+            else:
+                resultado.extend(indice.get(clase, ()))
+        return resultado
+    
+    def listar_empleados_por_tipo(self):
+        """Lista empleados agrupados por tipo (usa el índice por tipo)."""
         print(f"\n{'='*70}")
         print(f"EMPLEADOS POR TIPO - {self.nombre_empresa}")
         print(f"{'='*70}\n")
         
-        for tipo, empleados in por_tipo.items():
-            print(f"{tipo}: {len(empleados)} empleado(s)")
-            for emp in empleados:
+        for clase in dict.fromkeys([*self._activos, *self._inactivos]):
+            activos = self._activos.get(clase, {})
+            inactivos = self._inactivos.get(clase, {})
+            print(f"{clase.__name__}: {len(activos) + len(inactivos)} empleado(s)")
+            for emp in activos:
                 print(f"  - {emp.nombre}")
+            for emp in inactivos:
+                print(f"  - {emp.nombre} (inactivo)")
             print()
     
+    def calcular_estadisticas(self):
+        """
+        Calcula total, promedio, máximo y mínimo en UNA sola pasada.
+        
+        El resultado se guarda y se reutiliza sin recorrer a nadie mientras
+        no cambie el salario de ningún empleado ni la lista de empleados.
+        
+        Returns:
+            dict: {"cantidad", "total", "promedio", "maximo", "minimo"},
+                  o None si no hay empleados
+        """
+        if not self._empleados:
+            return None
+        clave = (Empleado.version_salarios, len(self._empleados))
+        if self._estadisticas is not None and self._estadisticas[:2] == clave:
+            return self._estadisticas[2]
+        
+        total = Dinero(0)
+        salario_max = salario_min = None
+        for empleado in self._empleados:
+            salario = empleado.salario_actual()
+            total += salario
+            if salario_max is None or salario > salario_max:
+                salario_max = salario
+            if salario_min is None or salario < salario_min:
+                salario_min = salario
+        
+        estadisticas = {
+            "cantidad": len(self._empleados),
+            "total": total,
+            "promedio": total / len(self._empleados),
+            "maximo": salario_max,
+            "minimo": salario_min,
+        }
+        self._estadisticas = clave + (estadisticas,)
+        return estadisticas
+    
     def obtener_estadisticas(self):
         """Genera estadísticas del sistema de nómina."""
-        if not self.empleados:
+        estadisticas = self.calcular_estadisticas()
+        if estadisticas is None:
             print("No hay empleados en el sistema")
             return
         
-        nomina_total = sum(emp.calcular_salario() for emp in self.empleados)
-        promedio = nomina_total / len(self.empleados)
-        salario_max = max(emp.calcular_salario() for emp in self.empleados)
-        salario_min = min(emp.calcular_salario() for emp in self.empleados)
+        nomina_total = estadisticas["total"]
+        promedio = estadisticas["promedio"]
+        salario_max = estadisticas["maximo"]
+        salario_min = estadisticas["minimo"]
         
         print(f"\n{'='*70}")
         print(f"ESTADÍSTICAS - {self.nombre_empresa}")
         print(f"{'='*70}")
-        print(f"Total de empleados: {len(self.empleados)}")
+        print(f"Total de empleados: {len(self._empleados)}")
         print(f"Nómina total: ${nomina_total:,.2f}")
         print(f"Salario promedio: ${promedio:,.2f}")
         print(f"Salario más alto: ${salario_max:,.2f}")
         print(f"Salario más bajo: ${salario_min:,.2f}")
         print(f"{'='*70}\n")
+        return estadisticas
 
 
 # ============================================================================
@@ -0,0 +1,203 @@
+"""
+LISTA ORDENADA CON ESTADÍSTICOS DE ORDEN
+========================================
+
+Para conocer la mediana, el percentil 90 o los 100 salarios más altos de
+una nómina hay que tener los salarios ORDENADOS. Ordenar todo en cada
+consulta cuesta O(n log n); ListaOrdenada mantiene el orden al agregar y
+quitar valores:
+
+- Los valores se guardan en BLOQUES de listas ordenadas de unos CARGA
+  elementos, más el máximo de cada bloque para ubicarlos con bisect
+- Un árbol de Fenwick (árbol de índices binarios) guarda el tamaño de los
+  bloques, así que "cuántos valores hay antes de este bloque" y "en qué
+  bloque está la posición k" se responden en O(log n)
+
+Con eso:
+    agregar / quitar           -> O(log n) (más mover a lo sumo CARGA
+                                  referencias dentro del bloque)
+    lista[k], contar_menores() -> O(log n)
+    mayores(k)                 -> O(k + log n)
+
+Uso:
+    salarios = ListaOrdenada([3500, 1200, 4000])
+    salarios.agregar(2800)
+    salarios[len(salarios) // 2]      # mediana (posición central)
+    list(salarios.mayores(2))         # [4000, 3500]
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+
+
+class ListaOrdenada:
+    """
+    Colección ordenada de valores comparables (se permiten repetidos).
+    """
+
+    # Tamaño de referencia de cada bloque; un bloque se divide al doblarlo
+    CARGA = 512
+
+    __slots__ = ("_bloques", "_maximos", "_arbol", "_longitud")
+
+    def __init__(self, valores=()):
+        """
+        Parámetros:
+            valores (iterable): valores iniciales (en cualquier orden)
+        """
+        ordenados = sorted(valores)
+        carga = self.CARGA
+        self._bloques = [ordenados[i:i + carga] for i in range(0, len(ordenados), carga)]
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+        self._longitud = len(ordenados)
+        self._arbol = None
+
+    def __len__(self):
+        return self._longitud
+
+    def __iter__(self):
+        for bloque in self._bloques:
+            yield from bloque
+
+    def __repr__(self):
+        return f"ListaOrdenada({list(self)!r})"
+
+    # ------------------------------------------------------------------
+    # Árbol de Fenwick sobre los tamaños de los bloques
+    # ------------------------------------------------------------------
+
+    def _construir_arbol(self):
+        """Reconstruye el árbol (O(bloques)); se hace solo al dividir o vaciar bloques."""
+        arbol = [0] + [len(bloque) for bloque in self._bloques]
+        for i in range(1, len(arbol)):
+            padre = i + (i & -i)
+            if padre < len(arbol):
+                arbol[padre] += arbol[i]
+        self._arbol = arbol
+        return arbol
+
+    def _sumar_en_arbol(self, bloque, cantidad):
+        arbol = self._arbol
+        if arbol is None:
+            return
+        i = bloque + 1
+        while i < len(arbol):
+            arbol[i] += cantidad
+            i += i & -i
+
+    def _anteriores(self, bloque):
+        """Cantidad de valores en los bloques anteriores a `bloque`."""
+        arbol = self._arbol or self._construir_arbol()
+        total = 0
+        i = bloque
+        while i > 0:
+            total += arbol[i]
+            i -= i & -i
+        return total
+
+    def _ubicar(self, posicion):
+        """Bloque y posición dentro del bloque del valor número `posicion`."""
+        arbol = self._arbol or self._construir_arbol()
+        bloque = 0
+        paso = 1 << (len(arbol) - 1).bit_length()
+        while paso:
+            siguiente = bloque + paso
+            if siguiente < len(arbol) and arbol[siguiente] <= posicion:
+                bloque = siguiente
+                posicion -= arbol[siguiente]
+            paso >>= 1
+        return bloque, posicion
+
+    # ------------------------------------------------------------------
+    # Modificación
+    # ------------------------------------------------------------------
+
+    def agregar(self, valor):
+        """Agrega un valor manteniendo el orden."""
+        maximos = self._maximos
+        if not maximos:
+            self._bloques.append([valor])
+            maximos.append(valor)
+            self._longitud = 1
+            self._arbol = None
+            return
+        i = bisect_right(maximos, valor)
+        if i == len(maximos):
+            i -= 1
+            self._bloques[i].append(valor)
+            maximos[i] = valor
+        else:
+            insort(self._bloques[i], valor)
+        self._longitud += 1
+        self._sumar_en_arbol(i, 1)
+
+        bloque = self._bloques[i]
+        if len(bloque) > 2 * self.CARGA:
+            mitad = len(bloque) // 2
+            self._bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+            maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+            self._arbol = None
+
+    def quitar(self, valor):
+        """
+        Quita una aparición de un valor.
+
+        Raises:
+            ValueError: si el valor no está en la lista
+        """
+        maximos = self._maximos
+        i = bisect_left(maximos, valor)
+        if i < len(maximos):
+            bloque = self._bloques[i]
+            j = bisect_left(bloque, valor)
+            if bloque[j] == valor:
+                del bloque[j]
+                self._longitud -= 1
+                if bloque:
+                    maximos[i] = bloque[-1]
+                    self._sumar_en_arbol(i, -1)
+                else:
+                    del self._bloques[i]
+                    del maximos[i]
+                    self._arbol = None
+                return
+        raise ValueError(f"{valor!r} no está en la lista")
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, posicion):
+        """Valor en la posición indicada (0 = menor, -1 = mayor)."""
+        if posicion < 0:
+            posicion += self._longitud
+        if not 0 <= posicion < self._longitud:
+            raise IndexError("posición fuera de rango")
+        bloque, dentro = self._ubicar(posicion)
+        return self._bloques[bloque][dentro]
+
+    def contar_menores(self, valor):
+        """Cantidad de valores estrictamente menores que `valor` (O(log n))."""
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return self._longitud
+        return self._anteriores(i) + bisect_left(self._bloques[i], valor)
+
+    def contar_mayores(self, valor):
+        """Cantidad de valores estrictamente mayores que `valor` (O(log n))."""
+        i = bisect_right(self._maximos, valor)
+        if i == len(self._maximos):
+            return 0
+        return self._longitud - self._anteriores(i) - bisect_right(self._bloques[i], valor)
+
+    def mayores(self, cantidad):
+        """
+        Genera los `cantidad` valores más grandes, de mayor a menor.
+
+        Returns:
+            iterator: valores (O(cantidad) en total)
+        """
+        def de_mayor_a_menor():
+            for bloque in reversed(self._bloques):
+                yield from reversed(bloque)
+        return islice(de_mayor_a_menor(), cantidad)
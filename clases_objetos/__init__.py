@@ -0,0 +1,109 @@
+"""
+PAQUETE clases_objetos
+======================
+
+Expone las clases de los temas del curso como un paquete importable, sin
+modificar sys.path y sin importar nada hasta que se necesita.
+
+Los archivos de cada tema siguen viviendo en sus carpetas numeradas
+(1_Creacion_Clases, 2_Agregacion_Composicion, ...). Este paquete agrega esas
+carpetas a su __path__, de modo que cada archivo se puede importar como un
+submódulo:
+
+    from clases_objetos.persona import Persona
+    from clases_objetos import Perro          # carga perezosa (PEP 562)
+
+CARGA PEREZOSA:
+- `import clases_objetos` no importa ningún tema
+- El submódulo se importa la primera vez que se accede a uno de sus nombres
+- Después el nombre queda guardado en el paquete y no vuelve a resolverse
+"""
+
+import importlib
+import os
+
+
+_RAIZ_CURSO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Carpetas de los temas que forman parte del paquete
+_CARPETAS_TEMAS = (
+    "1_Creacion_Clases",
+    "2_Agregacion_Composicion",
+    "3_Instanciacion",
+    "4_Herencia",
+    "5_Polimorfismo",
+)
+
+__path__.extend(os.path.join(_RAIZ_CURSO, carpeta) for carpeta in _CARPETAS_TEMAS)
+
+# Nombre público -> submódulo que lo define
+_EXPORTACIONES = {
+    "Persona": "persona",
+    "Estudiante": "curso_estudiante",
+    "Modulo": "curso_estudiante",
+    "Curso": "curso_estudiante",
+    "Animal": "animales_herencia",
+    "Mamifero": "animales_herencia",
+    "Oviparo": "animales_herencia",
+    "Perro": "animales_herencia",
+    "Gato": "animales_herencia",
+    "Aguila": "animales_herencia",
+    "Pinguino": "animales_herencia",
+    "Empleado": "empleados_polimorfismo",
+    "EmpleadoTiempoCompleto": "empleados_polimorfismo",
+    "EmpleadoPorHoras": "empleados_polimorfismo",
+    "EmpleadoPorComision": "empleados_polimorfismo",
+    "EmpleadoFreelance": "empleados_polimorfismo",
+    "SistemaNomina": "empleados_polimorfismo",
+    "PoblacionAnimales": "poblacion",
+    "PlanificadorActividades": "planificador",
+    "MundoAnimales": "espacial",
+    "SimulacionParalela": "simulacion_paralela",
+    "ColeccionAnimales": "coleccion_tipada",
+    "EstadisticasAnimales": "estadisticas",
+    "NominaColumnar": "nomina_columnar",
+    "Dinero": "dinero",
+    "ListaOrdenada": "orden_estadistico",
+}
+
+# Submódulos accesibles como atributos del paquete
+_SUBMODULOS = frozenset(_EXPORTACIONES.values()) | {
+    "instanciacion_ejemplos",
+    "tiempo_importacion",
+    "censo",
+    "formato_info",
+    "serializacion",
+    "nomina_paralela",
+    "marcaciones",
+    "nomina_incremental",
+    "punto_control",
+    "reporte_nomina",
+    "deducciones",
+    "escenarios",
+    "rendimiento_nomina",
+}
+
+__all__ = sorted(_EXPORTACIONES)
+
+
+def __getattr__(nombre):
+    """
+    Resuelve de forma perezosa los nombres públicos y los submódulos (PEP 562).
+
+    Solo se ejecuta cuando el nombre todavía no está en el paquete.
+    """
+    if nombre in _SUBMODULOS:
+        return importlib.import_module(f".{nombre}", __name__)
+
+    submodulo = _EXPORTACIONES.get(nombre)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+    valor = getattr(importlib.import_module(f".{submodulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    """Incluye los nombres perezosos en dir(clases_objetos)."""
+    return sorted(set(globals()) | set(_EXPORTACIONES) | _SUBMODULOS)
@@ -0,0 +1,246 @@
+"""
+CENSO DE INSTANCIAS VIVAS
+=========================
+
+Los contadores de clase (Persona.contador_personas, Empleado.contador_empleados)
+solo dicen cuántos objetos se han CREADO. Este módulo cuenta cuántos siguen
+VIVOS en memoria, por clase, para encontrar fugas de objetos (por ejemplo
+Estudiante o Empleado que nunca se liberan en un proceso de larga duración).
+
+FUNCIONAMIENTO:
+- El censo es opcional: no hace nada hasta que se llama a activar_censo()
+- Los constructores NO se modifican, así que crear objetos no cuesta nada extra
+- Al pedir una instantánea se recorren los objetos del recolector de basura
+  (gc) y se cuentan las instancias de las jerarquías de los modelos
+  (Persona, Estudiante, Curso, Animal, Empleado...), no las de las clases
+  auxiliares de cada módulo (SistemaNomina, RegistroVentas, ...)
+- Cada instancia vista se registra con una referencia débil (weakref), que no
+  impide liberarla. Así, en la siguiente instantánea se sabe qué objetos son
+  nuevos y cuáles sobreviven desde instantáneas anteriores (candidatos a fuga)
+- Las instancias que no admiten referencias débiles (clases con __slots__
+  sin __weakref__) se cuentan como vivas, pero sin seguimiento
+- Antes de contar se ejecuta gc.collect(): los ciclos inalcanzables que el
+  recolector todavía no liberó no deben aparecer como sobrevivientes
+- Un mismo archivo de modelos puede cargarse dos veces: como submódulo del
+  paquete (clases_objetos.persona) y como módulo suelto desde un script
+  (import persona). Son clases distintas para isinstance(), así que también
+  se reconocen por nombre (__qualname__) y archivo de origen, y se cuentan
+  juntas bajo el mismo nombre
+
+Uso:
+    from clases_objetos import censo
+
+    censo.activar_censo()
+    ...
+    censo.reportar_censo()
+"""
+
+import gc
+import importlib
+import os
+import sys
+import weakref
+
+
+# Clases raíz de los modelos censadas por defecto, por módulo (isinstance()
+# sobre la raíz también cubre a sus subclases)
+MODELOS = (
+    ("clases_objetos.persona", ("Persona",)),
+    ("clases_objetos.curso_estudiante", ("Estudiante", "Modulo", "Curso")),
+    ("clases_objetos.animales_herencia", ("Animal",)),
+    ("clases_objetos.empleados_polimorfismo", ("Empleado",)),
+)
+
+# Contadores de clase existentes: permiten comparar creados vs. vivos
+_CONTADORES_CREADOS = ("contador_personas", "contador_empleados")
+
+
+def clases_de_modelos(modelos=MODELOS):
+    """
+    Retorna las clases raíz de las jerarquías de los modelos.
+
+    Parámetros:
+        modelos (tuple): pares (nombre completo del módulo, nombres de clases)
+
+    Returns:
+        tuple: clases raíz de los modelos
+    """
+    clases = []
+    for nombre_modulo, nombres in modelos:
+        modulo = importlib.import_module(nombre_modulo)
+        clases.extend(getattr(modulo, nombre) for nombre in nombres)
+    return tuple(clases)
+
+
+def _origen(clase):
+    """(qualname, archivo real del módulo) de una clase, o None si no tiene archivo."""
+    archivo = getattr(sys.modules.get(clase.__module__), "__file__", None)
+    if archivo is None:
+        return None
+    return clase.__qualname__, os.path.realpath(archivo)
+
+
+class CensoInstancias:
+    """
+    Censo de instancias vivas por clase, basado en referencias débiles.
+
+    Cada instantánea cuenta los objetos vivos de cada clase concreta y
+    registra cada objeto en un WeakKeyDictionary con el número de la
+    instantánea en que se vio por primera vez.
+    """
+
+    def __init__(self, clases=None):
+        """
+        Constructor del censo.
+
+        Parámetros:
+            clases (tuple): clases raíz a censar (default: las de MODELOS)
+        """
+        self.clases = tuple(clases) if clases is not None else clases_de_modelos()
+        self._origenes = {_origen(clase) for clase in self.clases} - {None}
+        self.numero_instantanea = 0
+        # objeto -> número de la instantánea en que se vio por primera vez
+        self._primera_vez = weakref.WeakKeyDictionary()
+
+    def _es_copia(self, clase):
+        """True si la clase o una de sus bases es una copia de una clase raíz."""
+        return any(_origen(base) in self._origenes for base in clase.__mro__)
+
+    def instantanea(self, recolectar=True):
+        """
+        Toma una instantánea de las instancias vivas.
+
+        Parámetros:
+            recolectar (bool): ejecutar gc.collect() antes de contar (si es
+                               False, los ciclos aún no liberados se cuentan
+                               como vivos)
+
+        Returns:
+            dict: {nombre_clase: {"vivos": int, "nuevos": int,
+                                  "sobrevivientes": int, "sin_seguimiento": int,
+                                  "creados": int | None}}
+                  donde "sobrevivientes" son los objetos vistos por primera vez
+                  en una instantánea anterior a la previa y "sin_seguimiento"
+                  los vivos que no admiten referencias débiles
+        """
+        if recolectar:
+            gc.collect()
+        self.numero_instantanea += 1
+        numero = self.numero_instantanea
+        raices = self.clases
+        primera_vez = self._primera_vez
+        resumen = {}
+        # clase -> fila de su nombre, o None si no se censa (una vez por clase;
+        # las copias de una misma clase comparten la fila y suman lo suyo)
+        filas = {}
+
+        for objeto in gc.get_objects():
+            clase = type(objeto)
+            try:
+                datos = filas[clase]
+            except KeyError:
+                datos = None
+                if isinstance(objeto, raices) or self._es_copia(clase):
+                    datos = resumen.get(clase.__name__)
+                    if datos is None:
+                        datos = resumen[clase.__name__] = {
+                            "vivos": 0, "nuevos": 0, "sobrevivientes": 0,
+                            "sin_seguimiento": 0, "creados": None,
+                        }
+                    creados = _creados(clase)
+                    if creados is not None:
+                        datos["creados"] = (datos["creados"] or 0) + creados
+                filas[clase] = datos
+            if datos is None:
+                continue
+            datos["vivos"] += 1
+            try:
+                vista = primera_vez.get(objeto)
+            except TypeError:  # no admite weakref: solo se cuenta
+                datos["sin_seguimiento"] += 1
+                continue
+            if vista is None:
+                primera_vez[objeto] = numero
+                datos["nuevos"] += 1
+            elif vista < numero - 1:
+                datos["sobrevivientes"] += 1
+
+        return resumen
+
+    def reportar(self):
+        """Muestra una instantánea del censo en formato de tabla."""
+        datos = self.instantanea()
+        print(f"\n{'='*70}")
+        print(f"CENSO DE INSTANCIAS VIVAS (instantánea #{self.numero_instantanea})")
+        print(f"{'='*70}")
+        print(f"{'Clase':<25}{'Vivos':>10}{'Nuevos':>10}{'Sobreviv.':>12}{'Creados':>10}")
+        for nombre, fila in sorted(datos.items()):
+            creados = "-" if fila["creados"] is None else fila["creados"]
+            print(f"{nombre:<25}{fila['vivos']:>10}{fila['nuevos']:>10}"
+                  f"{fila['sobrevivientes']:>12}{creados:>10}")
+        print(f"{'='*70}\n")
+        return datos
+
+
+def _creados(clase):
+    """Retorna el contador de objetos creados de la clase, si existe."""
+    for nombre in _CONTADORES_CREADOS:
+        valor = getattr(clase, nombre, None)
+        if isinstance(valor, int):
+            return valor
+    return None
+
+
+# ============================================================================
+# CENSO GLOBAL (opcional)
+# ============================================================================
+
+_censo_activo = None
+
+
+def activar_censo(clases=None):
+    """
+    Activa el censo global del proceso.
+
+    Parámetros:
+        clases (tuple): clases raíz a censar (default: las de MODELOS)
+
+    Returns:
+        CensoInstancias: el censo activo
+    """
+    global _censo_activo
+    if _censo_activo is None:
+        _censo_activo = CensoInstancias(clases)
+    return _censo_activo
+
+
+def desactivar_censo():
+    """Desactiva el censo global y libera sus referencias débiles."""
+    global _censo_activo
+    _censo_activo = None
+
+
+def censo_activo():
+    """Retorna True si el censo global está activo."""
+    return _censo_activo is not None
+
+
+def instantanea_censo():
+    """
+    Toma una instantánea del censo global.
+
+    Returns:
+        dict: resultado de CensoInstancias.instantanea(), o {} si el censo
+              no está activo
+    """
+    if _censo_activo is None:
+        return {}
+    return _censo_activo.instantanea()
+
+
+def reportar_censo():
+    """Muestra una instantánea del censo global (si está activo)."""
+    if _censo_activo is None:
+        print("El censo de instancias no está activo")
+        return {}
+    return _censo_activo.reportar()
@@ -0,0 +1,243 @@
+"""
+COLECCIÓN DE ANIMALES INDEXADA POR TIPO
+=======================================
+
+demostrar_isinstance_y_herencia() filtra con isinstance() recorriendo toda
+la lista. Con muchos animales, preguntas como "todos los Mamifero" o "todos
+los Oviparo que pueden volar" son recorridos completos.
+
+ColeccionAnimales mantiene:
+
+- Una CUBETA por clase concreta (Perro, Gato, Aguila, ...)
+- Para cada clase del MRO, la lista de clases concretas que descienden de
+  ella: "todos los Mamifero" = cubeta de Perro + cubeta de Gato + ...
+- Un CONTADOR por clase del MRO: contar(Mamifero) es O(1)
+- ÍNDICES opcionales por atributo (puede_volar, numero_patas, ...):
+  valor -> animales, con su propio contador por clase
+
+Uso:
+    coleccion = ColeccionAnimales(animales)
+    coleccion.contar(Mamifero)
+    list(coleccion.de_tipo(Oviparo))
+    coleccion.filtrar(Oviparo, puede_volar=True)
+    coleccion.contar(Oviparo, puede_volar=True)
+"""
+
+from .animales_herencia import Animal
+
+
+# Atributos indexados por defecto
+INDICES_POR_DEFECTO = ("puede_volar", "numero_patas")
+
+# Marca para los animales que no tienen un atributo indexado
+_AUSENTE = object()
+
+
+class ColeccionAnimales:
+    """
+    Colección de animales con cubetas por clase e índices por atributo.
+
+    Los animales se identifican por identidad (id), igual que en una lista
+    con el operador "is". Si un atributo indexado cambia después de agregar
+    el animal, hay que llamar a reindexar(animal).
+    """
+
+    def __init__(self, animales=(), indices=INDICES_POR_DEFECTO):
+        """
+        Constructor de la colección.
+
+        Parámetros:
+            animales (iterable): animales iniciales
+            indices (tuple): atributos a indexar
+        """
+        self._cubetas = {}            # clase concreta -> {id: animal}
+        self._conteos = {}            # clase del MRO -> cantidad
+        self._concretas = {}          # clase del MRO -> [clases concretas]
+        self._indices = {}            # atributo -> {valor: {id: animal}}
+        self._conteos_indice = {}     # (atributo, valor) -> {clase del MRO: cantidad}
+        self._valores = {}            # id -> {atributo: valor indexado}
+        for atributo in indices:
+            self._indices[atributo] = {}
+        for animal in animales:
+            self.agregar(animal)
+
+    def __len__(self):
+        return self._conteos.get(object, 0)
+
+    def __contains__(self, animal):
+        return id(animal) in self._valores
+
+    def __iter__(self):
+        for cubeta in self._cubetas.values():
+            yield from cubeta.values()
+
+    # ------------------------------------------------------------------
+    # Altas y bajas
+    # ------------------------------------------------------------------
+
+    def agregar(self, animal):
+        """
+        Agrega un animal a su cubeta, contadores e índices.
+
+        Parámetros:
+            animal (Animal): animal a agregar (si ya está, no se duplica)
+        """
+        clave = id(animal)
+        if clave in self._valores:
+            return
+        clase = type(animal)
+        cubeta = self._cubetas.get(clase)
+        if cubeta is None:
+            cubeta = self._cubetas[clase] = {}
+            for base in clase.__mro__:
+                self._concretas.setdefault(base, []).append(clase)
+        cubeta[clave] = animal
+
+        for base in clase.__mro__:
+            self._conteos[base] = self._conteos.get(base, 0) + 1
+
+        valores = {}
+        for atributo, indice in self._indices.items():
+            valor = getattr(animal, atributo, _AUSENTE)
+            valores[atributo] = valor
+            if valor is _AUSENTE:
+                continue
+            indice.setdefault(valor, {})[clave] = animal
+            conteos = self._conteos_indice.setdefault((atributo, valor), {})
+            for base in clase.__mro__:
+                conteos[base] = conteos.get(base, 0) + 1
+        self._valores[clave] = valores
+
+    def quitar(self, animal):
+        """
+        Quita un animal de la colección.
+
+        Parámetros:
+            animal (Animal): animal a quitar
+
+        Returns:
+            bool: True si estaba en la colección
+        """
+        clave = id(animal)
+        valores = self._valores.pop(clave, None)
+        if valores is None:
+            return False
+        clase = type(animal)
+        del self._cubetas[clase][clave]
+        for base in clase.__mro__:
+            self._conteos[base] -= 1
+
+        for atributo, valor in valores.items():
+            if valor is _AUSENTE:
+                continue
+            grupo = self._indices[atributo][valor]
+            del grupo[clave]
+            if not grupo:
+                del self._indices[atributo][valor]
+            conteos = self._conteos_indice[(atributo, valor)]
+            for base in clase.__mro__:
+                conteos[base] -= 1
+        return True
+
+    def reindexar(self, animal):
+        """Actualiza los índices de un animal cuyos atributos cambiaron."""
+        if self.quitar(animal):
+            self.agregar(animal)
+
+    def indexar(self, atributo):
+        """
+        Crea un índice nuevo sobre un atributo (recorre la colección una vez).
+
+        Parámetros:
+            atributo (str): nombre del atributo a indexar
+        """
+        if atributo in self._indices:
+            return
+        indice = self._indices[atributo] = {}
+        for cubeta in self._cubetas.values():
+            for clave, animal in cubeta.items():
+                valor = getattr(animal, atributo, _AUSENTE)
+                self._valores[clave][atributo] = valor
+                if valor is _AUSENTE:
+                    continue
+                indice.setdefault(valor, {})[clave] = animal
+                conteos = self._conteos_indice.setdefault((atributo, valor), {})
+                for base in type(animal).__mro__:
+                    conteos[base] = conteos.get(base, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def contar(self, clase=Animal, **criterio):
+        """
+        Cuenta los animales de una clase (incluidas sus subclases).
+
+        Parámetros:
+            clase (type): clase a contar
+            **criterio: como máximo un atributo indexado, por ejemplo
+                        puede_volar=True (también O(1))
+
+        Returns:
+            int: cantidad de animales
+        """
+        if not criterio:
+            return self._conteos.get(clase, 0)
+        if len(criterio) != 1:
+            return len(self.filtrar(clase, **criterio))
+        ((atributo, valor),) = criterio.items()
+        if atributo not in self._indices:
+            return len(self.filtrar(clase, **criterio))
+        return self._conteos_indice.get((atributo, valor), {}).get(clase, 0)
+
+    def de_tipo(self, clase):
+        """
+        Genera los animales de una clase, combinando las cubetas de sus subclases.
+
+        Parámetros:
+            clase (type): clase buscada (por ejemplo Mamifero)
+        """
+        for concreta in self._concretas.get(clase, ()):
+            yield from self._cubetas[concreta].values()
+
+    def filtrar(self, clase=Animal, **criterios):
+        """
+        Retorna los animales de una clase que cumplen todos los criterios.
+
+        Los criterios sobre atributos indexados se resuelven con los índices,
+        empezando por el grupo más pequeño; los demás se verifican uno a uno.
+
+        Parámetros:
+            clase (type): clase buscada (incluye subclases)
+            **criterios: atributo=valor
+
+        Returns:
+            list: animales que cumplen
+        """
+        concretas = set(self._concretas.get(clase, ()))
+        if not concretas:
+            return []
+
+        grupos = []
+        restantes = {}
+        for atributo, valor in criterios.items():
+            if atributo in self._indices:
+                grupos.append(self._indices[atributo].get(valor, {}))
+            else:
+                restantes[atributo] = valor
+
+        if grupos:
+            grupos.sort(key=len)
+            candidatos = (
+                animal for clave, animal in grupos[0].items()
+                if all(clave in grupo for grupo in grupos[1:])
+            )
+            candidatos = (animal for animal in candidatos if type(animal) in concretas)
+        else:
+            candidatos = self.de_tipo(clase)
+
+        return [
+            animal for animal in candidatos
+            if all(getattr(animal, atributo, _AUSENTE) == valor
+                   for atributo, valor in restantes.items())
+        ]
@@ -0,0 +1,365 @@
+"""
+SIMULACIÓN DE ESCENARIOS DE NÓMINA ("¿qué pasaría si...?")
+==========================================================
+
+Para comparar escenarios (un aumento del 5% a tiempo completo, horas extra
+a 1.75 en lugar de 1.5, otra comisión) habría que modificar los objetos y
+volver a calcular la nómina en cada uno. SimuladorEscenarios trabaja sobre
+una FOTO por columnas de los empleados (NominaColumnar) y nunca toca los
+objetos:
+
+    Escenario("aumento TC 5%", {
+        (EmpleadoTiempoCompleto, "salario_mensual"): Factor(1.05),
+        (EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): 1.75,
+        (EmpleadoPorComision, "porcentaje_comision"): 0.10,
+    })
+
+Cada cambio se refiere a una clase con fórmula (ver nomina_columnar) y a:
+- una COLUMNA: un número la reemplaza para todos; Factor(x) la multiplica
+  (redondeando cada valor a la unidad de la columna: centavos, diezmilésimas
+  de hora o millonésimas)
+- un PARÁMETRO de la fórmula (PARAMETROS_TIPO, como RECARGO_HORAS_EXTRA):
+  un número lo reemplaza; Factor(x) multiplica el valor actual de la clase
+  (de forma exacta, con fracciones)
+
+Para evaluar muchos escenarios rápido:
+1. Las filas IGUALES de cada tabla se agrupan una sola vez (muchos
+   empleados comparten salario, tarifa u horas); la fórmula se evalúa por
+   fila distinta y se multiplica por cuántas veces aparece
+2. Las tablas que un escenario no cambia reutilizan el total base
+3. El total de cada tabla se guarda por conjunto de cambios: en una MATRIZ
+   de escenarios (matriz_escenarios) con 5 aumentos × 4 recargos × 5
+   comisiones = 100 escenarios, solo se evalúan 5 + 4 + 5 tablas
+4. Los empleados sin fórmula por columnas (subclases propias que redefinen
+   el cálculo o sus parámetros) conservan su salario actual en todos los
+   escenarios (se informan en "sin_escenario")
+
+Los totales son exactos (centavos enteros con las reglas de Dinero).
+
+Uso:
+    simulador = SimuladorEscenarios(sistema)
+    escenarios = matriz_escenarios({
+        (EmpleadoTiempoCompleto, "salario_mensual"): [Factor(1.03), Factor(1.05)],
+        (EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): [1.5, 1.75],
+    })
+    for resultado in simulador.evaluar_varios(escenarios):
+        print(resultado["nombre"], resultado["total"], resultado["diferencia"])
+
+Benchmark:
+    python -m clases_objetos.escenarios
+"""
+
+import itertools
+import operator
+import random
+import time
+from array import array
+from collections import Counter, namedtuple
+from fractions import Fraction
+from itertools import repeat
+
+from .dinero import Dinero, fraccion, redondear_columna
+from .empleados_polimorfismo import (
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+)
+from .nomina_columnar import COLUMNAS_TIPO, FORMULAS, PARAMETROS_TIPO, NominaColumnar, colocar
+
+
+# Un escenario: nombre y cambios {(clase, columna o parámetro): valor | Factor}
+Escenario = namedtuple("Escenario", "nombre cambios")
+
+# Multiplica una columna por `valor` (1.05 = aumento del 5%)
+Factor = namedtuple("Factor", "valor")
+
+
+class _ParametrosEscenario:
+    """Clase vista por la fórmula, con algunos parámetros reemplazados."""
+
+    def __init__(self, clase, parametros):
+        self._clase = clase
+        self._parametros = parametros
+
+    def __getattr__(self, nombre):
+        if nombre in self._parametros:
+            return self._parametros[nombre]
+        return getattr(self._clase, nombre)
+
+
+def matriz_escenarios(ejes, prefijo="escenario"):
+    """
+    Crea todas las combinaciones de varios cambios.
+
+    Parámetros:
+        ejes (dict): {(clase, columna o parámetro): [valores posibles]}
+        prefijo (str): inicio del nombre de cada escenario
+
+    Returns:
+        list: [Escenario], uno por combinación (producto cartesiano)
+    """
+    claves = list(ejes)
+    escenarios = []
+    for numero, valores in enumerate(itertools.product(*ejes.values()), 1):
+        cambios = dict(zip(claves, valores))
+        detalle = ", ".join(
+            f"{nombre}={valor.valor if isinstance(valor, Factor) else valor}"
+            for (_, nombre), valor in cambios.items()
+        )
+        escenarios.append(Escenario(f"{prefijo} {numero} ({detalle})", cambios))
+    return escenarios
+
+
+def _comprimir(tabla):
+    """
+    Agrupa las filas iguales de una tabla.
+
+    Returns:
+        tuple: (columnas de filas distintas, array("q") de repeticiones), o
+               (columnas originales, None) si casi no hay filas repetidas
+    """
+    nombres = list(tabla.columnas)
+    filas = Counter(zip(*tabla.columnas.values()))
+    if len(filas) > len(tabla) // 2:
+        return tabla.columnas, None
+    distintas = zip(*filas) if filas else ((),) * len(nombres)
+    columnas = {nombre: array("q", valores) for nombre, valores in zip(nombres, distintas)}
+    return columnas, array("q", filas.values())
+
+
+class SimuladorEscenarios:
+    """
+    Evalúa escenarios de nómina sobre una foto por columnas.
+
+    Atributos:
+        motor (NominaColumnar): foto de los empleados (no cambia)
+        base (dict): resultado sin cambios (ver evaluar())
+    """
+
+    def __init__(self, empleados):
+        """
+        Parámetros:
+            empleados (SistemaNomina | NominaColumnar | iterable): empleados a
+                simular; se copian sus datos de pago una sola vez
+        """
+        if isinstance(empleados, NominaColumnar):
+            self.motor = empleados
+        else:
+            self.motor = NominaColumnar(getattr(empleados, "empleados", empleados))
+        self._grupos = {clase: _comprimir(tabla) for clase, tabla in self.motor.tablas.items()}
+        # Los empleados sin fórmula no pueden simularse: su salario queda fijo
+        self._total_otros = sum(
+            Dinero(empleado.salario_actual()).centavos for _, empleado in self.motor.otros
+        )
+        self._totales_cache = {}  # (clase, cambios) -> total de la tabla en centavos
+        self._totales_base = {clase: self._total_tabla(clase, {}) for clase in self._grupos}
+        self.base = self._resultado("base", self._totales_base)
+
+    # ------------------------------------------------------------------
+    # Cálculo
+    # ------------------------------------------------------------------
+
+    def _cambios_por_clase(self, escenario):
+        """Valida los cambios y los agrupa: {clase: {nombre: valor}}."""
+        por_clase = {}
+        for (clase, nombre), valor in escenario.cambios.items():
+            if clase not in FORMULAS:
+                raise ValueError(
+                    f"{escenario.nombre}: {getattr(clase, '__name__', clase)} no tiene "
+                    "fórmula por columnas"
+                )
+            columnas = {columna for columna, _, _ in COLUMNAS_TIPO[clase]}
+            if nombre in PARAMETROS_TIPO.get(clase, ()):
+                if isinstance(valor, Factor):
+                    # La fórmula recibe el parámetro ya multiplicado
+                    valor = (Fraction(*fraccion(getattr(clase, nombre)))
+                             * Fraction(*fraccion(valor.valor)))
+                else:
+                    fraccion(valor)  # TypeError si no es un número
+            elif nombre not in columnas:
+                raise ValueError(f"{escenario.nombre}: {clase.__name__} no tiene '{nombre}'")
+            por_clase.setdefault(clase, {})[nombre] = valor
+        return por_clase
+
+    def _columnas(self, clase, columnas, cambios):
+        """Columnas de una tabla con los cambios de columna aplicados."""
+        if not cambios:
+            return columnas
+        convertidores = {nombre: convertir for nombre, _, convertir in COLUMNAS_TIPO[clase]}
+        resultado = dict(columnas)
+        for nombre, valor in cambios.items():
+            if nombre not in convertidores:
+                continue  # es un parámetro de la fórmula
+            columna = columnas[nombre]
+            if isinstance(valor, Factor):
+                numerador, denominador = fraccion(valor.valor)
+                resultado[nombre] = array("q", redondear_columna(
+                    map(operator.mul, columna, repeat(numerador)), denominador
+                ))
+            else:
+                entero = convertidores[nombre](valor)
+                if entero is None:
+                    raise ValueError(f"Valor fuera de escala para {nombre}: {valor}")
+                resultado[nombre] = array("q", [entero]) * len(columna)
+        return resultado
+
+    def _total_tabla(self, clase, cambios):
+        clave = (clase, frozenset(cambios.items()))
+        total = self._totales_cache.get(clave)
+        if total is None:
+            total = self._totales_cache[clave] = self._evaluar_tabla(clase, cambios)
+        return total
+
+    def _evaluar_tabla(self, clase, cambios):
+        columnas, conteos = self._grupos[clase]
+        columnas = self._columnas(clase, columnas, cambios)
+        parametros = {n: v for n, v in cambios.items() if n in PARAMETROS_TIPO.get(clase, ())}
+        vista = _ParametrosEscenario(clase, parametros) if parametros else clase
+        salarios = FORMULAS[clase](columnas, vista)
+        if conteos is None:
+            return sum(salarios)
+        return sum(map(operator.mul, salarios, conteos))
+
+    def _resultado(self, nombre, totales):
+        total = sum(totales.values()) + self._total_otros
+        resultado = {
+            "nombre": nombre,
+            "total": Dinero.de_centavos(total),
+            "por_tipo": {clase: Dinero.de_centavos(t) for clase, t in totales.items()},
+            "sin_escenario": len(self.motor.otros),
+        }
+        base = getattr(self, "base", None)
+        resultado["diferencia"] = (
+            Dinero(0) if base is None else Dinero.de_centavos(total - base["total"].centavos)
+        )
+        return resultado
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def evaluar(self, escenario):
+        """
+        Calcula la nómina de un escenario.
+
+        Parámetros:
+            escenario (Escenario): cambios a simular
+
+        Returns:
+            dict: {"nombre", "total" (Dinero), "diferencia" (contra la base),
+                   "por_tipo": {clase: Dinero}, "sin_escenario": empleados
+                   calculados con su salario actual}
+        """
+        por_clase = self._cambios_por_clase(escenario)
+        totales = {
+            clase: (self._total_tabla(clase, por_clase[clase]) if clase in por_clase
+                    else total_base)
+            for clase, total_base in self._totales_base.items()
+        }
+        return self._resultado(escenario.nombre, totales)
+
+    def evaluar_varios(self, escenarios):
+        """Evalúa varios escenarios (lista de resultados, en el mismo orden)."""
+        return [self.evaluar(escenario) for escenario in escenarios]
+
+    def salarios(self, escenario):
+        """
+        Salario de cada empleado en un escenario.
+
+        Returns:
+            array: centavos ("q") en el orden de inserción de los empleados
+        """
+        por_clase = self._cambios_por_clase(escenario)
+        salarios = array("q", bytes(8 * len(self.motor)))
+        for clase, tabla in self.motor.tablas.items():
+            cambios = por_clase.get(clase, {})
+            columnas = self._columnas(clase, tabla.columnas, cambios)
+            parametros = {n: v for n, v in cambios.items() if n in PARAMETROS_TIPO.get(clase, ())}
+            vista = _ParametrosEscenario(clase, parametros) if parametros else clase
+            colocar(salarios, tabla.posiciones, array("q", FORMULAS[clase](columnas, vista)))
+        for posicion, empleado in self.motor.otros:
+            salarios[posicion] = Dinero(empleado.salario_actual()).centavos
+        return salarios
+
+
+def poblacion_sintetica(cantidad, semilla=0):
+    """
+    Crea una foto por columnas con datos aleatorios (sin objetos Empleado).
+
+    Los salarios, tarifas y horas salen de escalas con valores repetidos,
+    como en una nómina real; las ventas de cada vendedor son distintas.
+    """
+    azar = random.Random(semilla)
+    motor = NominaColumnar()
+    salarios = [2_000 + 50 * i for i in range(80)]
+    tarifas = [15 + 0.5 * i for i in range(50)]
+    for numero in range(cantidad):
+        tipo = numero % 4
+        if tipo == 0:
+            motor.agregar_fila(EmpleadoTiempoCompleto, (azar.choice(salarios),))
+        elif tipo == 1:
+            motor.agregar_fila(EmpleadoPorHoras, (azar.randrange(80, 181), azar.randrange(0, 21),
+                                                  azar.choice(tarifas)))
+        elif tipo == 2:
+            motor.agregar_fila(EmpleadoPorComision, (1_000, 0.08, azar.randrange(0, 5_000_000) / 100))
+        else:
+            motor.agregar_fila(EmpleadoFreelance, (azar.randrange(10, 200) * 50,))
+    return motor
+
+
+def medir(cantidad=1_000_000, cantidad_distintos=10, semilla=0):
+    """
+    Mide la evaluación de escenarios sobre una población sintética.
+
+    Parámetros:
+        cantidad (int): número de empleados
+        cantidad_distintos (int): escenarios sin cambios en común a medir
+        semilla (int): semilla de los datos aleatorios
+
+    Returns:
+        dict: {"preparar", "matriz", "distintos" (segundos),
+               "escenarios_matriz", "escenarios_distintos"}
+    """
+    motor = poblacion_sintetica(cantidad, semilla)
+    # Matriz 5 × 4 × 5 = 100 escenarios
+    matriz = matriz_escenarios({
+        (EmpleadoTiempoCompleto, "salario_mensual"): [Factor(1 + i / 100) for i in range(5)],
+        (EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): [1.5, 1.75, 2, 2.5],
+        (EmpleadoPorComision, "porcentaje_comision"): [0.06, 0.08, 0.1, 0.12, 0.15],
+    })
+    inicio = time.perf_counter()
+    simulador = SimuladorEscenarios(motor)
+    preparar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    simulador.evaluar_varios(matriz)
+    evaluar_matriz = time.perf_counter() - inicio
+
+    # Escenarios sin cambios en común (peor caso: cada tabla se evalúa)
+    distintos = [
+        Escenario(f"distinto {i}", {
+            (EmpleadoTiempoCompleto, "salario_mensual"): Factor(1.2 + i / 1000),
+            (EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): 3 + i / 100,
+            (EmpleadoPorComision, "porcentaje_comision"): (20 + i) / 1000,
+        })
+        for i in range(cantidad_distintos)
+    ]
+    inicio = time.perf_counter()
+    simulador.evaluar_varios(distintos)
+    evaluar_distintos = time.perf_counter() - inicio
+    return {
+        "preparar": preparar,
+        "matriz": evaluar_matriz,
+        "escenarios_matriz": len(matriz),
+        "distintos": evaluar_distintos,
+        "escenarios_distintos": cantidad_distintos,
+    }
+
+
+if __name__ == "__main__":
+    tiempos = medir()
+    print(f"Preparar la foto comprimida (1,000,000 empleados): {tiempos['preparar']:.3f} s")
+    print(f"Matriz de {tiempos['escenarios_matriz']} escenarios: {tiempos['matriz']:.3f} s")
+    print(f"{tiempos['escenarios_distintos']} escenarios sin cambios en común:"
+          f" {tiempos['distintos']:.3f} s")
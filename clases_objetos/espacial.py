@@ -0,0 +1,330 @@
+"""
+POSICIONES E ÍNDICE ESPACIAL PARA ANIMALES
+==========================================
+
+Mamifero.moverse() y Oviparo.moverse() solo devuelven un texto. Este módulo
+les da una posición real (x, y, z) en metros y una velocidad que depende del
+tipo de animal:
+
+- Mamífero: según numero_patas (4 patas corre, 2 patas camina erguido)
+- Ovíparo que puede volar: vuela rápido y puede subir hasta altura_vuelo_max
+- Pingüino: nada a velocidad_nado (km/h)
+- Otros: velocidad base
+
+ÍNDICE ESPACIAL (rejilla uniforme):
+El plano (x, y) se divide en celdas cuadradas. Cada celda guarda los animales
+que están en ella. Al mover un animal solo se actualiza el índice si cambió
+de celda, así que mover es O(1). Para "animales a distancia r" solo se
+revisan las celdas que toca el círculo, y para el vecino más cercano se
+buscan anillos de celdas alrededor del punto.
+
+La altura (z) se usa en las distancias 3D pero no en la rejilla: casi todos
+los animales están en el suelo y las aves ocupan una franja delgada.
+"""
+
+import math
+import random
+from array import array
+
+from .animales_herencia import Mamifero, Oviparo
+
+
+# Velocidades en metros por segundo
+VELOCIDAD_CUADRUPEDO = 3.0
+VELOCIDAD_BIPEDO = 1.5
+VELOCIDAD_VUELO = 15.0
+VELOCIDAD_TIERRA = 0.5
+VELOCIDAD_BASE = 1.0
+
+
+def velocidad(animal):
+    """
+    Calcula la velocidad de desplazamiento de un animal (m/s).
+
+    Parámetros:
+        animal (Animal): animal de cualquier clase de la jerarquía
+
+    Returns:
+        float: velocidad en metros por segundo
+    """
+    if isinstance(animal, Mamifero):
+        if animal.numero_patas == 4:
+            return VELOCIDAD_CUADRUPEDO
+        if animal.numero_patas == 2:
+            return VELOCIDAD_BIPEDO
+        return VELOCIDAD_TIERRA
+    if isinstance(animal, Oviparo):
+        if animal.puede_volar:
+            return VELOCIDAD_VUELO
+        velocidad_nado = getattr(animal, "velocidad_nado", None)
+        if velocidad_nado is not None:
+            return velocidad_nado / 3.6  # km/h -> m/s
+        return VELOCIDAD_TIERRA
+    return VELOCIDAD_BASE
+
+
+def altura_maxima(animal):
+    """
+    Retorna la altura máxima que puede alcanzar un animal (metros).
+
+    Solo los ovíparos que pueden volar se despegan del suelo.
+    """
+    if isinstance(animal, Oviparo) and animal.puede_volar:
+        return float(getattr(animal, "altura_vuelo_max", 100))
+    return 0.0
+
+
+class MundoAnimales:
+    """
+    Posiciones de animales con un índice espacial de rejilla uniforme.
+
+    Cada animal se identifica por el índice que devuelve agregar().
+    """
+
+    def __init__(self, tamano_celda=50.0):
+        """
+        Constructor del mundo.
+
+        Parámetros:
+            tamano_celda (float): lado de cada celda de la rejilla (metros).
+                                  Conviene que sea del orden del radio de las
+                                  consultas más frecuentes.
+        """
+        self.tamano_celda = tamano_celda
+        self.animales = []
+        self.x = array("d")
+        self.y = array("d")
+        self.z = array("d")
+        self.velocidades = array("d")
+        self.alturas_max = array("d")
+        self._celda = []     # celda actual de cada animal
+        self._rejilla = {}   # (cx, cy) -> set de índices
+
+    def __len__(self):
+        return len(self.animales)
+
+    def _celda_de(self, x, y):
+        lado = self.tamano_celda
+        return (math.floor(x / lado), math.floor(y / lado))
+
+    def agregar(self, animal, x, y, z=0.0):
+        """
+        Agrega un animal en una posición.
+
+        Parámetros:
+            animal (Animal): animal a ubicar
+            x, y (float): posición en el plano (metros)
+            z (float): altura (metros), limitada a la altura máxima del animal
+
+        Returns:
+            int: índice del animal en el mundo
+        """
+        indice = len(self.animales)
+        altura = altura_maxima(animal)
+        self.animales.append(animal)
+        self.x.append(x)
+        self.y.append(y)
+        self.z.append(min(max(z, 0.0), altura))
+        self.velocidades.append(velocidad(animal))
+        self.alturas_max.append(altura)
+        celda = self._celda_de(x, y)
+        self._celda.append(celda)
+        self._rejilla.setdefault(celda, set()).add(indice)
+        return indice
+
+    def posicion(self, indice):
+        """Retorna la posición (x, y, z) de un animal."""
+        return (self.x[indice], self.y[indice], self.z[indice])
+
+    def ubicar(self, indice, x, y, z=None):
+        """
+        Cambia la posición de un animal, actualizando el índice si cambia de celda.
+
+        Parámetros:
+            indice (int): índice del animal
+            x, y (float): nueva posición en el plano
+            z (float): nueva altura (None = conservar la actual)
+        """
+        self.x[indice] = x
+        self.y[indice] = y
+        if z is not None:
+            self.z[indice] = min(max(z, 0.0), self.alturas_max[indice])
+        lado = self.tamano_celda
+        celda = (math.floor(x / lado), math.floor(y / lado))
+        anterior = self._celda[indice]
+        if celda != anterior:
+            grupo = self._rejilla[anterior]
+            grupo.discard(indice)
+            if not grupo:
+                del self._rejilla[anterior]
+            self._rejilla.setdefault(celda, set()).add(indice)
+            self._celda[indice] = celda
+
+    def moverse(self, indice, segundos, aleatorio=random):
+        """
+        Mueve un animal en una dirección al azar durante un tiempo.
+
+        La distancia recorrida depende de su velocidad; los animales que vuelan
+        además cambian de altura dentro de su rango.
+
+        Parámetros:
+            indice (int): índice del animal
+            segundos (float): tiempo de desplazamiento
+            aleatorio (random.Random): generador a usar (default: módulo random)
+
+        Returns:
+            str: el texto de animal.moverse(), como el método original
+        """
+        distancia = self.velocidades[indice] * segundos
+        angulo = aleatorio.random() * 2 * math.pi
+        x = self.x[indice] + distancia * math.cos(angulo)
+        y = self.y[indice] + distancia * math.sin(angulo)
+        z = None
+        if self.alturas_max[indice]:
+            z = self.z[indice] + (aleatorio.random() * 2 - 1) * distancia
+        self.ubicar(indice, x, y, z)
+        return self.animales[indice].moverse()
+
+    def mover_todos(self, segundos, aleatorio=random):
+        """
+        Mueve todos los animales una vez (un paso de simulación).
+
+        Parámetros:
+            segundos (float): duración del paso
+            aleatorio (random.Random): generador a usar (default: módulo random)
+        """
+        xs, ys, zs = self.x, self.y, self.z
+        velocidades, alturas = self.velocidades, self.alturas_max
+        celdas, rejilla = self._celda, self._rejilla
+        lado = self.tamano_celda
+        azar = aleatorio.random
+        coseno, seno, piso, dos_pi = math.cos, math.sin, math.floor, 2 * math.pi
+
+        for indice in range(len(xs)):
+            distancia = velocidades[indice] * segundos
+            angulo = azar() * dos_pi
+            x = xs[indice] = xs[indice] + distancia * coseno(angulo)
+            y = ys[indice] = ys[indice] + distancia * seno(angulo)
+            altura = alturas[indice]
+            if altura:
+                z = zs[indice] + (azar() * 2 - 1) * distancia
+                zs[indice] = min(max(z, 0.0), altura)
+            celda = (piso(x / lado), piso(y / lado))
+            anterior = celdas[indice]
+            if celda != anterior:
+                grupo = rejilla[anterior]
+                grupo.discard(indice)
+                if not grupo:
+                    del rejilla[anterior]
+                grupo = rejilla.get(celda)
+                if grupo is None:
+                    grupo = rejilla[celda] = set()
+                grupo.add(indice)
+                celdas[indice] = celda
+
+    def en_radio(self, x, y, radio, z=None):
+        """
+        Busca los animales a una distancia menor o igual que radio.
+
+        Parámetros:
+            x, y (float): centro de la búsqueda
+            radio (float): distancia máxima (metros)
+            z (float): altura del centro; si se indica, la distancia es 3D
+
+        Returns:
+            list: índices de los animales encontrados
+        """
+        lado = self.tamano_celda
+        cx_min, cy_min = math.floor((x - radio) / lado), math.floor((y - radio) / lado)
+        cx_max, cy_max = math.floor((x + radio) / lado), math.floor((y + radio) / lado)
+        xs, ys, zs = self.x, self.y, self.z
+        radio2 = radio * radio
+        encontrados = []
+
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
+                grupo = self._rejilla.get((cx, cy))
+                if not grupo:
+                    continue
+                for indice in grupo:
+                    dx = xs[indice] - x
+                    dy = ys[indice] - y
+                    d2 = dx * dx + dy * dy
+                    if z is not None:
+                        dz = zs[indice] - z
+                        d2 += dz * dz
+                    if d2 <= radio2:
+                        encontrados.append(indice)
+        return encontrados
+
+    def vecino_mas_cercano(self, x, y, z=None, excluir=None):
+        """
+        Busca el animal más cercano a un punto.
+
+        Recorre anillos de celdas alrededor del punto y se detiene cuando el
+        siguiente anillo ya no puede contener nada más cerca.
+
+        Parámetros:
+            x, y (float): punto de consulta
+            z (float): altura del punto; si se indica, la distancia es 3D
+            excluir (int): índice a ignorar (por ejemplo, el propio animal)
+
+        Returns:
+            tuple: (índice, distancia), o (None, inf) si el mundo está vacío
+        """
+        if not self._rejilla or (len(self.animales) == 1 and excluir == 0):
+            return None, math.inf
+
+        lado = self.tamano_celda
+        cx0, cy0 = self._celda_de(x, y)
+        xs, ys, zs = self.x, self.y, self.z
+        mejor, mejor_d2 = None, math.inf
+        anillo = 0
+        anillo_maximo = None
+
+        while True:
+            for cx, cy in _celdas_anillo(cx0, cy0, anillo):
+                grupo = self._rejilla.get((cx, cy))
+                if not grupo:
+                    continue
+                for indice in grupo:
+                    if indice == excluir:
+                        continue
+                    dx = xs[indice] - x
+                    dy = ys[indice] - y
+                    d2 = dx * dx + dy * dy
+                    if z is not None:
+                        dz = zs[indice] - z
+                        d2 += dz * dz
+                    if d2 < mejor_d2:
+                        mejor, mejor_d2 = indice, d2
+            # Todo punto fuera de los anillos revisados está al menos a
+            # anillo * lado de distancia en el plano
+            alcance = anillo * lado
+            if mejor is not None and alcance * alcance >= mejor_d2:
+                return mejor, math.sqrt(mejor_d2)
+            anillo += 1
+            if mejor is None:
+                if anillo_maximo is None:
+                    anillo_maximo = self._anillo_maximo(cx0, cy0)
+                if anillo > anillo_maximo:
+                    return None, math.inf
+
+    def _anillo_maximo(self, cx0, cy0):
+        """Distancia en celdas hasta la celda ocupada más lejana."""
+        return max(
+            max(abs(cx - cx0), abs(cy - cy0)) for cx, cy in self._rejilla
+        )
+
+
+def _celdas_anillo(cx, cy, anillo):
+    """Genera las celdas del borde de un cuadrado de radio `anillo` celdas."""
+    if anillo == 0:
+        yield (cx, cy)
+        return
+    for dx in range(-anillo, anillo + 1):
+        yield (cx + dx, cy - anillo)
+        yield (cx + dx, cy + anillo)
+    for dy in range(-anillo + 1, anillo):
+        yield (cx - anillo, cy + dy)
+        yield (cx + anillo, cy + dy)
@@ -0,0 +1,324 @@
+"""
+ESTADÍSTICAS POR ESPECIE Y POR ATRIBUTO (group-by)
+==================================================
+
+Reportes como "peso promedio por especie", "distribución de edades de
+Mamifero y Oviparo" o "cantidad por estado" suelen escribirse como ciclos
+sobre los objetos. EstadisticasAnimales copia UNA vez los valores numéricos
+a columnas (arreglos del módulo array) y mantiene los grupos:
+
+    por="clase"  -> cada clase del MRO: Perro, Mamifero, Animal, ...
+    por="raza"   -> cada valor del atributo (los animales sin él no cuentan)
+
+Para cada agrupación pedida se guardan las posiciones de cada grupo y, para
+cada columna numérica, la cantidad y la suma de sus valores. Al agregar un
+animal se actualizan solo los grupos a los que pertenece, así que contar()
+y media() no recorren la colección. Las sumas son EXACTAS (sumas parciales
+sin error, como math.fsum), así que no dependen del orden en que llegaron
+los animales ni de si el grupo se armó de una vez o animal por animal. Los
+percentiles e histogramas ordenan los valores de cada grupo una vez; cuando
+el grupo crece solo se ordenan los valores nuevos y se mezclan.
+
+Los valores se toman al agregar el animal (o al pedir la columna por primera
+vez); si un animal cambia después, sus estadísticas no se actualizan.
+
+Uso:
+    estadisticas = EstadisticasAnimales(animales)
+    estadisticas.media("peso")                       # {Perro: ..., Mamifero: ...}
+    estadisticas.contar(por="estado")                # {"vivo": ..., "muerto": ...}
+    estadisticas.percentil("edad", 90, por="raza")
+    estadisticas.histograma("edad", (0, 2, 5, 10, 20), por="clase")
+"""
+
+import bisect
+import math
+from array import array
+
+
+# Columnas numéricas creadas por defecto
+NUMERICOS_POR_DEFECTO = ("edad", "peso")
+
+# Agrupación por clase (incluye todas las clases del MRO menos object)
+POR_CLASE = "clase"
+
+# Marca para los animales que no tienen el atributo de agrupación
+_AUSENTE = object()
+
+
+def _claves(animal, por):
+    """Grupos a los que pertenece un animal en una agrupación."""
+    if por == POR_CLASE:
+        return type(animal).__mro__[:-1]
+    valor = getattr(animal, por, _AUSENTE)
+    return () if valor is _AUSENTE else (valor,)
+
+
+def _numero(animal, atributo):
+    """Valor numérico de un atributo (NaN si el animal no lo tiene)."""
+    valor = getattr(animal, atributo, None)
+    return math.nan if valor is None else float(valor)
+
+
+def _acumular(parciales, valor):
+    """
+    Suma un valor a una suma exacta guardada como parciales sin error
+    (algoritmo de Shewchuk, el mismo de math.fsum).
+
+    math.fsum(parciales) da la suma redondeada una sola vez.
+    """
+    if not math.isfinite(valor) or (parciales and not math.isfinite(parciales[-1])):
+        parciales[:] = [sum(parciales) + valor]  # inf / nan: sin parciales
+        return
+    i = 0
+    for otro in parciales:
+        if abs(valor) < abs(otro):
+            valor, otro = otro, valor
+        alto = valor + otro
+        bajo = otro - (alto - valor)
+        if bajo:
+            parciales[i] = bajo
+            i += 1
+        valor = alto
+    parciales[i:] = [valor]
+
+
+def _percentil_ordenado(ordenados, porcentaje):
+    """Percentil con interpolación lineal sobre valores ya ordenados."""
+    posicion = (len(ordenados) - 1) * porcentaje / 100
+    abajo = math.floor(posicion)
+    arriba = min(abajo + 1, len(ordenados) - 1)
+    fraccion = posicion - abajo
+    return ordenados[abajo] + (ordenados[arriba] - ordenados[abajo]) * fraccion
+
+
+class EstadisticasAnimales:
+    """
+    Estadísticas agrupadas de una colección de animales.
+
+    Atributos:
+        animales (list): animales agregados, en orden
+        columnas (dict): {atributo: array("d")} con un valor por animal
+                         (NaN si el animal no tiene ese atributo)
+    """
+
+    def __init__(self, animales=(), numericos=NUMERICOS_POR_DEFECTO):
+        """
+        Constructor de las estadísticas.
+
+        Parámetros:
+            animales (iterable): animales iniciales
+            numericos (tuple): atributos numéricos a copiar en columnas
+        """
+        self.animales = []
+        self.columnas = {atributo: array("d") for atributo in numericos}
+        self._grupos = {}      # por -> {clave: array("I") de posiciones}
+        self._sumas = {}       # (por, atributo) -> {clave: [cantidad, parciales]}
+        self._ordenados = {}   # (por, atributo, clave) -> (tamaño del grupo, valores)
+        for animal in animales:
+            self.agregar(animal)
+
+    def __len__(self):
+        return len(self.animales)
+
+    def agregar(self, animal):
+        """
+        Agrega un animal y actualiza las columnas y los grupos existentes.
+
+        Parámetros:
+            animal (Animal): animal a agregar
+        """
+        posicion = len(self.animales)
+        self.animales.append(animal)
+        for atributo, columna in self.columnas.items():
+            columna.append(_numero(animal, atributo))
+
+        for por, grupos in self._grupos.items():
+            for clave in _claves(animal, por):
+                grupo = grupos.get(clave)
+                if grupo is None:
+                    grupo = grupos[clave] = array("I")
+                grupo.append(posicion)
+
+        for (por, atributo), sumas in self._sumas.items():
+            valor = self.columnas[atributo][posicion]
+            if valor != valor:  # NaN: el animal no tiene el atributo
+                continue
+            for clave in _claves(animal, por):
+                acumulado = sumas.get(clave)
+                if acumulado is None:
+                    sumas[clave] = [1, [valor]]
+                else:
+                    acumulado[0] += 1
+                    _acumular(acumulado[1], valor)
+
+    def agregar_varios(self, animales):
+        """Agrega varios animales."""
+        for animal in animales:
+            self.agregar(animal)
+
+    # ------------------------------------------------------------------
+    # Construcción perezosa de columnas y grupos
+    # ------------------------------------------------------------------
+
+    def _columna(self, atributo):
+        columna = self.columnas.get(atributo)
+        if columna is None:
+            columna = array("d", (_numero(animal, atributo) for animal in self.animales))
+            self.columnas[atributo] = columna
+        return columna
+
+    def _agrupacion(self, por):
+        grupos = self._grupos.get(por)
+        if grupos is None:
+            grupos = self._grupos[por] = {}
+            for posicion, animal in enumerate(self.animales):
+                for clave in _claves(animal, por):
+                    grupo = grupos.get(clave)
+                    if grupo is None:
+                        grupo = grupos[clave] = array("I")
+                    grupo.append(posicion)
+        return grupos
+
+    def _sumas_de(self, atributo, por):
+        sumas = self._sumas.get((por, atributo))
+        if sumas is None:
+            columna = self._columna(atributo)
+            sumas = {}
+            for clave, grupo in self._agrupacion(por).items():
+                cantidad = 0
+                parciales = []
+                for valor in (columna[i] for i in grupo):
+                    if valor == valor:
+                        cantidad += 1
+                        _acumular(parciales, valor)
+                if cantidad:
+                    sumas[clave] = [cantidad, parciales]
+            self._sumas[(por, atributo)] = sumas
+        return sumas
+
+    def _valores_ordenados(self, atributo, por, clave, grupo):
+        llave = (por, atributo, clave)
+        guardado = self._ordenados.get(llave)
+        if guardado is not None and guardado[0] == len(grupo):
+            return guardado[1]
+        columna = self._columna(atributo)
+        if guardado is None:
+            valores = sorted(v for v in (columna[i] for i in grupo) if v == v)
+        else:
+            # Los grupos solo crecen al final: se ordenan los valores nuevos
+            # y sort() mezcla las dos partes ya ordenadas en tiempo lineal
+            valores = guardado[1]
+            nuevos = [columna[i] for i in grupo[guardado[0]:]]
+            valores.extend(sorted(v for v in nuevos if v == v))
+            valores.sort()
+        self._ordenados[llave] = (len(grupo), valores)
+        return valores
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def contar(self, por=POR_CLASE):
+        """
+        Cuenta los animales de cada grupo.
+
+        Parámetros:
+            por (str): "clase" o el nombre de un atributo (estado, raza, ...)
+
+        Returns:
+            dict: {clave: cantidad}
+        """
+        return {clave: len(grupo) for clave, grupo in self._agrupacion(por).items()}
+
+    def media(self, atributo, por=POR_CLASE):
+        """
+        Calcula el promedio de un atributo numérico en cada grupo.
+
+        Los animales sin el atributo no se consideran.
+
+        Parámetros:
+            atributo (str): atributo numérico (edad, peso, ...)
+            por (str): "clase" o el nombre de un atributo
+
+        Returns:
+            dict: {clave: promedio}
+        """
+        return {
+            clave: math.fsum(parciales) / cantidad
+            for clave, (cantidad, parciales) in self._sumas_de(atributo, por).items()
+        }
+
+    def percentil(self, atributo, porcentaje, por=POR_CLASE):
+        """
+        Calcula un percentil de un atributo numérico en cada grupo.
+
+        Usa interpolación lineal entre los dos valores más cercanos.
+
+        Parámetros:
+            atributo (str): atributo numérico
+            porcentaje (float): entre 0 y 100 (50 = mediana)
+            por (str): "clase" o el nombre de un atributo
+
+        Returns:
+            dict: {clave: valor}
+        """
+        if not 0 <= porcentaje <= 100:
+            raise ValueError("El porcentaje debe estar entre 0 y 100")
+        resultado = {}
+        for clave, grupo in self._agrupacion(por).items():
+            ordenados = self._valores_ordenados(atributo, por, clave, grupo)
+            if ordenados:
+                resultado[clave] = _percentil_ordenado(ordenados, porcentaje)
+        return resultado
+
+    def histograma(self, atributo, limites, por=POR_CLASE):
+        """
+        Cuenta los valores de un atributo en intervalos, para cada grupo.
+
+        Los intervalos son [l0, l1), [l1, l2), ..., [ln-1, ln]; el último
+        incluye su límite superior. Los valores fuera de rango no se cuentan.
+
+        Parámetros:
+            atributo (str): atributo numérico
+            limites (sequence): límites crecientes de los intervalos
+            por (str): "clase" o el nombre de un atributo
+
+        Returns:
+            dict: {clave: [cantidad en cada intervalo]}
+        """
+        limites = list(limites)
+        if len(limites) < 2 or any(a >= b for a, b in zip(limites, limites[1:])):
+            raise ValueError("Los límites deben ser al menos dos y crecientes")
+        resultado = {}
+        for clave, grupo in self._agrupacion(por).items():
+            ordenados = self._valores_ordenados(atributo, por, clave, grupo)
+            cortes = [bisect.bisect_left(ordenados, limite) for limite in limites]
+            cortes[-1] = bisect.bisect_right(ordenados, limites[-1])
+            resultado[clave] = [b - a for a, b in zip(cortes, cortes[1:])]
+        return resultado
+
+    def resumen(self, atributo, por=POR_CLASE):
+        """
+        Retorna cantidad, promedio, mínimo, mediana y máximo por grupo.
+
+        Parámetros:
+            atributo (str): atributo numérico
+            por (str): "clase" o el nombre de un atributo
+
+        Returns:
+            dict: {clave: {"cantidad", "media", "minimo", "mediana", "maximo"}}
+        """
+        medias = self.media(atributo, por)
+        resultado = {}
+        for clave, grupo in self._agrupacion(por).items():
+            ordenados = self._valores_ordenados(atributo, por, clave, grupo)
+            if not ordenados:
+                continue
+            resultado[clave] = {
+                "cantidad": len(ordenados),
+                "media": medias[clave],
+                "minimo": ordenados[0],
+                "mediana": _percentil_ordenado(ordenados, 50),
+                "maximo": ordenados[-1],
+            }
+        return resultado
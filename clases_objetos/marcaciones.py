@@ -0,0 +1,255 @@
+"""
+CARGA MASIVA DE MARCACIONES PARA EMPLEADOS POR HORAS
+====================================================
+
+EmpleadoPorHoras.registrar_horas() suma horas una entrada a la vez e imprime
+un mensaje por cada una. Este módulo carga las marcaciones (entrada/salida)
+de un reloj de control desde un archivo, en streaming:
+
+    identificacion,entrada,salida
+    PH001,2024-03-04T08:00,2024-03-04T17:30
+    PH002,2024-03-04T22:00,2024-03-05T06:00
+
+o en JSON Lines:
+
+    {"identificacion": "PH001", "entrada": "2024-03-04T08:00", "salida": "2024-03-04T17:30"}
+
+1. Las marcaciones se leen línea por línea y se procesan en BLOQUES de
+   tamano_bloque registros
+2. Cada bloque acumula SEGUNDOS (enteros, exactos) por empleado y por día
+3. Al final, las horas de cada día por encima de limite_diario son horas
+   extra; las demás son normales
+4. Cada empleado recibe sus totales con registrar_horas_lote()
+
+La memoria depende de empleados × días del período, NO de la cantidad de
+marcaciones: 100 millones de marcaciones se procesan sin cargarlas todas.
+Un turno que cruza la medianoche cuenta para el día de su entrada. Las
+filas mal formadas (columnas o claves faltantes, JSON inválido) se cuentan
+como inválidas sin detener la carga.
+
+Las horas se redondean a diezmilésimas de hora (ESCALA_HORAS, la misma
+escala de NominaColumnar), así que la nómina por columnas puede usarlas sin
+recurrir al cálculo objeto por objeto.
+
+Cuando termina el período, EmpleadoPorHoras.cerrar_periodo() guarda las
+horas y el salario en su historial y empieza un período nuevo.
+
+Uso:
+    resumen = cargar_marcaciones(sistema, "marcaciones.csv")
+    resumen = cargar_marcaciones(sistema, "marzo.jsonl.gz", limite_diario=8)
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+import itertools
+import json
+from datetime import datetime
+
+from .dinero import redondear
+from .empleados_polimorfismo import EmpleadoPorHoras
+from .nomina_columnar import ESCALA_HORAS
+
+
+# Horas normales por día; lo que exceda es hora extra
+LIMITE_DIARIO = 8
+
+# Marcaciones procesadas por bloque
+TAMANO_BLOQUE = 10_000
+
+_SEGUNDOS_POR_HORA = 3600
+
+# Marcación que no se pudo leer: acumular_segundos() la cuenta como inválida
+_INVALIDA = (None, None, None)
+
+
+def _abrir(archivo):
+    """Abre una ruta (.gz se descomprime) o devuelve el objeto archivo tal cual."""
+    if not isinstance(archivo, str):
+        return archivo, False
+    if archivo.endswith(".gz"):
+        return gzip.open(archivo, "rt", encoding="utf-8", newline=""), True
+    return open(archivo, "r", encoding="utf-8", newline=""), True
+
+
+def _detectar_formato(archivo, formato):
+    if formato is not None:
+        return formato
+    nombre = archivo if isinstance(archivo, str) else getattr(archivo, "name", "")
+    if nombre.endswith(".gz"):
+        nombre = nombre[:-3]
+    if nombre.endswith((".jsonl", ".json")):
+        return "jsonl"
+    if nombre.endswith(".csv"):
+        return "csv"
+    raise ValueError("No se pudo deducir el formato: indique formato='csv' o 'jsonl'")
+
+
+def leer_marcaciones(archivo, formato=None):
+    """
+    Genera las marcaciones de un archivo, una a la vez.
+
+    Parámetros:
+        archivo (str | archivo de texto): ruta (.csv, .jsonl, opcionalmente .gz)
+                                          o archivo ya abierto
+        formato (str): "csv" o "jsonl" (default: según la extensión)
+
+    Yields:
+        tuple: (identificacion, entrada, salida) como (str, str, str), o
+               (None, None, None) por cada fila mal formada
+    """
+    formato = _detectar_formato(archivo, formato)
+    flujo, propio = _abrir(archivo)
+    try:
+        if formato == "csv":
+            lector = csv.reader(flujo)
+            encabezado = next(lector, None)
+            if encabezado is None:
+                return
+            columnas = [encabezado.index(c) for c in ("identificacion", "entrada", "salida")]
+            i_id, i_entrada, i_salida = columnas
+            for fila in lector:
+                if fila:
+                    try:
+                        marcacion = fila[i_id], fila[i_entrada], fila[i_salida]
+                    except IndexError:
+                        marcacion = _INVALIDA
+                    yield marcacion
+        elif formato == "jsonl":
+            for linea in flujo:
+                if linea.strip():
+                    try:
+                        registro = json.loads(linea)
+                        marcacion = (registro["identificacion"], registro["entrada"],
+                                     registro["salida"])
+                    except (IndexError, KeyError, ValueError, TypeError):
+                        marcacion = _INVALIDA
+                    yield marcacion
+        else:
+            raise ValueError(f"Formato no soportado: {formato}")
+    finally:
+        if propio:
+            flujo.close()
+
+
+def acumular_segundos(marcaciones, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Acumula los segundos trabajados por empleado y por día.
+
+    Parámetros:
+        marcaciones (iterable): (identificacion, entrada, salida) con fechas
+                                ISO 8601 (texto) o datetime
+        tamano_bloque (int): marcaciones procesadas por bloque
+
+    Returns:
+        tuple: ({(identificacion, fecha): segundos}, cantidad leída, inválidas)
+    """
+    por_dia = {}
+    leidas = invalidas = 0
+    iterador = iter(marcaciones)
+    convertir = datetime.fromisoformat
+
+    while True:
+        bloque = list(itertools.islice(iterador, tamano_bloque))
+        if not bloque:
+            break
+        leidas += len(bloque)
+        parcial = {}
+        for identificacion, entrada, salida in bloque:
+            try:
+                if isinstance(entrada, str):
+                    entrada = convertir(entrada)
+                if isinstance(salida, str):
+                    salida = convertir(salida)
+                segundos = int((salida - entrada).total_seconds())
+            except (TypeError, ValueError):
+                invalidas += 1
+                continue
+            if segundos <= 0:
+                invalidas += 1
+                continue
+            clave = (identificacion, entrada.date())
+            parcial[clave] = parcial.get(clave, 0) + segundos
+        for clave, segundos in parcial.items():
+            por_dia[clave] = por_dia.get(clave, 0) + segundos
+    return por_dia, leidas, invalidas
+
+
+def separar_horas_extra(por_dia, limite_diario=LIMITE_DIARIO):
+    """
+    Separa horas normales y extra por empleado a partir de los segundos diarios.
+
+    Returns:
+        dict: {identificacion: (horas_normales, horas_extra)}, redondeadas a
+              diezmilésimas de hora (ESCALA_HORAS)
+    """
+    limite = int(limite_diario * _SEGUNDOS_POR_HORA)
+    segundos = {}
+    for (identificacion, _), total in por_dia.items():
+        normales, extra = segundos.get(identificacion, (0, 0))
+        segundos[identificacion] = (
+            normales + min(total, limite),
+            extra + max(total - limite, 0),
+        )
+    # Una sola conversión por empleado: los segundos se suman como enteros
+    # exactos y se redondean una vez a la escala de NominaColumnar
+    return {
+        identificacion: (_a_horas(normales), _a_horas(extra))
+        for identificacion, (normales, extra) in segundos.items()
+    }
+
+
+def _a_horas(segundos):
+    """Segundos -> horas redondeadas a diezmilésimas (float decimal exacto)."""
+    return redondear(segundos * ESCALA_HORAS, _SEGUNDOS_POR_HORA) / ESCALA_HORAS
+
+
+def cargar_marcaciones(empleados, archivo, formato=None, limite_diario=LIMITE_DIARIO,
+                       tamano_bloque=TAMANO_BLOQUE):
+    """
+    Carga un archivo de marcaciones y suma las horas a los empleados por horas.
+
+    Parámetros:
+        empleados (SistemaNomina | iterable): empleados destino; solo se usan
+                                              los EmpleadoPorHoras
+        archivo (str | archivo de texto): ver leer_marcaciones()
+        formato (str): "csv" o "jsonl" (default: según la extensión)
+        limite_diario (float): horas normales por día
+        tamano_bloque (int): marcaciones procesadas por bloque
+
+    Returns:
+        dict: {"marcaciones", "invalidas", "empleados", "desconocidos",
+               "horas_normales", "horas_extra"}
+    """
+    empleados = getattr(empleados, "empleados", empleados)
+    por_identificacion = {
+        e.identificacion: e for e in empleados if isinstance(e, EmpleadoPorHoras)
+    }
+    por_dia, leidas, invalidas = acumular_segundos(
+        leer_marcaciones(archivo, formato), tamano_bloque
+    )
+    horas = separar_horas_extra(por_dia, limite_diario)
+
+    desconocidos = []
+    total_normales = total_extra = 0
+    # registrar_horas_lote() imprime un mensaje por empleado: se descartan
+    with contextlib.redirect_stdout(io.StringIO()):
+        for identificacion, (normales, extra) in horas.items():
+            empleado = por_identificacion.get(identificacion)
+            if empleado is None:
+                desconocidos.append(identificacion)
+                continue
+            empleado.registrar_horas_lote(normales, extra)
+            total_normales += normales
+            total_extra += extra
+
+    return {
+        "marcaciones": leidas,
+        "invalidas": invalidas,
+        "empleados": len(horas) - len(desconocidos),
+        "desconocidos": sorted(desconocidos),
+        "horas_normales": total_normales,
+        "horas_extra": total_extra,
+    }
+
@@ -0,0 +1,421 @@
+"""
+MOTOR DE NÓMINA POR COLUMNAS
+============================
+
+SistemaNomina.calcular_nomina_total() llama a calcular_salario() empleado por
+empleado: una búsqueda de método y una llamada de Python por cada uno.
+
+NominaColumnar agrupa a los empleados por CLASE CONCRETA y guarda los datos
+de pago de cada grupo como columnas de enteros de 64 bits (array("q")):
+
+    EmpleadoTiempoCompleto:  salario_mensual
+    EmpleadoPorHoras:        horas_trabajadas | horas_extra | tarifa_por_hora
+    EmpleadoPorComision:     salario_base | porcentaje_comision | total_ventas
+    EmpleadoFreelance:       pago_completado
+
+Los montos se guardan en centavos (como Dinero) y las cantidades decimales
+escaladas a enteros: horas en diezmilésimas, porcentajes en millonésimas.
+
+La fórmula de cada clase se evalúa sobre columnas enteras con map() y las
+funciones del módulo operator, que recorren los arreglos en C sin crear una
+llamada de Python por empleado. Se aplican las mismas reglas de redondeo
+que Dinero (dinero.redondear_columna), así que cada salario tiene
+exactamente los mismos centavos que el del objeto:
+
+    redondear(tarifa × horas) + redondear(tarifa × horas_extra × 1.5)
+
+Se calculan llamando al método de cada objeto:
+- Las subclases que redefinen algo de lo que lee la fórmula: los métodos
+  de METODOS_TIPO (calcular_salario(), calcular_comision()...), los
+  parámetros de PARAMETROS_TIPO o los atributos de las columnas
+- Los empleados con cantidades que no caben en la escala (por ejemplo,
+  1/3 de hora no tiene una cantidad exacta de diezmilésimas)
+
+Uso:
+    motor = NominaColumnar.desde_sistema(sistema)
+    centavos = motor.calcular_salarios()   # array("q"), en orden de inserción
+    total = motor.total()                  # Dinero
+
+Benchmark:
+    python -m clases_objetos.nomina_columnar
+"""
+
+import functools
+import itertools
+import operator
+import time
+from array import array
+
+from .dinero import Dinero, escalar, fraccion, redondear_columna
+from .empleados_polimorfismo import (
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+)
+
+
+# Escalas de las cantidades decimales guardadas como enteros
+ESCALA_HORAS = 10_000           # diezmilésimas de hora
+ESCALA_PORCENTAJE = 1_000_000   # millonésimas
+
+
+def a_centavos(valor):
+    """Monto -> centavos enteros, con las reglas de Dinero."""
+    return Dinero(valor).centavos
+
+
+a_horas = functools.partial(escalar, escala=ESCALA_HORAS)
+a_porcentaje = functools.partial(escalar, escala=ESCALA_PORCENTAJE)
+
+
+def _porcentaje_fijo(empleado):
+    # Con comisión escalonada no hay porcentaje fijo: el empleado se calcula aparte
+    if getattr(empleado, "escala_comision", None) is not None:
+        return None
+    return empleado.porcentaje_comision
+
+
+def _pago_completado(empleado):
+    return empleado.proyectos.total_completado
+
+
+# Columnas de cada clase: (nombre, función que lee el valor del objeto,
+# función que lo convierte en entero o None si no cabe en la escala; si el
+# valor leído es None, el empleado no se puede calcular por columnas)
+COLUMNAS_TIPO = {
+    EmpleadoTiempoCompleto: (
+        ("salario_mensual", operator.attrgetter("salario_mensual"), a_centavos),
+    ),
+    EmpleadoPorHoras: (
+        ("horas_trabajadas", operator.attrgetter("horas_trabajadas"), a_horas),
+        ("horas_extra", operator.attrgetter("horas_extra"), a_horas),
+        ("tarifa_por_hora", operator.attrgetter("tarifa_por_hora"), a_centavos),
+    ),
+    EmpleadoPorComision: (
+        ("salario_base", operator.attrgetter("salario_base"), a_centavos),
+        ("porcentaje_comision", _porcentaje_fijo, a_porcentaje),
+        ("total_ventas", operator.methodcaller("calcular_total_ventas"), a_centavos),
+    ),
+    EmpleadoFreelance: (
+        ("pago_completado", _pago_completado, a_centavos),
+    ),
+}
+
+# Atributos de clase que usan las fórmulas; una subclase que los cambia
+# no puede usar la fórmula de su clase base
+PARAMETROS_TIPO = {
+    EmpleadoPorHoras: ("RECARGO_HORAS_EXTRA",),
+}
+
+# Métodos que reemplaza la fórmula de cada clase (además de los que leen
+# las columnas); una subclase que redefine alguno se calcula con sus objetos
+METODOS_TIPO = {
+    EmpleadoTiempoCompleto: ("salario_actual", "calcular_salario"),
+    EmpleadoPorHoras: ("salario_actual", "calcular_salario"),
+    EmpleadoPorComision: ("salario_actual", "calcular_salario", "calcular_comision",
+                          "calcular_total_ventas"),
+    EmpleadoFreelance: ("salario_actual", "calcular_salario"),
+}
+
+# Atributos de instancia que leen las columnas: una subclase que los
+# convierte en propiedades (o atributos de clase) tampoco usa la fórmula
+ATRIBUTOS_TIPO = {
+    EmpleadoTiempoCompleto: ("salario_mensual",),
+    EmpleadoPorHoras: ("horas_trabajadas", "horas_extra", "tarifa_por_hora"),
+    EmpleadoPorComision: ("salario_base", "porcentaje_comision", "escala_comision", "ventas"),
+    EmpleadoFreelance: ("proyectos",),
+}
+
+
+def _salario_tiempo_completo(c, clase):
+    return c["salario_mensual"]
+
+
+def _salario_por_horas(c, clase):
+    # redondear(tarifa × horas) + redondear(tarifa × horas_extra × recargo)
+    tarifa = c["tarifa_por_hora"]
+    normal = redondear_columna(map(operator.mul, c["horas_trabajadas"], tarifa), ESCALA_HORAS)
+    recargo, divisor = fraccion(clase.RECARGO_HORAS_EXTRA)
+    extra = redondear_columna(
+        map(operator.mul, map(operator.mul, c["horas_extra"], tarifa), itertools.repeat(recargo)),
+        ESCALA_HORAS * divisor,
+    )
+    return map(operator.add, normal, extra)
+
+
+def _salario_por_comision(c, clase):
+    # salario_base + redondear(total_ventas × porcentaje_comision)
+    comision = redondear_columna(
+        map(operator.mul, c["total_ventas"], c["porcentaje_comision"]), ESCALA_PORCENTAJE
+    )
+    return map(operator.add, c["salario_base"], comision)
+
+
+def _salario_freelance(c, clase):
+    return c["pago_completado"]
+
+
+# Fórmula de cada clase: f(columnas, clase) -> iterable de salarios en centavos
+FORMULAS = {
+    EmpleadoTiempoCompleto: _salario_tiempo_completo,
+    EmpleadoPorHoras: _salario_por_horas,
+    EmpleadoPorComision: _salario_por_comision,
+    EmpleadoFreelance: _salario_freelance,
+}
+
+
+def clase_con_formula(clase):
+    """
+    Retorna la clase de FORMULAS cuya fórmula vale para `clase`, o None.
+
+    Una subclase hereda la fórmula solo si todo lo que lee la fórmula
+    (METODOS_TIPO, PARAMETROS_TIPO y ATRIBUTOS_TIPO) es igual que en la
+    clase base.
+    """
+    for base in clase.__mro__:
+        if base in FORMULAS:
+            nombres = itertools.chain(METODOS_TIPO[base], PARAMETROS_TIPO.get(base, ()),
+                                      ATRIBUTOS_TIPO[base])
+            for nombre in nombres:
+                if getattr(clase, nombre, None) != getattr(base, nombre, None):
+                    return None
+            return base
+    return None
+
+
+def colocar(destino, posiciones, valores):
+    """
+    Escribe valores[i] en destino[posiciones[i]].
+
+    Las posiciones de cada grupo son crecientes: si el primero y el último
+    están a la distancia justa, el grupo es un bloque contiguo y se copia
+    de una vez.
+    """
+    if not posiciones:
+        return
+    inicio = posiciones[0]
+    if posiciones[-1] - inicio == len(posiciones) - 1:
+        destino[inicio:inicio + len(posiciones)] = valores
+        return
+    for posicion, valor in zip(posiciones, valores):
+        destino[posicion] = valor
+
+
+class ColumnasTipo:
+    """
+    Columnas de los empleados de una clase dentro del motor.
+
+    Atributos:
+        clase (type): clase cuya fórmula se aplica
+        posiciones (array): posición de cada fila en el orden de inserción
+        columnas (dict): {nombre: array("q")} en centavos o cantidades escaladas
+    """
+
+    def __init__(self, clase):
+        self.clase = clase
+        self.extractores = COLUMNAS_TIPO[clase]
+        self.posiciones = array("Q")
+        self.columnas = {nombre: array("q") for nombre, _, _ in self.extractores}
+
+    def __len__(self):
+        return len(self.posiciones)
+
+    def agregar(self, posicion, empleado):
+        """
+        Copia los datos de pago de un empleado a las columnas.
+
+        Returns:
+            bool: False si algún valor no cabe en su escala (no se agrega nada)
+        """
+        return self.agregar_fila(
+            posicion, [obtener(empleado) for _, obtener, _ in self.extractores]
+        )
+
+    def agregar_fila(self, posicion, valores):
+        """
+        Agrega una fila sin objeto (por ejemplo, leída de un archivo).
+
+        Parámetros:
+            posicion (int): posición en el orden de inserción
+            valores (sequence): un valor por columna, en el orden de
+                                COLUMNAS_TIPO (montos y cantidades normales,
+                                no en centavos)
+
+        Returns:
+            bool: False si algún valor no cabe en su escala (no se agrega nada)
+        """
+        enteros = [
+            None if valor is None else convertir(valor)
+            for (_, _, convertir), valor in zip(self.extractores, valores)
+        ]
+        if None in enteros:
+            return False
+        self.posiciones.append(posicion)
+        for (nombre, _, _), entero in zip(self.extractores, enteros):
+            self.columnas[nombre].append(entero)
+        return True
+
+    def salarios(self):
+        """Evalúa la fórmula de la clase sobre todas las filas (en centavos)."""
+        return array("q", FORMULAS[self.clase](self.columnas, self.clase))
+
+
+class NominaColumnar:
+    """
+    Foto por columnas de los datos de pago de un conjunto de empleados.
+
+    Los valores se copian al agregar cada empleado; si después cambian sus
+    horas, ventas o proyectos, hay que crear el motor de nuevo.
+    """
+
+    def __init__(self, empleados=()):
+        """
+        Constructor del motor.
+
+        Parámetros:
+            empleados (iterable): empleados a incluir, en orden
+        """
+        self.tablas = {}       # clase -> ColumnasTipo
+        self.formulas = {}     # clase del empleado -> clase de FORMULAS o None
+        self.otros = []        # [(posición, empleado)] sin fórmula por columnas
+        self.cantidad = 0
+        for empleado in empleados:
+            self.agregar(empleado)
+
+    @classmethod
+    def desde_sistema(cls, sistema):
+        """Crea el motor con los empleados de un SistemaNomina."""
+        return cls(sistema.empleados)
+
+    def __len__(self):
+        return self.cantidad
+
+    def tabla(self, clase):
+        """Retorna (creándola si hace falta) la tabla de una clase con fórmula."""
+        tabla = self.tablas.get(clase)
+        if tabla is None:
+            tabla = self.tablas[clase] = ColumnasTipo(clase)
+        return tabla
+
+    def agregar(self, empleado):
+        """
+        Agrega un empleado a la tabla de su clase.
+
+        Parámetros:
+            empleado (Empleado): empleado de cualquier clase
+        """
+        posicion = self.cantidad
+        self.cantidad += 1
+        tipo = type(empleado)
+        try:
+            clase = self.formulas[tipo]
+        except KeyError:
+            clase = self.formulas[tipo] = clase_con_formula(tipo)
+        if clase is None or not self.tabla(clase).agregar(posicion, empleado):
+            self.otros.append((posicion, empleado))
+
+    def agregar_fila(self, clase, valores):
+        """
+        Agrega una fila de datos de pago sin objeto (ver ColumnasTipo.agregar_fila).
+
+        Raises:
+            ValueError: si algún valor no cabe en la escala de su columna
+        """
+        if not self.tabla(clase).agregar_fila(self.cantidad, valores):
+            raise ValueError(f"Valores fuera de escala para {clase.__name__}: {valores}")
+        self.cantidad += 1
+
+    def salarios_por_tipo(self):
+        """
+        Calcula los salarios de cada clase por separado.
+
+        Returns:
+            dict: {clase: (posiciones, array("q") de salarios en centavos)};
+                  la clave None agrupa a los empleados calculados uno a uno
+        """
+        resultado = {
+            clase: (tabla.posiciones, tabla.salarios())
+            for clase, tabla in self.tablas.items()
+        }
+        if self.otros:
+            posiciones = array("Q", (posicion for posicion, _ in self.otros))
+            salarios = array("q", (
+                Dinero(empleado.calcular_salario()).centavos for _, empleado in self.otros
+            ))
+            resultado[None] = (posiciones, salarios)
+        return resultado
+
+    def calcular_salarios(self):
+        """
+        Calcula el salario de todos los empleados.
+
+        Returns:
+            array: salarios en centavos ("q"), en el orden en que se agregaron
+                   los empleados
+        """
+        por_tipo = self.salarios_por_tipo()
+        if len(por_tipo) == 1:
+            # Un solo grupo: ya está en orden de inserción
+            return next(iter(por_tipo.values()))[1]
+        salarios = array("q", bytes(8 * self.cantidad))
+        for posiciones, valores in por_tipo.values():
+            colocar(salarios, posiciones, valores)
+        return salarios
+
+    def total(self):
+        """
+        Suma exacta de todos los salarios (igual a calcular_nomina_total()).
+
+        Returns:
+            Dinero: nómina total
+        """
+        return Dinero.de_centavos(sum(self.calcular_salarios()))
+
+
+def medir(cantidad=10_000_000):
+    """
+    Mide el tiempo de cálculo del motor con una población mixta.
+
+    Las filas se agregan directamente (sin crear objetos Empleado, cuyos
+    constructores imprimen mensajes), en bloques de cada tipo.
+
+    Parámetros:
+        cantidad (int): número de empleados
+
+    Returns:
+        dict: {"salarios": segundos de calcular_salarios(),
+               "por_tipo": segundos de salarios_por_tipo()}
+    """
+    motor = NominaColumnar()
+    cuarto = cantidad // 4
+    valores = {
+        EmpleadoTiempoCompleto: (3500.0,),
+        EmpleadoPorHoras: (160.0, 12.0, 25.0),
+        EmpleadoPorComision: (1000.0, 0.08, 33000.0),
+        EmpleadoFreelance: (5000.0,),
+    }
+    for indice, (clase, fila) in enumerate(valores.items()):
+        tabla = motor.tabla(clase)
+        inicio = indice * cuarto
+        fin = cantidad if indice == 3 else inicio + cuarto
+        tabla.posiciones.extend(range(inicio, fin))
+        for (nombre, _, convertir), valor in zip(tabla.extractores, fila):
+            tabla.columnas[nombre] = array("q", [convertir(valor)]) * (fin - inicio)
+    motor.cantidad = cantidad
+
+    inicio = time.perf_counter()
+    motor.salarios_por_tipo()
+    por_tipo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    motor.calcular_salarios()
+    salarios = time.perf_counter() - inicio
+    return {"salarios": salarios, "por_tipo": por_tipo}
+
+
+if __name__ == "__main__":
+    for cantidad in (100_000, 1_000_000, 10_000_000):
+        tiempos = medir(cantidad)
+        print(f"{cantidad:>12,} empleados: fórmulas {tiempos['por_tipo']:.3f} s"
+              f" | salarios en orden {tiempos['salarios']:.3f} s")
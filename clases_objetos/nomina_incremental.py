@@ -0,0 +1,119 @@
+"""
+NÓMINA INCREMENTAL CON DIARIO DE CAMBIOS
+========================================
+
+calcular_nomina_total() recorre a TODOS los empleados en cada llamada,
+aunque desde la anterior solo unos pocos hayan registrado horas, ventas o
+proyectos. SistemaNomina lleva un diario de cambios:
+
+1. Al agregarse al sistema, cada empleado recibe el diario del sistema
+2. Cuando su salario cambia (invalidar_salario()), el empleado se anota
+   en el diario
+3. recalcular_nomina() recalcula solo los anotados y corrige el total con
+   la diferencia entre el salario nuevo y el anterior de cada uno
+
+Este módulo mide que el costo de recalcular_nomina() crece con la
+cantidad de cambios y no con la cantidad de empleados.
+
+Uso:
+    sistema.recalcular_nomina()      # primera vez: procesa a todos
+    empleado.registrar_venta(500)
+    sistema.recalcular_nomina()      # procesa solo a ese empleado
+
+    python -m clases_objetos.nomina_incremental
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from .empleados_polimorfismo import (
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+    SistemaNomina,
+)
+
+
+def crear_sistema(cantidad, semilla=0):
+    """
+    Crea un sistema con una población mixta de empleados (sin mensajes).
+
+    Parámetros:
+        cantidad (int): número de empleados
+        semilla (int): semilla de los datos aleatorios
+
+    Returns:
+        SistemaNomina: sistema con los empleados agregados
+    """
+    azar = random.Random(semilla)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Medición")
+        for numero in range(cantidad):
+            tipo = numero % 4
+            if tipo == 0:
+                empleado = EmpleadoTiempoCompleto(f"E{numero}", f"TC{numero}", "01/01/2024",
+                                                  azar.randint(2000, 6000))
+            elif tipo == 1:
+                empleado = EmpleadoPorHoras(f"E{numero}", f"PH{numero}", "01/01/2024",
+                                            azar.randint(15, 40))
+                empleado.registrar_horas(azar.randint(80, 180))
+            elif tipo == 2:
+                empleado = EmpleadoPorComision(f"E{numero}", f"COM{numero}", "01/01/2024",
+                                               1000, 0.08)
+                empleado.registrar_ventas([azar.randint(1000, 20000) for _ in range(3)])
+            else:
+                empleado = EmpleadoFreelance(f"E{numero}", f"FR{numero}", "01/01/2024")
+                empleado.agregar_proyecto("Proyecto", azar.randint(1000, 9000))
+                empleado.completar_proyecto("Proyecto")
+            sistema.agregar_empleado(empleado)
+    return sistema
+
+
+def medir(cantidades=(10_000, 100_000), cambios=(1, 10, 100, 1_000), semilla=0):
+    """
+    Compara recalcular_nomina() contra recorrer a todos los empleados.
+
+    Parámetros:
+        cantidades (tuple): tamaños de la población
+        cambios (tuple): empleados modificados antes de cada recálculo
+        semilla (int): semilla de los datos aleatorios
+
+    Returns:
+        list: [{"empleados", "cambios", "incremental", "completo"}] en segundos
+    """
+    azar = random.Random(semilla)
+    resultados = []
+    for cantidad in cantidades:
+        sistema = crear_sistema(cantidad, semilla)
+        sistema.recalcular_nomina()
+        por_horas = [e for e in sistema.empleados if isinstance(e, EmpleadoPorHoras)]
+        for cantidad_cambios in cambios:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for empleado in azar.sample(por_horas, min(cantidad_cambios, len(por_horas))):
+                    empleado.registrar_horas(1, son_extra=True)
+
+            inicio = time.perf_counter()
+            total = sistema.recalcular_nomina()
+            incremental = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            completo = sum((e.salario_actual() for e in sistema.empleados), type(total)(0))
+            tiempo_completo = time.perf_counter() - inicio
+            assert completo == total
+            resultados.append({
+                "empleados": cantidad,
+                "cambios": cantidad_cambios,
+                "incremental": incremental,
+                "completo": tiempo_completo,
+            })
+    return resultados
+
+
+if __name__ == "__main__":
+    for fila in medir():
+        print(f"{fila['empleados']:>9,} empleados | {fila['cambios']:>6,} cambios:"
+              f" incremental {fila['incremental'] * 1000:8.3f} ms"
+              f" | recorrido completo {fila['completo'] * 1000:8.3f} ms")
@@ -0,0 +1,196 @@
+"""
+NÓMINA PARALELA POR FRAGMENTOS
+==============================
+
+Calcula la nómina de un SistemaNomina grande en varios procesos:
+
+1. Los empleados se dividen en FRAGMENTOS contiguos (por orden de inserción)
+2. Cada trabajador de un ProcessPoolExecutor toma la foto por columnas
+   (NominaColumnar) de SU fragmento y calcula los salarios y las
+   estadísticas parciales (cantidad, máximo, mínimo)
+3. El proceso principal une los resultados
+
+Leer los datos de pago de cada objeto es la parte cara (la fórmula por
+columnas es barata), así que también se reparte. En Linux los trabajadores
+se crean con fork y HEREDAN la lista de empleados: solo viajan los rangos
+(inicio, fin) y los salarios de vuelta. En otros sistemas cada fragmento
+envía sus empleados (pickle), lo que limita la ganancia.
+
+RESULTADO DETERMINISTA:
+Los salarios se calculan en centavos enteros (ver dinero.py), así que las
+sumas son exactas y no dependen del orden: el resultado es idéntico con 1 o
+con 64 fragmentos, y el total coincide con calcular_nomina_total().
+
+FALLAS:
+Si un fragmento falla (una excepción en el trabajador, o el proceso muere),
+los demás fragmentos no se ven afectados: sus resultados se conservan y el
+fragmento fallido se reintenta en un pool nuevo. Si sigue fallando, queda
+registrado en "fallidos" y sus salarios no se incluyen.
+
+Uso:
+    resultado = calcular_nomina_paralela(sistema, procesos=4,
+                                         progreso=lambda hechos, total, empleados: ...)
+    resultado["total"], resultado["fallidos"]
+"""
+
+import multiprocessing
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .dinero import Dinero
+from .nomina_columnar import NominaColumnar
+from .simulacion_paralela import particionar
+
+
+# Empleados de la corrida en curso; los trabajadores creados con fork los
+# heredan y no hace falta enviarlos
+_empleados_heredados = None
+
+
+def procesar_fragmento(inicio, fin, empleados=None):
+    """
+    Calcula los salarios y estadísticas parciales de un fragmento.
+
+    Se ejecuta en un proceso trabajador.
+
+    Parámetros:
+        inicio, fin (int): rango de posiciones del fragmento
+        empleados (list): empleados del fragmento; None para tomarlos de la
+                          lista heredada del proceso principal
+
+    Returns:
+        dict: {"inicio", "salarios": array("q") de centavos en orden,
+               "cantidad", "maximo", "minimo" (en centavos)}
+    """
+    if empleados is None:
+        empleados = _empleados_heredados[inicio:fin]
+    salarios = NominaColumnar(empleados).calcular_salarios()
+    return {
+        "inicio": inicio,
+        "salarios": salarios,
+        "cantidad": len(salarios),
+        "maximo": max(salarios) if salarios else None,
+        "minimo": min(salarios) if salarios else None,
+    }
+
+
+def _contexto_heredado():
+    """Contexto fork si la plataforma lo admite de forma segura (Linux), o None."""
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _ejecutar_ronda(pendientes, procesos, resultados, fallidos, progreso, total_fragmentos,
+                    empleados):
+    """Ejecuta en un pool nuevo los fragmentos pendientes {número: (inicio, fin)}."""
+    global _empleados_heredados
+    contexto = _contexto_heredado()
+    try:
+        _empleados_heredados = empleados if contexto is not None else None
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as pool:
+            futuros = {
+                pool.submit(procesar_fragmento, inicio, fin,
+                            None if contexto is not None else empleados[inicio:fin]): numero
+                for numero, (inicio, fin) in pendientes.items()
+            }
+            for futuro in as_completed(futuros):
+                numero = futuros[futuro]
+                try:
+                    resultados[numero] = futuro.result()
+                except BrokenProcessPool as error:
+                    fallidos[numero] = f"proceso terminado: {error}"
+                except Exception as error:
+                    fallidos[numero] = f"{type(error).__name__}: {error}"
+                else:
+                    fallidos.pop(numero, None)
+                    if progreso is not None:
+                        procesados = sum(r["cantidad"] for r in resultados.values())
+                        progreso(len(resultados), total_fragmentos, procesados)
+    except BrokenProcessPool as error:
+        for numero in pendientes:
+            if numero not in resultados:
+                fallidos[numero] = f"proceso terminado: {error}"
+    finally:
+        _empleados_heredados = None
+
+
+def calcular_nomina_paralela(sistema, procesos=None, fragmentos=None, reintentos=1,
+                             progreso=None):
+    """
+    Calcula la nómina de un sistema repartiendo los empleados entre procesos.
+
+    Parámetros:
+        sistema (SistemaNomina | iterable): sistema o lista de empleados
+        procesos (int): procesos del pool (default: núcleos disponibles);
+                        0 calcula todo en el proceso actual
+        fragmentos (int): número de fragmentos (default: 4 por proceso, para
+                          repartir mejor la carga y reportar avance)
+        reintentos (int): veces que se reintenta un fragmento fallido
+        progreso (callable): f(fragmentos_terminados, fragmentos_totales,
+                             empleados_procesados), llamada al terminar cada uno
+
+    Returns:
+        dict: {"cantidad", "total", "promedio", "maximo", "minimo" (Dinero),
+               "salarios": array("q") de centavos en orden de inserción
+               (0 en los fragmentos fallidos), "fallidos": {fragmento: mensaje}}
+    """
+    empleados = list(getattr(sistema, "empleados", sistema))
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if fragmentos is None:
+        fragmentos = 4 * max(procesos, 1)
+    partes = dict(enumerate(particionar(len(empleados), fragmentos))) if empleados else {}
+
+    resultados = {}
+    fallidos = {}
+    if procesos == 0:
+        for numero, (inicio, fin) in partes.items():
+            try:
+                resultados[numero] = procesar_fragmento(inicio, fin, empleados[inicio:fin])
+            except Exception as error:
+                fallidos[numero] = f"{type(error).__name__}: {error}"
+                continue
+            if progreso is not None:
+                procesados = sum(r["cantidad"] for r in resultados.values())
+                progreso(len(resultados), len(partes), procesados)
+    else:
+        pendientes = partes
+        for _ in range(reintentos + 1):
+            _ejecutar_ronda(pendientes, procesos, resultados, fallidos, progreso, len(partes),
+                            empleados)
+            pendientes = {n: partes[n] for n in partes if n not in resultados}
+            if not pendientes:
+                break
+
+    return _unir(resultados, fallidos, len(empleados))
+
+
+def _unir(resultados, fallidos, cantidad_total):
+    """Une los resultados parciales de forma independiente del orden de llegada."""
+    salarios = array("q", bytes(8 * cantidad_total))
+    cantidad = 0
+    maximos = []
+    minimos = []
+    for numero in sorted(resultados):
+        parcial = resultados[numero]
+        cantidad += parcial["cantidad"]
+        if parcial["maximo"] is not None:
+            maximos.append(parcial["maximo"])
+            minimos.append(parcial["minimo"])
+        inicio = parcial["inicio"]
+        salarios[inicio:inicio + parcial["cantidad"]] = parcial["salarios"]
+
+    total = Dinero.de_centavos(sum(salarios))
+    return {
+        "cantidad": cantidad,
+        "total": total,
+        "promedio": total / cantidad if cantidad else Dinero(0),
+        "maximo": Dinero.de_centavos(max(maximos)) if maximos else None,
+        "minimo": Dinero.de_centavos(min(minimos)) if minimos else None,
+        "salarios": salarios,
+        "fallidos": dict(sorted(fallidos.items())),
+    }
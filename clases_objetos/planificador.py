@@ -0,0 +1,207 @@
+"""
+PLANIFICADOR DE EVENTOS DISCRETOS PARA ANIMALES
+===============================================
+
+Recorrer todos los animales en cada paso de la simulación para llamar a
+comer(), dormir() y moverse() desperdicia tiempo: la mayoría de los animales
+no está haciendo nada la mayor parte del tiempo.
+
+Con un planificador de eventos discretos cada animal programa SU PRÓXIMA
+actividad en un montículo (heap) ordenado por tiempo. El motor solo despierta
+a los animales cuya actividad ya llegó, y cada uno programa la siguiente.
+
+DETERMINISMO:
+- Todo el azar (qué actividad sigue, cuánto tarda, qué truco hace un Perro)
+  sale de un único random.Random creado con la semilla
+- Los empates de tiempo se resuelven por orden de programación
+- Con la misma semilla y los mismos animales la traza es siempre idéntica
+
+Uso:
+    planificador = PlanificadorActividades(semilla=42)
+    for animal in animales:
+        planificador.agregar_animal(animal)
+    planificador.ejecutar(hasta=24.0)
+    for tiempo, nombre, actividad, resultado in planificador.traza: ...
+"""
+
+import heapq
+import random
+import time
+
+from .animales_herencia import Perro
+
+
+# Actividades que realiza cualquier animal
+ACTIVIDADES_BASE = ("comer", "dormir", "moverse")
+
+# Actividades adicionales por clase (se heredan por las subclases)
+ACTIVIDADES_EXTRA = {
+    Perro: ("hacer_truco",),
+}
+
+
+class PlanificadorActividades:
+    """
+    Motor de eventos discretos: un montículo de (tiempo, secuencia, animal, actividad).
+
+    Atributos:
+        reloj (float): tiempo simulado actual (en horas)
+        traza (list): [(tiempo, nombre, actividad, resultado)] si se registra
+        eventos_procesados (int): total de eventos ejecutados
+    """
+
+    def __init__(self, semilla=0, espera_media=1.0, alimento="su alimento favorito",
+                 registrar_traza=True):
+        """
+        Constructor del planificador.
+
+        Parámetros:
+            semilla (int): semilla del generador aleatorio
+            espera_media (float): tiempo medio entre actividades de un animal (horas)
+            alimento (str): alimento que se pasa a comer()
+            registrar_traza (bool): si es False no se guarda la traza (solo se cuenta)
+        """
+        self.aleatorio = random.Random(semilla)
+        self.espera_media = espera_media
+        self.alimento = alimento
+        self.reloj = 0.0
+        self.animales = []
+        self.traza = [] if registrar_traza else None
+        self.eventos_procesados = 0
+        self._eventos = []
+        self._secuencia = 0
+        self._actividades_por_clase = {}
+
+    def _actividades(self, clase):
+        """Retorna (y guarda) las actividades disponibles para una clase."""
+        actividades = self._actividades_por_clase.get(clase)
+        if actividades is None:
+            actividades = ACTIVIDADES_BASE
+            for base in clase.__mro__:
+                actividades += ACTIVIDADES_EXTRA.get(base, ())
+            self._actividades_por_clase[clase] = actividades
+        return actividades
+
+    def programar(self, indice_animal, tiempo, actividad):
+        """
+        Programa una actividad de un animal en un tiempo dado.
+
+        Parámetros:
+            indice_animal (int): posición del animal en self.animales
+            tiempo (float): momento en que debe ocurrir la actividad
+            actividad (str): nombre del método a llamar
+        """
+        self._secuencia += 1
+        heapq.heappush(self._eventos, (tiempo, self._secuencia, indice_animal, actividad))
+
+    def _programar_siguiente(self, indice_animal, desde):
+        """Elige al azar la próxima actividad del animal y cuándo ocurrirá."""
+        aleatorio = self.aleatorio
+        actividades = self._actividades(type(self.animales[indice_animal]))
+        actividad = actividades[int(aleatorio.random() * len(actividades))]
+        espera = aleatorio.expovariate(1.0 / self.espera_media)
+        self.programar(indice_animal, desde + espera, actividad)
+
+    def agregar_animal(self, animal):
+        """
+        Agrega un animal a la simulación y programa su primera actividad.
+
+        Parámetros:
+            animal (Animal): cualquier objeto de la jerarquía Animal
+
+        Returns:
+            int: índice del animal en el planificador
+        """
+        self.animales.append(animal)
+        indice = len(self.animales) - 1
+        self._programar_siguiente(indice, self.reloj)
+        return indice
+
+    def pendientes(self):
+        """Retorna la cantidad de eventos programados pendientes."""
+        return len(self._eventos)
+
+    def ejecutar(self, hasta=None, max_eventos=None):
+        """
+        Ejecuta los eventos en orden de tiempo.
+
+        Parámetros:
+            hasta (float): tiempo simulado límite (incluido); None = sin límite
+            max_eventos (int): cantidad máxima de eventos a procesar en esta llamada
+
+        Returns:
+            int: cantidad de eventos procesados en esta llamada
+        """
+        eventos = self._eventos
+        animales = self.animales
+        traza = self.traza
+        aleatorio = self.aleatorio
+        alimento = self.alimento
+        heappop = heapq.heappop
+        limite = float("inf") if hasta is None else hasta
+        restantes = -1 if max_eventos is None else max_eventos
+        procesados = 0
+
+        while eventos and eventos[0][0] <= limite and restantes != 0:
+            tiempo, _, indice, actividad = heappop(eventos)
+            self.reloj = tiempo
+            animal = animales[indice]
+
+            if actividad == "comer":
+                resultado = animal.comer(alimento)
+            elif actividad == "hacer_truco":
+                resultado = animal.hacer_truco(aleatorio)
+            else:
+                resultado = getattr(animal, actividad)()
+
+            if traza is not None:
+                traza.append((tiempo, animal.nombre, actividad, resultado))
+            self._programar_siguiente(indice, tiempo)
+            procesados += 1
+            restantes -= 1
+
+        if hasta is not None and (not eventos or eventos[0][0] > hasta):
+            self.reloj = max(self.reloj, hasta)
+        self.eventos_procesados += procesados
+        return procesados
+
+
+def medir_rendimiento(cantidad_animales=10_000, cantidad_eventos=1_000_000, semilla=0):
+    """
+    Mide cuántos eventos por minuto procesa el planificador.
+
+    Parámetros:
+        cantidad_animales (int): animales en la simulación
+        cantidad_eventos (int): eventos a procesar
+        semilla (int): semilla del generador
+
+    Returns:
+        float: eventos procesados por minuto
+    """
+    import contextlib
+    import io
+
+    from .animales_herencia import Aguila, Gato, Pinguino
+
+    especies = (
+        (Perro, "Labrador"), (Gato, "negro"), (Aguila, 2.0), (Pinguino, "Emperador"),
+    )
+    planificador = PlanificadorActividades(semilla=semilla, registrar_traza=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(cantidad_animales):
+            clase, argumento = especies[i % len(especies)]
+            animal = clase(f"Animal {i}", i % 15, 10.0, argumento)
+            if isinstance(animal, Perro):
+                animal.aprender_truco("sentarse")
+                animal.aprender_truco("dar la pata")
+            planificador.agregar_animal(animal)
+
+    inicio = time.perf_counter()
+    planificador.ejecutar(max_eventos=cantidad_eventos)
+    duracion = time.perf_counter() - inicio
+    return cantidad_eventos / duracion * 60
+
+
+if __name__ == "__main__":
+    por_minuto = medir_rendimiento()
+    print(f"Eventos por minuto: {por_minuto:,.0f}")
@@ -0,0 +1,393 @@
+"""
+POBLACIÓN DE ANIMALES EN COLUMNAS (struct-of-arrays)
+====================================================
+
+Simular millones de objetos Perro, Gato, Aguila y Pinguino llamando a
+comer(), dormir(), moverse() y hacer_sonido() objeto por objeto es muy lento:
+cada llamada busca el método en la jerarquía y crea un objeto por animal.
+
+PoblacionAnimales guarda cada especie como COLUMNAS (arreglos del módulo
+array), en lugar de una lista de objetos:
+
+    Perro:    nombre | edad | peso | estado | raza | temperatura_corporal
+    Aguila:   nombre | edad | peso | estado | envergadura | altura_vuelo_max
+    ...
+
+- Los textos (nombres, razas, colores, estados...) se guardan una sola vez en
+  una tabla de cadenas compartida; las columnas solo guardan su índice
+- Los atributos que fija el constructor de cada rama (numero_patas,
+  tipo_pelaje, puede_volar, tipo_huevo) también son columnas, así que los
+  cambios hechos a un animal se conservan
+- Otros atributos (trucos, o los que se agreguen a un objeto) se guardan
+  aparte, solo para los animales donde difieren del valor por defecto
+- Los comportamientos se despachan UNA vez por especie (no una vez por animal)
+
+¿Cómo se garantiza el mismo resultado que los métodos de los objetos?
+Para cada especie se crea un objeto "sonda" real cuyo nombre es una marca.
+Se llama al método de la clase sobre la sonda y el texto se parte en la marca;
+luego se reconstruye el texto de cada animal uniendo las partes con su nombre.
+Así la plantilla sale del propio método y no puede desincronizarse.
+La plantilla se comprueba llamando otra vez al método con un nombre de
+control: si el texto no coincide (el método o sus argumentos contienen la
+marca, o transforman el nombre), la especie se despacha objeto por objeto.
+Los animales cuyos atributos difieren de los de la sonda (un perro de 3
+patas, un águila que no vuela) no usan la plantilla: se reconstruye su
+objeto y se llama al método real.
+"""
+
+import contextlib
+import io
+from array import array
+
+from .animales_herencia import Aguila, Gato, Perro, Pinguino
+
+
+# Marca que ocupa el lugar del nombre en las plantillas de la sonda, y
+# nombre con el que se comprueba cada plantilla
+_MARCA = "\x00"
+_CONTROL = "Sonda\x01"
+
+# Tipo de columna para los campos de texto (índice en la tabla de cadenas)
+CADENA = "cadena"
+
+# Tipo de columna para los campos lógicos (se guardan como 0/1)
+BOOLEANO = "booleano"
+
+# Columnas propias de cada especie: (atributo, código de tipo de array | CADENA)
+CAMPOS_ESPECIE = {
+    Perro: (("raza", CADENA), ("temperatura_corporal", "d")),
+    Gato: (("color", CADENA), ("vidas", "q"), ("temperatura_corporal", "d")),
+    Aguila: (("envergadura", "d"), ("altura_vuelo_max", "q")),
+    Pinguino: (("especie", CADENA), ("velocidad_nado", "q")),
+}
+
+# Columnas comunes a todas las especies
+CAMPOS_COMUNES = (("nombre", CADENA), ("edad", "q"), ("peso", "d"), ("estado", CADENA))
+
+# Columnas de la rama (Mamifero u Oviparo) que el constructor de la especie
+# fija con un valor por defecto, pero que pueden cambiarse por animal
+_CAMPOS_MAMIFERO = (("tipo_pelaje", CADENA), ("numero_patas", "q"))
+_CAMPOS_OVIPARO = (("tipo_huevo", CADENA), ("puede_volar", BOOLEANO))
+CAMPOS_RAMA = {
+    Perro: _CAMPOS_MAMIFERO,
+    Gato: _CAMPOS_MAMIFERO,
+    Aguila: _CAMPOS_OVIPARO,
+    Pinguino: _CAMPOS_OVIPARO,
+}
+
+_CODIGOS_ARRAY = {CADENA: "I", BOOLEANO: "b"}
+
+# Argumento propio que recibe el constructor de cada especie
+_ARGUMENTO_CONSTRUCTOR = {Perro: "raza", Gato: "color", Aguila: "envergadura", Pinguino: "especie"}
+
+
+def _crear_sonda(clase):
+    """
+    Crea una instancia real de la especie con la marca como nombre.
+
+    Los constructores imprimen mensajes; se descartan para no ensuciar la salida.
+    """
+    argumento = 1.0 if _ARGUMENTO_CONSTRUCTOR[clase] == "envergadura" else _MARCA
+    with contextlib.redirect_stdout(io.StringIO()):
+        return clase(_MARCA, 0, 0.0, argumento)
+
+
+class ColumnasEspecie:
+    """
+    Columnas de una especie dentro de la población.
+
+    Cada atributo es un array del mismo largo; la posición i de todas las
+    columnas describe al animal i de la especie.
+
+    Atributos:
+        extras (dict): {posición: {atributo: valor}} con los atributos que no
+                       son columnas y difieren del valor por defecto
+        especiales (set): posiciones de los animales que no coinciden con la
+                          sonda (se despachan con su objeto)
+    """
+
+    def __init__(self, clase, tabla_cadenas):
+        """
+        Constructor de las columnas de una especie.
+
+        Parámetros:
+            clase (type): especie (Perro, Gato, Aguila o Pinguino)
+            tabla_cadenas (TablaCadenas): tabla de textos compartida
+        """
+        self.clase = clase
+        self.tabla = tabla_cadenas
+        self.campos = CAMPOS_COMUNES + CAMPOS_ESPECIE[clase] + CAMPOS_RAMA[clase]
+        self.columnas = {
+            nombre: array(_CODIGOS_ARRAY.get(tipo, tipo))
+            for nombre, tipo in self.campos
+        }
+        self.sonda = _crear_sonda(clase)
+        # Valores por defecto que fija el constructor (vidas, velocidad_nado...)
+        self.valores_defecto = dict(vars(self.sonda))
+        self.extras = {}
+        self.especiales = set()
+        self._rama = [nombre for nombre, _ in CAMPOS_RAMA[clase]]
+        self._fuera_de_columnas = [n for n in self.valores_defecto if n not in self.columnas]
+
+    def __len__(self):
+        return len(self.columnas["nombre"])
+
+    def agregar(self, valores):
+        """
+        Agrega un animal a las columnas.
+
+        Parámetros:
+            valores (dict): {atributo: valor} para cada campo de la especie;
+                            los demás atributos se guardan en extras si
+                            difieren del valor por defecto
+        """
+        posicion = len(self)
+        for nombre, tipo in self.campos:
+            valor = valores[nombre]
+            if tipo == CADENA:
+                valor = self.tabla.indice(valor)
+            self.columnas[nombre].append(valor)
+
+        defecto = self.valores_defecto
+        especial = False
+        for nombre in self._rama:
+            if valores[nombre] != defecto[nombre]:
+                especial = True
+        extras = {}
+        for nombre in self._fuera_de_columnas:
+            valor = valores.get(nombre, defecto[nombre])
+            if valor != defecto[nombre]:
+                extras[nombre] = valor
+        for nombre in valores.keys() - defecto.keys():  # agregados al objeto
+            extras[nombre] = valores[nombre]
+        if extras:
+            self.extras[posicion] = {
+                nombre: valor.copy() if isinstance(valor, list) else valor
+                for nombre, valor in extras.items()
+            }
+            especial = True
+        if especial:
+            self.especiales.add(posicion)
+
+    def valores(self, atributo):
+        """
+        Retorna los valores de una columna (los textos ya resueltos).
+
+        Parámetros:
+            atributo (str): nombre del atributo
+
+        Returns:
+            list | array: valores de la columna
+        """
+        columna = self.columnas[atributo]
+        tipo = dict(self.campos)[atributo]
+        if tipo == CADENA:
+            cadenas = self.tabla.cadenas
+            return [cadenas[i] for i in columna]
+        if tipo == BOOLEANO:
+            return [bool(valor) for valor in columna]
+        return columna
+
+    def despachar(self, metodo, *argumentos):
+        """
+        Ejecuta un método de la especie sobre todos sus animales a la vez.
+
+        La plantilla se obtiene UNA vez llamando al método sobre la sonda;
+        después cada resultado es solo una unión de texto con el nombre.
+
+        Parámetros:
+            metodo (str): nombre del método (comer, dormir, moverse, hacer_sonido)
+            *argumentos: argumentos del método (por ejemplo el alimento)
+
+        Returns:
+            list: resultado del método para cada animal, en orden de inserción
+        """
+        partes = self.plantilla(metodo, *argumentos)
+        if partes is None:
+            return [getattr(self.animal(posicion), metodo)(*argumentos)
+                    for posicion in range(len(self))]
+        cadenas = self.tabla.cadenas
+        resultado = [cadenas[i].join(partes) for i in self.columnas["nombre"]]
+        for posicion in self.especiales:
+            resultado[posicion] = getattr(self.animal(posicion), metodo)(*argumentos)
+        return resultado
+
+    def plantilla(self, metodo, *argumentos):
+        """
+        Partes del texto del método alrededor del nombre.
+
+        Returns:
+            list | None: partes a unir con el nombre de cada animal, o None
+                         si unirlas no reproduce el método (ver el docstring
+                         del módulo)
+        """
+        metodo_sonda = getattr(self.sonda, metodo)
+        partes = metodo_sonda(*argumentos).split(_MARCA)
+        self.sonda.nombre = _CONTROL
+        try:
+            control = metodo_sonda(*argumentos)
+        finally:
+            self.sonda.nombre = _MARCA
+        return partes if _CONTROL.join(partes) == control else None
+
+    def animal(self, posicion):
+        """
+        Reconstruye el objeto del animal en la posición dada.
+
+        El objeto se crea sin llamar al constructor (que imprime mensajes),
+        copiando los valores por defecto de la sonda y los de las columnas.
+
+        Parámetros:
+            posicion (int): posición del animal dentro de la especie
+
+        Returns:
+            Animal: objeto equivalente al animal almacenado
+        """
+        atributos = {
+            nombre: valor.copy() if isinstance(valor, list) else valor
+            for nombre, valor in self.valores_defecto.items()
+        }
+        cadenas = self.tabla.cadenas
+        for nombre, tipo in self.campos:
+            valor = self.columnas[nombre][posicion]
+            if tipo == CADENA:
+                valor = cadenas[valor]
+            elif tipo == BOOLEANO:
+                valor = bool(valor)
+            atributos[nombre] = valor
+        for nombre, valor in self.extras.get(posicion, {}).items():
+            atributos[nombre] = valor.copy() if isinstance(valor, list) else valor
+        animal = object.__new__(self.clase)
+        animal.__dict__.update(atributos)
+        return animal
+
+
+class TablaCadenas:
+    """Tabla de textos compartida: cada texto distinto se guarda una sola vez."""
+
+    def __init__(self):
+        self.cadenas = []
+        self._indices = {}
+
+    def indice(self, cadena):
+        """Retorna el índice del texto, agregándolo si no existe."""
+        indice = self._indices.get(cadena)
+        if indice is None:
+            indice = self._indices[cadena] = len(self.cadenas)
+            self.cadenas.append(cadena)
+        return indice
+
+
+class PoblacionAnimales:
+    """
+    Contenedor de una población de animales almacenada por columnas.
+
+    Los métodos de comportamiento devuelven un diccionario {especie: [textos]}
+    con el mismo resultado que llamar al método en cada objeto, en el orden
+    en que se agregaron los animales de cada especie.
+    """
+
+    ESPECIES = tuple(CAMPOS_ESPECIE)
+
+    def __init__(self):
+        """Crea una población vacía."""
+        self.tabla = TablaCadenas()
+        self.especies = {}
+
+    @classmethod
+    def desde_animales(cls, animales):
+        """
+        Crea una población a partir de objetos existentes.
+
+        Parámetros:
+            animales (iterable): objetos Perro, Gato, Aguila o Pinguino
+
+        Returns:
+            PoblacionAnimales: nueva población con los mismos datos
+        """
+        poblacion = cls()
+        for animal in animales:
+            poblacion.agregar_animal(animal)
+        return poblacion
+
+    def _columnas(self, clase):
+        """Retorna (creando si hace falta) las columnas de una especie."""
+        columnas = self.especies.get(clase)
+        if columnas is None:
+            if clase not in CAMPOS_ESPECIE:
+                raise TypeError(f"Especie no soportada en la población: {clase.__name__}")
+            columnas = self.especies[clase] = ColumnasEspecie(clase, self.tabla)
+        return columnas
+
+    def agregar(self, clase, nombre, edad, peso, **campos):
+        """
+        Agrega un animal sin crear su objeto.
+
+        Parámetros:
+            clase (type): especie del animal
+            nombre (str): nombre del animal
+            edad (int): edad en años
+            peso (float): peso en kilogramos
+            **campos: atributos propios de la especie (raza, color, envergadura,
+                      especie...) o de su rama (numero_patas, puede_volar...).
+                      El argumento propio del constructor es obligatorio; los
+                      demás que falten toman el valor por defecto del
+                      constructor (vidas, velocidad_nado, estado...)
+
+        Raises:
+            TypeError: si falta el argumento propio del constructor
+        """
+        columnas = self._columnas(clase)
+        argumento = _ARGUMENTO_CONSTRUCTOR[clase]
+        if argumento not in campos:
+            # Lo mismo que haría el constructor de la especie
+            raise TypeError(f"{clase.__name__}.agregar() missing 1 required argument: "
+                            f"'{argumento}'")
+        valores = dict(columnas.valores_defecto)
+        valores.update(campos, nombre=nombre, edad=edad, peso=peso)
+        columnas.agregar(valores)
+
+    def agregar_animal(self, animal):
+        """
+        Agrega los datos de un objeto animal existente.
+
+        Parámetros:
+            animal (Animal): objeto de una de las especies soportadas
+        """
+        columnas = self._columnas(type(animal))
+        columnas.agregar(vars(animal))
+
+    def __len__(self):
+        return sum(len(columnas) for columnas in self.especies.values())
+
+    def contar(self):
+        """Retorna {especie: cantidad de animales}."""
+        return {clase: len(columnas) for clase, columnas in self.especies.items()}
+
+    def animales(self):
+        """Genera los objetos de todos los animales (especie por especie)."""
+        for columnas in self.especies.values():
+            for posicion in range(len(columnas)):
+                yield columnas.animal(posicion)
+
+    def _despachar(self, metodo, *argumentos):
+        return {
+            clase: columnas.despachar(metodo, *argumentos)
+            for clase, columnas in self.especies.items()
+        }
+
+    def comer(self, alimento):
+        """Equivalente a animal.comer(alimento) para todos los animales."""
+        return self._despachar("comer", alimento)
+
+    def dormir(self):
+        """Equivalente a animal.dormir() para todos los animales."""
+        return self._despachar("dormir")
+
+    def moverse(self):
+        """Equivalente a animal.moverse() para todos los animales."""
+        return self._despachar("moverse")
+
+    def hacer_sonido(self):
+        """Equivalente a animal.hacer_sonido() para todos los animales."""
+        return self._despachar("hacer_sonido")
@@ -0,0 +1,332 @@
+"""
+PUNTOS DE CONTROL PARA CORRIDAS DE NÓMINA LARGAS
+================================================
+
+Si una corrida de nómina sobre millones de empleados se interrumpe (el
+proceso muere, se apaga la máquina), hay que empezar de nuevo. Con
+calcular_nomina_con_control() la corrida guarda su avance en disco y puede
+continuar desde el último punto de control:
+
+    ruta            -> estado (JSON): empleados procesados, total parcial,
+                       huella de la corrida y huella de cada bloque
+    ruta + ".datos" -> salarios de cada empleado procesado (centavos, int64)
+
+1. Los empleados se procesan en BLOQUES
+2. Los salarios de cada bloque se AGREGAN al archivo de datos (no se
+   reescriben los anteriores)
+3. Cada `intervalo` segundos se escribe el estado en un archivo temporal,
+   se sincroniza con el disco y se renombra sobre `ruta` (os.replace es
+   atómico: el estado en disco siempre es el anterior o el nuevo, nunca
+   uno a medio escribir)
+4. Al reanudar, se conservan los bloques cuya huella coincide con la de
+   los empleados actuales (y cuyos salarios están en el archivo de datos);
+   desde el primer bloque que no coincide se recalcula todo
+
+Como solo se agregan los salarios nuevos y el estado es pequeño, el costo
+de los puntos de control es proporcional a los empleados procesados, no a
+la cantidad de puntos de control.
+
+La huella de la corrida (empresa y tamaño de bloque) evita reanudar con el
+punto de control de otro sistema. La huella de cada bloque resume, para
+cada empleado, su número y los DATOS DE PAGO de los que sale el salario
+(CLAVES_PAGO: los montos guardados en centavos, leídos sin recalcular
+nada; para las clases sin fórmula por columnas, el salario mismo). No
+depende de contadores del proceso, así que sirve para reanudar después de
+reiniciar: si cambian los datos de pago de un empleado, su bloque y los
+siguientes se recalculan.
+
+COSTO: en este modelo cada salario sale de datos ya acumulados en O(1), así
+que leer los datos de pago para la huella cuesta casi la mitad de calcular
+el salario (~40% más de tiempo con 200,000 empleados, ver medir()). Sin
+esa huella, un punto de control podría reanudar con salarios viejos.
+
+Uso:
+    resultado = calcular_nomina_con_control(sistema, "nomina.ctl")
+    # ... el proceso muere ...
+    resultado = calcular_nomina_con_control(sistema, "nomina.ctl")  # continúa
+    resultado["reanudado_desde"], resultado["total"]
+"""
+
+import hashlib
+import json
+import operator
+import os
+import time
+from array import array
+
+from .dinero import Dinero
+from .empleados_polimorfismo import (
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+)
+from .nomina_columnar import clase_con_formula
+
+
+# Empleados procesados entre revisiones del reloj
+TAMANO_BLOQUE = 10_000
+
+# Segundos mínimos entre puntos de control
+INTERVALO = 2.0
+
+_BYTES_SALARIO = array("q").itemsize
+
+
+def _huella(sistema, tamano_bloque):
+    """
+    Identifica la corrida para no reanudar con datos de otro sistema.
+
+    Returns:
+        list: lista (no tupla) para compararla con la leída del JSON
+    """
+    return [getattr(sistema, "nombre_empresa", None), tamano_bloque]
+
+
+# Datos de pago de cada clase con fórmula por columnas, leídos sin calcular
+# el salario (los montos, en centavos; attrgetter los recorre en C)
+CLAVES_PAGO = {
+    EmpleadoTiempoCompleto: operator.attrgetter("salario_mensual.centavos"),
+    EmpleadoPorHoras: operator.attrgetter("horas_trabajadas", "horas_extra",
+                                          "tarifa_por_hora.centavos"),
+    EmpleadoPorComision: operator.attrgetter("salario_base.centavos", "porcentaje_comision",
+                                             "escala_comision", "ventas.total_centavos"),
+    EmpleadoFreelance: operator.attrgetter("proyectos.total_completado_centavos"),
+}
+
+
+def _salario_centavos(empleado):
+    return Dinero(empleado.salario_actual()).centavos
+
+
+class _ClavesPago(dict):
+    """Caché {clase del empleado: función que lee sus datos de pago}."""
+
+    def __missing__(self, tipo):
+        # Sin fórmula por columnas (clase redefinida): el salario mismo
+        clave = self[tipo] = CLAVES_PAGO.get(clase_con_formula(tipo), _salario_centavos)
+        return clave
+
+
+def _huella_bloque(empleados, claves):
+    """
+    Resume el número y los datos de pago de cada empleado de un bloque.
+
+    Parámetros:
+        empleados (list): empleados del bloque
+        claves (_ClavesPago): caché de funciones de datos de pago
+
+    Returns:
+        str: hash hexadecimal
+    """
+    try:
+        registros = [(e.numero_empleado, claves[type(e)](e)) for e in empleados]
+    except AttributeError:
+        # Algún dato de pago no es Dinero (asignado a mano): el salario mismo
+        registros = [(e.numero_empleado, _salario_centavos(e)) for e in empleados]
+    return hashlib.blake2b(repr(registros).encode("ascii", "backslashreplace"),
+                           digest_size=16).hexdigest()
+
+
+def leer_punto_control(ruta):
+    """
+    Lee el estado guardado en un punto de control.
+
+    Parámetros:
+        ruta (str): archivo de estado
+
+    Returns:
+        dict: {"huella", "bloques", "procesados", "total_centavos"}, o None
+              si no existe, no se puede leer o no tiene esa forma
+    """
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            estado = json.load(archivo)
+    except (FileNotFoundError, ValueError):
+        return None
+    if (not isinstance(estado, dict) or not isinstance(estado.get("huella"), list)
+            or not isinstance(estado.get("bloques"), list)
+            or not all(isinstance(bloque, str) for bloque in estado["bloques"])
+            or type(estado.get("procesados")) is not int
+            or type(estado.get("total_centavos")) is not int):
+        return None
+    return estado
+
+
+def guardar_punto_control(ruta, estado):
+    """
+    Escribe el estado de forma atómica (archivo temporal + os.replace).
+
+    Parámetros:
+        ruta (str): archivo de estado
+        estado (dict): {"huella", "bloques", "procesados", "total_centavos"}
+    """
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(estado, archivo)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+def _borrar(*rutas):
+    for ruta in rutas:
+        try:
+            os.remove(ruta)
+        except FileNotFoundError:
+            pass
+
+
+def calcular_nomina_con_control(sistema, ruta, intervalo=INTERVALO,
+                                tamano_bloque=TAMANO_BLOQUE, conservar=False,
+                                progreso=None):
+    """
+    Calcula la nómina guardando puntos de control y reanudando si existe uno.
+
+    Parámetros:
+        sistema (SistemaNomina | list): sistema o lista de empleados
+        ruta (str): archivo de estado; los salarios van en ruta + ".datos"
+        intervalo (float): segundos mínimos entre puntos de control
+        tamano_bloque (int): empleados procesados entre revisiones del reloj
+        conservar (bool): si es False, los archivos se borran al terminar
+        progreso (callable): f(procesados, total), llamada después de cada
+                             bloque (si lanza una excepción, la corrida se
+                             interrumpe y puede reanudarse)
+
+    Returns:
+        dict: {"cantidad", "total" (Dinero), "salarios": array("q") de
+               centavos en orden, "reanudado_desde": empleados que ya
+               estaban procesados, "puntos_control": cantidad escrita}
+    """
+    empleados = list(getattr(sistema, "empleados", sistema))
+    datos = f"{ruta}.datos"
+    huella = _huella(sistema, tamano_bloque)
+    claves = _ClavesPago()
+
+    estado = leer_punto_control(ruta)
+    try:
+        tamano_datos = os.path.getsize(datos)
+    except FileNotFoundError:
+        tamano_datos = 0
+    # Se conservan los bloques iniciales cuyos datos de pago no cambiaron y
+    # cuyos salarios están completos en el archivo de datos
+    bloques = []
+    inicio = 0
+    if estado is not None and estado["huella"] == huella:
+        guardados = min(estado["procesados"], tamano_datos // _BYTES_SALARIO)
+        for guardada in estado["bloques"]:
+            bloque = empleados[inicio:inicio + tamano_bloque]
+            if (not bloque or inicio + len(bloque) > guardados
+                    or _huella_bloque(bloque, claves) != guardada):
+                break
+            bloques.append(guardada)
+            inicio += len(bloque)
+
+    # Lo escrito después del último bloque válido se descarta
+    salarios = array("q")
+    with open(datos, "ab") as archivo:
+        archivo.truncate(inicio * _BYTES_SALARIO)
+    if inicio:
+        with open(datos, "rb") as archivo:
+            salarios.fromfile(archivo, inicio)
+    total = sum(salarios)
+
+    puntos_control = 0
+    ultimo = time.monotonic()
+    with open(datos, "ab") as archivo:
+        for desde in range(inicio, len(empleados), tamano_bloque):
+            empleados_bloque = empleados[desde:desde + tamano_bloque]
+            bloque = array("q", [
+                Dinero(empleado.salario_actual()).centavos for empleado in empleados_bloque
+            ])
+            bloques.append(_huella_bloque(empleados_bloque, claves))
+            bloque.tofile(archivo)
+            salarios.extend(bloque)
+            total += sum(bloque)
+            procesados = desde + len(bloque)
+
+            if time.monotonic() - ultimo >= intervalo:
+                archivo.flush()
+                os.fsync(archivo.fileno())
+                guardar_punto_control(ruta, {
+                    "huella": huella,
+                    "bloques": bloques,
+                    "procesados": procesados,
+                    "total_centavos": total,
+                })
+                puntos_control += 1
+                ultimo = time.monotonic()
+            if progreso is not None:
+                progreso(procesados, len(empleados))
+
+    if conservar:
+        guardar_punto_control(ruta, {
+            "huella": huella,
+            "bloques": bloques,
+            "procesados": len(empleados),
+            "total_centavos": total,
+        })
+    else:
+        _borrar(ruta, datos)
+
+    return {
+        "cantidad": len(empleados),
+        "total": Dinero.de_centavos(total),
+        "salarios": salarios,
+        "reanudado_desde": inicio,
+        "puntos_control": puntos_control,
+    }
+
+
+def medir(cantidad=200_000, ruta="medicion_nomina.ctl", repeticiones=5):
+    """
+    Mide el costo de los puntos de control frente a una corrida sin ellos.
+
+    Ambas corridas recalculan todos los salarios (se invalida la caché
+    antes de cada una); se toma el mejor tiempo de varias repeticiones.
+
+    Parámetros:
+        cantidad (int): número de empleados (población de nomina_incremental)
+        ruta (str): archivo de estado temporal
+        repeticiones (int): corridas de cada variante
+
+    Returns:
+        dict: {"sin_control", "con_control" (segundos), "puntos_control",
+               "sobrecosto" (fracción)}
+    """
+    from .nomina_incremental import crear_sistema
+
+    sistema = crear_sistema(cantidad)
+
+    def sin_puntos():
+        return array("q", [Dinero(empleado.salario_actual()).centavos
+                           for empleado in sistema.empleados])
+
+    def con_puntos():
+        return calcular_nomina_con_control(sistema, ruta, intervalo=0.1)
+
+    tiempos = {sin_puntos: [], con_puntos: []}
+    for _ in range(repeticiones):
+        for variante, medidos in tiempos.items():
+            for empleado in sistema.empleados:
+                empleado.invalidar_salario()
+            inicio = time.perf_counter()
+            resultado = variante()
+            medidos.append(time.perf_counter() - inicio)
+
+    sin_control = min(tiempos[sin_puntos])
+    con_control = min(tiempos[con_puntos])
+    return {
+        "sin_control": sin_control,
+        "con_control": con_control,
+        "puntos_control": resultado["puntos_control"],
+        "sobrecosto": con_control / sin_control - 1,
+    }
+
+
+if __name__ == "__main__":
+    tiempos = medir()
+    print(f"Sin puntos de control: {tiempos['sin_control']:.3f} s")
+    print(f"Con puntos de control: {tiempos['con_control']:.3f} s"
+          f" ({tiempos['puntos_control']} escritos, cada 0.1 s)")
+    print(f"Sobrecosto: {tiempos['sobrecosto']:.1%}")
@@ -0,0 +1,294 @@
+"""
+BANCO DE PRUEBAS DE RENDIMIENTO DE LA NÓMINA
+============================================
+
+Mide cómo se comporta SistemaNomina con poblaciones grandes. Un generador
+con semilla crea una mezcla realista de los cuatro tipos de empleado:
+
+    40% EmpleadoTiempoCompleto  salario por escala, 0 a 3 beneficios
+    30% EmpleadoPorHoras        tarifa por escala, horas normales y extra
+    20% EmpleadoPorComision     5 a 60 ventas; 1 de cada 10 con comisión
+                                escalonada
+    10% EmpleadoFreelance       1 a 6 proyectos, ~60% completados
+
+Para cada tamaño de población se mide (con los mensajes descartados):
+- agregar_empleado() para todos los empleados
+- calcular_nomina_total() (calcula y guarda cada salario)
+- obtener_estadisticas() y generar_reporte_detallado()
+- bytes de memoria por empleado (con tracemalloc, sobre una muestra)
+
+Cada medición se AGREGA como una línea JSON al archivo de resultados, con
+la versión (etiqueta libre y commit de git, si hay), la versión de Python
+y la semilla, para comparar corridas de distintas versiones del código:
+
+    python -m clases_objetos.rendimiento_nomina --tamanos 10000 1000000
+    python -m clases_objetos.rendimiento_nomina --version "antes del cambio"
+    python -m clases_objetos.rendimiento_nomina --comparar
+
+La población de 10,000,000 de empleados necesita varios GB de memoria (ver
+bytes_por_empleado en una corrida más chica), así que no se mide por
+defecto; se agrega con --incluir-10m:
+
+    python -m clases_objetos.rendimiento_nomina --incluir-10m
+
+El archivo de resultados se crea en el directorio actual y está en
+.gitignore; --salida permite guardarlo en otra ruta.
+"""
+
+import argparse
+import contextlib
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .empleados_polimorfismo import (
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+    EscalaComision,
+    SistemaNomina,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Tamaños de población medidos por defecto
+TAMANOS = (10_000, 1_000_000)
+
+# Tamaño que solo se mide a pedido (--incluir-10m), por la memoria que usa
+TAMANO_GRANDE = 10_000_000
+
+# Archivo de resultados (una línea JSON por medición)
+ARCHIVO_RESULTADOS = "resultados_nomina.jsonl"
+
+# Empleados usados para medir la memoria por empleado
+MUESTRA_MEMORIA = 20_000
+
+# Operaciones medidas, en el orden en que se ejecutan
+OPERACIONES = (
+    "agregar_empleado",
+    "calcular_nomina_total",
+    "obtener_estadisticas",
+    "generar_reporte_detallado",
+)
+
+_RAIZ_CURSO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_BENEFICIOS = (("Bono de transporte", 200, 0.6), ("Seguro médico", 300, 0.5),
+               ("Bono de alimentación", 150, 0.3))
+
+_ESCALA_VENTAS = EscalaComision([(0, 0.05), (50_000, 0.08), (100_000, 0.12)])
+
+
+@contextlib.contextmanager
+def _sin_mensajes():
+    """Descarta lo que imprimen los constructores y el sistema."""
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        yield
+
+
+def generar_empleados(cantidad, semilla=0):
+    """
+    Genera una población mixta de empleados, siempre igual para una semilla.
+
+    Los constructores imprimen mensajes: conviene llamarla con la salida
+    redirigida.
+
+    Parámetros:
+        cantidad (int): número de empleados
+        semilla (int): semilla del generador aleatorio
+
+    Yields:
+        Empleado: empleados de los cuatro tipos
+    """
+    azar = random.Random(semilla)
+    for numero in range(cantidad):
+        nombre = f"Empleado {numero}"
+        tipo = azar.random()
+        if tipo < 0.4:
+            empleado = EmpleadoTiempoCompleto(nombre, f"TC{numero}", "01/01/2024",
+                                              1_800 + 50 * azar.randrange(145))
+            for beneficio, valor, probabilidad in _BENEFICIOS:
+                if azar.random() < probabilidad:
+                    empleado.agregar_beneficio(beneficio, valor)
+        elif tipo < 0.7:
+            empleado = EmpleadoPorHoras(nombre, f"PH{numero}", "01/01/2024",
+                                        12 + 0.25 * azar.randrange(133))
+            extra = azar.randrange(1, 31) if azar.random() < 0.5 else 0
+            empleado.registrar_horas_lote(azar.randrange(60, 177), extra)
+        elif tipo < 0.9:
+            escala = _ESCALA_VENTAS if azar.random() < 0.1 else None
+            empleado = EmpleadoPorComision(nombre, f"COM{numero}", "01/01/2024",
+                                           800 + 100 * azar.randrange(13),
+                                           azar.choice((0.05, 0.08, 0.10, 0.12)), escala)
+            empleado.registrar_ventas(
+                [round(azar.uniform(200, 20_000), 2) for _ in range(azar.randrange(5, 61))]
+            )
+        else:
+            empleado = EmpleadoFreelance(nombre, f"FR{numero}", "01/01/2024")
+            for proyecto in range(azar.randrange(1, 7)):
+                empleado.agregar_proyecto(f"Proyecto {proyecto}", 250 * azar.randrange(4, 61))
+                if azar.random() < 0.6:
+                    empleado.completar_proyecto(f"Proyecto {proyecto}")
+        yield empleado
+
+
+def medir_memoria(muestra=MUESTRA_MEMORIA, semilla=0):
+    """
+    Bytes de memoria por empleado (objeto, datos y lugar en el sistema).
+
+    Returns:
+        float: bytes por empleado, medidos con tracemalloc sobre la muestra
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with _sin_mensajes():
+            sistema = SistemaNomina("Muestra")
+            inicio = tracemalloc.get_traced_memory()[0]
+            for empleado in generar_empleados(muestra, semilla):
+                sistema.agregar_empleado(empleado)
+            usada = tracemalloc.get_traced_memory()[0] - inicio
+    finally:
+        tracemalloc.stop()
+    return usada / muestra
+
+
+def _commit():
+    """Commit actual de git (None si no hay repositorio o git)."""
+    try:
+        resultado = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_RAIZ_CURSO,
+                                   capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return resultado.stdout.strip() or None
+
+
+def _memoria_maxima_mb():
+    if resource is None:
+        return None
+    maxima = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KiB; macOS, bytes
+    return maxima / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def medir(cantidad, semilla=0, version=None):
+    """
+    Mide las operaciones de SistemaNomina con una población de `cantidad`.
+
+    Parámetros:
+        cantidad (int): número de empleados
+        semilla (int): semilla del generador
+        version (str): etiqueta libre de la versión del código
+
+    Returns:
+        dict: resultado de la medición (ver el docstring del módulo)
+    """
+    resultado = {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "version": version,
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "empleados": cantidad,
+    }
+    with _sin_mensajes():
+        inicio = time.perf_counter()
+        empleados = list(generar_empleados(cantidad, semilla))
+        resultado["generar_s"] = time.perf_counter() - inicio
+
+        sistema = SistemaNomina("Banco de pruebas")
+        tiempos = {}
+        inicio = time.perf_counter()
+        for empleado in empleados:
+            sistema.agregar_empleado(empleado)
+        tiempos["agregar_empleado"] = time.perf_counter() - inicio
+        del empleados
+
+        for operacion in OPERACIONES[1:]:
+            inicio = time.perf_counter()
+            getattr(sistema, operacion)()
+            tiempos[operacion] = time.perf_counter() - inicio
+    for operacion in OPERACIONES:
+        resultado[f"{operacion}_s"] = tiempos[operacion]
+
+    resultado["bytes_por_empleado"] = medir_memoria(min(cantidad, MUESTRA_MEMORIA), semilla)
+    resultado["memoria_maxima_mb"] = _memoria_maxima_mb()
+    return resultado
+
+
+def guardar_resultado(resultado, ruta=ARCHIVO_RESULTADOS):
+    """Agrega una medición al archivo de resultados (JSON Lines)."""
+    with open(ruta, "a", encoding="utf-8") as archivo:
+        archivo.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+
+def leer_resultados(ruta=ARCHIVO_RESULTADOS):
+    """Lee todas las mediciones guardadas (lista vacía si no hay archivo)."""
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def comparar(resultados):
+    """
+    Muestra las mediciones agrupadas por tamaño, una fila por corrida.
+
+    Parámetros:
+        resultados (list): mediciones (ver leer_resultados())
+    """
+    columnas = [f"{operacion}_s" for operacion in OPERACIONES]
+    for cantidad in sorted({r["empleados"] for r in resultados}):
+        print(f"\n{cantidad:,} empleados")
+        print(f"{'versión':<24}" + "".join(f"{c[:-2][:22]:>24}" for c in columnas)
+              + f"{'bytes/emp':>12}")
+        for r in (r for r in resultados if r["empleados"] == cantidad):
+            etiqueta = " ".join(filter(None, (r.get("version"), r.get("commit")))) or r["fecha"]
+            print(f"{etiqueta[:23]:<24}" + "".join(f"{r[c]:>23.3f}s" for c in columnas)
+                  + f"{r['bytes_por_empleado']:>12,.0f}")
+
+
+def main(argumentos=None):
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS))
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--version", default=None, help="etiqueta de la versión medida")
+    parser.add_argument("--incluir-10m", action="store_true",
+                        help=f"medir también {TAMANO_GRANDE:,} empleados (varios GB)")
+    parser.add_argument("--salida", default=ARCHIVO_RESULTADOS)
+    parser.add_argument("--comparar", action="store_true",
+                        help="solo mostrar los resultados guardados")
+    opciones = parser.parse_args(argumentos)
+
+    tamanos = list(opciones.tamanos)
+    if opciones.incluir_10m and TAMANO_GRANDE not in tamanos:
+        tamanos.append(TAMANO_GRANDE)
+
+    if not opciones.comparar:
+        for cantidad in tamanos:
+            resultado = medir(cantidad, opciones.semilla, opciones.version)
+            guardar_resultado(resultado, opciones.salida)
+            print(f"✓ {cantidad:,} empleados medidos: "
+                  + ", ".join(f"{o} {resultado[o + '_s']:.3f} s" for o in OPERACIONES)
+                  + f", {resultado['bytes_por_empleado']:,.0f} bytes/empleado")
+    comparar(leer_resultados(opciones.salida))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
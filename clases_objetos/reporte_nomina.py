@@ -0,0 +1,197 @@
+"""
+EXPORTACIÓN DEL REPORTE DE NÓMINA EN STREAMING
+==============================================
+
+SistemaNomina.generar_reporte_detallado() imprime el bloque de
+mostrar_informacion() de cada empleado. Para guardar el reporte de un
+millón de empleados en un archivo, exportar_reporte() escribe fila por
+fila en cualquier archivo:
+
+    "csv"    -> una fila por empleado (columnas de COLUMNAS_CSV)
+    "jsonl"  -> un objeto JSON por línea con todos los campos de
+                datos_reporte() (incluye los de subclases propias)
+    "texto"  -> el mismo formato de generar_reporte_detallado()
+
+Cada tipo de empleado aporta sus datos por POLIMORFISMO:
+datos_reporte() para CSV/JSON Lines y lineas_informacion() para el texto.
+Ninguna fila se guarda después de escribirse, así que la memoria usada no
+depende de la cantidad de empleados. Las escrituras pasan por un buffer
+grande y, si el destino termina en ".gz" (o comprimir=True), se comprimen
+con gzip mientras se escriben.
+
+Los montos (Dinero) se escriben con dos decimales exactos en CSV y texto,
+y como número en JSON Lines.
+
+Uso:
+    exportar_reporte(sistema, "reporte.csv")
+    exportar_reporte(sistema, "reporte.jsonl.gz")
+    exportar_reporte(sistema, sys.stdout, formato="texto")
+"""
+
+import csv
+import gzip
+import io
+import json
+
+from .dinero import Dinero
+
+
+# Columnas del CSV: datos comunes y luego los de cada tipo de empleado.
+# Los campos que un empleado no tiene quedan vacíos.
+COLUMNAS_CSV = (
+    "numero", "tipo", "nombre", "identificacion", "fecha_ingreso", "activo", "salario",
+    "salario_mensual", "beneficios",
+    "tarifa_por_hora", "horas_trabajadas", "horas_extra",
+    "salario_base", "comision", "total_ventas", "comision_ganada",
+    "proyectos", "proyectos_completados", "proyectos_pendientes",
+)
+
+FORMATOS = ("csv", "jsonl", "texto")
+
+# Tamaño del buffer de escritura (bytes)
+TAMANO_BUFFER = 1 << 20
+
+_EXTENSIONES = {".csv": "csv", ".jsonl": "jsonl", ".json": "jsonl", ".txt": "texto"}
+
+
+def _detectar_formato(destino, formato):
+    if formato is not None:
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato} (use {', '.join(FORMATOS)})")
+        return formato
+    nombre = destino if isinstance(destino, str) else getattr(destino, "name", "")
+    if isinstance(nombre, str) and nombre.endswith(".gz"):
+        nombre = nombre[:-3]
+    for extension, deducido in _EXTENSIONES.items():
+        if isinstance(nombre, str) and nombre.endswith(extension):
+            return deducido
+    raise ValueError("No se pudo deducir el formato: indique formato='csv', 'jsonl' o 'texto'")
+
+
+def _abrir(destino, comprimir, tamano_buffer):
+    """
+    Prepara el flujo de texto de salida.
+
+    Returns:
+        tuple: (flujo de texto, función para cerrar lo que se abrió aquí)
+    """
+    if isinstance(destino, str):
+        if comprimir or (comprimir is None and destino.endswith(".gz")):
+            binario = open(destino, "wb", buffering=tamano_buffer)
+            comprimido = gzip.GzipFile(fileobj=binario, mode="wb")
+            flujo = io.TextIOWrapper(comprimido, encoding="utf-8", newline="")
+
+            def cerrar():
+                flujo.close()
+                binario.close()
+            return flujo, cerrar
+        flujo = open(destino, "w", encoding="utf-8", newline="", buffering=tamano_buffer)
+        return flujo, flujo.close
+
+    if comprimir:
+        # destino es un archivo binario ya abierto: se comprime dentro de él
+        comprimido = gzip.GzipFile(fileobj=destino, mode="wb")
+        flujo = io.TextIOWrapper(
+            io.BufferedWriter(comprimido, buffer_size=tamano_buffer),
+            encoding="utf-8", newline="",
+        )
+
+        def cerrar():
+            flujo.flush()
+            flujo.detach().detach()  # no cerrar el archivo del usuario
+            comprimido.close()
+        return flujo, cerrar
+    return destino, destino.flush
+
+
+def _texto(valor):
+    """Valor de una celda CSV."""
+    if isinstance(valor, Dinero):
+        return format(valor, ".2f")
+    return valor
+
+
+def _json(valor):
+    """Convierte a JSON los valores que json no conoce (Dinero)."""
+    if isinstance(valor, Dinero):
+        return valor.centavos / 100
+    raise TypeError(f"Valor no serializable: {type(valor).__name__}")
+
+
+def filas_reporte(empleados):
+    """
+    Genera los datos de reporte de cada empleado, uno a la vez.
+
+    Parámetros:
+        empleados (SistemaNomina | iterable): sistema o empleados
+
+    Yields:
+        dict: datos_reporte() de cada empleado
+    """
+    for empleado in getattr(empleados, "empleados", empleados):
+        yield empleado.datos_reporte()
+
+
+def _escribir_csv(flujo, empleados, columnas):
+    escritor = csv.writer(flujo)
+    escritor.writerow(columnas)
+    cantidad = 0
+    for datos in filas_reporte(empleados):
+        escritor.writerow([_texto(datos.get(columna, "")) for columna in columnas])
+        cantidad += 1
+    return cantidad
+
+
+def _escribir_jsonl(flujo, empleados):
+    codificar = json.JSONEncoder(ensure_ascii=False, default=_json).encode
+    escribir = flujo.write
+    cantidad = 0
+    for datos in filas_reporte(empleados):
+        escribir(codificar(datos))
+        escribir("\n")
+        cantidad += 1
+    return cantidad
+
+
+def _escribir_texto(flujo, sistema, empleados):
+    escribir = flujo.write
+    nombre_empresa = getattr(sistema, "nombre_empresa", "")
+    escribir(f"\n{'='*70}\n")
+    escribir(f"REPORTE DETALLADO DE EMPLEADOS - {nombre_empresa}\n")
+    escribir(f"{'='*70}\n")
+    cantidad = 0
+    for empleado in empleados:
+        flujo.writelines(empleado.lineas_informacion())
+        escribir("\n")
+        cantidad += 1
+    return cantidad
+
+
+def exportar_reporte(sistema, destino, formato=None, comprimir=None, columnas=COLUMNAS_CSV,
+                     tamano_buffer=TAMANO_BUFFER):
+    """
+    Escribe el reporte de nómina de todos los empleados en un archivo.
+
+    Parámetros:
+        sistema (SistemaNomina | iterable): sistema o lista de empleados
+        destino (str | archivo): ruta, o archivo ya abierto (de texto; de
+                                 bytes si comprimir=True)
+        formato (str): "csv", "jsonl" o "texto" (default: según la extensión)
+        comprimir (bool): comprimir con gzip (default: si la ruta termina en .gz)
+        columnas (tuple): columnas del CSV
+        tamano_buffer (int): bytes del buffer de escritura
+
+    Returns:
+        int: cantidad de empleados exportados
+    """
+    formato = _detectar_formato(destino, formato)
+    empleados = getattr(sistema, "empleados", sistema)
+    flujo, cerrar = _abrir(destino, comprimir, tamano_buffer)
+    try:
+        if formato == "csv":
+            return _escribir_csv(flujo, empleados, columnas)
+        if formato == "jsonl":
+            return _escribir_jsonl(flujo, empleados)
+        return _escribir_texto(flujo, sistema, empleados)
+    finally:
+        cerrar()
@@ -0,0 +1,404 @@
+"""
+SERIALIZACIÓN BINARIA COMPACTA DE ANIMALES
+==========================================
+
+pickle repite en cada registro la ruta de la clase y el nombre de cada
+atributo. Para guardar poblaciones grandes (checkpoints) este módulo define
+un formato binario versionado:
+
+    CABECERA   magia "ANMB" | versión | cantidad de registros | posición de la tabla
+    REGISTROS  etiqueta de clase (1 byte) + campos de ancho fijo (struct)
+    TABLA      todos los textos (nombres, razas, estados...) una sola vez
+
+- Cada clase (Animal, Mamifero, Oviparo, Perro, Gato, Aguila, Pinguino) tiene
+  una etiqueta y un esquema de campos; las subclases extienden el de su padre
+- Los textos se guardan como índices en la tabla de cadenas compartida
+- Las listas de textos (trucos) son una entrada de la tabla con cada
+  elemento precedido por su largo, así que cualquier texto (vacío o con
+  cualquier carácter) se recupera igual
+- La lectura decodifica directamente sobre un memoryview (sin copiar el
+  buffer) y puede trabajar sobre un archivo mapeado en memoria (mmap)
+- Solo se guardan los campos del esquema: un animal con atributos extra
+  (asignados después de crearlo) no se puede serializar sin perderlos, así
+  que serializar() lo rechaza con ValueError en lugar de descartarlos
+
+TIPOS DE LOS CAMPOS:
+- edad, numero_patas, vidas, altura_vuelo_max, velocidad_nado: enteros
+- peso, temperatura_corporal, envergadura: reales (float)
+
+Uso:
+    guardar_archivo(animales, "poblacion.anmb")
+    with LectorAnimales.abrir("poblacion.anmb") as lector:
+        for animal in lector: ...
+"""
+
+import mmap
+import pickle
+import struct
+import time
+
+from .animales_herencia import Aguila, Animal, Gato, Mamifero, Oviparo, Perro, Pinguino
+
+
+MAGIA = b"ANMB"
+# Versión 2: listas de textos con largo por elemento (la 1 usaba un separador)
+VERSION = 2
+
+# magia, versión, reservado, cantidad de registros, posición de la tabla de cadenas
+_CABECERA = struct.Struct("<4sHHQQ")
+_ENTERO = struct.Struct("<I")
+_POSICION = struct.Struct("<Q")
+
+# Separador de los elementos de una lista de textos en la versión 1
+_SEPARADOR_LISTA = "\x1f"
+
+# Códigos de campo: "s" = texto (índice en la tabla), "l" = lista de textos,
+# el resto son códigos de struct
+_CAMPOS_ANIMAL = (("nombre", "s"), ("edad", "q"), ("peso", "d"), ("estado", "s"))
+_CAMPOS_MAMIFERO = _CAMPOS_ANIMAL + (
+    ("tipo_pelaje", "s"), ("numero_patas", "H"), ("temperatura_corporal", "d"),
+)
+_CAMPOS_OVIPARO = _CAMPOS_ANIMAL + (("tipo_huevo", "s"), ("puede_volar", "?"))
+
+# Orden de las clases = etiqueta (posición + 1). Solo se agregan al final
+# para que los archivos de versiones anteriores sigan siendo legibles.
+ESQUEMAS = (
+    (Animal, _CAMPOS_ANIMAL),
+    (Mamifero, _CAMPOS_MAMIFERO),
+    (Oviparo, _CAMPOS_OVIPARO),
+    (Perro, _CAMPOS_MAMIFERO + (("raza", "s"), ("trucos", "l"))),
+    (Gato, _CAMPOS_MAMIFERO + (("color", "s"), ("vidas", "H"))),
+    (Aguila, _CAMPOS_OVIPARO + (("envergadura", "d"), ("altura_vuelo_max", "q"))),
+    (Pinguino, _CAMPOS_OVIPARO + (("especie", "s"), ("velocidad_nado", "q"))),
+)
+
+
+class _Formato:
+    """Esquema compilado de una clase: etiqueta, struct y tipo de cada campo."""
+
+    def __init__(self, etiqueta, clase, campos):
+        self.etiqueta = etiqueta
+        self.clase = clase
+        self.nombres = tuple(nombre for nombre, _ in campos)
+        self.codigos = tuple(codigo for _, codigo in campos)
+        # La etiqueta va incluida al inicio del struct de cada registro
+        self.struct = struct.Struct(
+            "<B" + "".join("I" if codigo in "sl" else codigo for codigo in self.codigos)
+        )
+        # Posiciones de los campos de texto y de lista de textos
+        self.textos = tuple(i for i, codigo in enumerate(self.codigos) if codigo == "s")
+        self.listas = tuple(i for i, codigo in enumerate(self.codigos) if codigo == "l")
+
+
+_FORMATOS = tuple(
+    _Formato(etiqueta, clase, campos)
+    for etiqueta, (clase, campos) in enumerate(ESQUEMAS, 1)
+)
+_FORMATO_POR_CLASE = {formato.clase: formato for formato in _FORMATOS}
+_FORMATO_POR_ETIQUETA = {formato.etiqueta: formato for formato in _FORMATOS}
+
+
+# ============================================================================
+# ESCRITURA
+# ============================================================================
+
+def serializar(animales):
+    """
+    Convierte una colección de animales al formato binario.
+
+    Parámetros:
+        animales (iterable): objetos de las clases de ESQUEMAS (clase exacta)
+
+    Returns:
+        bytes: contenido completo (cabecera + registros + tabla de cadenas)
+
+    Raises:
+        TypeError: si un animal no es de una clase de ESQUEMAS
+        ValueError: si un animal tiene atributos fuera de su esquema
+    """
+    cadenas = {}
+    registros = bytearray(_CABECERA.size)
+    cantidad = 0
+
+    for animal in animales:
+        formato = _FORMATO_POR_CLASE.get(type(animal))
+        if formato is None:
+            raise TypeError(f"Clase sin esquema de serialización: {type(animal).__name__}")
+        atributos = animal.__dict__
+        if len(atributos) != len(formato.nombres):
+            extra = sorted(set(atributos).difference(formato.nombres))
+            if extra:
+                raise ValueError(
+                    f"{type(animal).__name__} {atributos.get('nombre')!r} tiene atributos "
+                    f"fuera del esquema de serialización: {', '.join(extra)}"
+                )
+        valores = [formato.etiqueta]
+        valores += [atributos[nombre] for nombre in formato.nombres]
+        for i in formato.listas:
+            valores[i + 1] = tuple(valores[i + 1])
+        for i in formato.textos + formato.listas:
+            texto = valores[i + 1]
+            indice = cadenas.get(texto)
+            if indice is None:
+                indice = cadenas[texto] = len(cadenas)
+            valores[i + 1] = indice
+        registros += formato.struct.pack(*valores)
+        cantidad += 1
+
+    posicion_tabla = len(registros)
+    _CABECERA.pack_into(registros, 0, MAGIA, VERSION, 0, cantidad, posicion_tabla)
+
+    # Tabla: cantidad, posiciones finales de cada entrada y las entradas:
+    # textos en UTF-8, y listas como (largo, UTF-8) por elemento
+    codificadas = [
+        texto.encode("utf-8") if isinstance(texto, str) else _codificar_lista(texto)
+        for texto in cadenas
+    ]
+    fines = []
+    total = 0
+    for codificada in codificadas:
+        total += len(codificada)
+        fines.append(total)
+    registros += _ENTERO.pack(len(codificadas))
+    registros += struct.pack(f"<{len(fines)}Q", *fines)
+    registros += b"".join(codificadas)
+    return bytes(registros)
+
+
+def _codificar_lista(textos):
+    partes = []
+    for texto in textos:
+        codificado = texto.encode("utf-8")
+        partes.append(_ENTERO.pack(len(codificado)))
+        partes.append(codificado)
+    return b"".join(partes)
+
+
+def guardar_archivo(animales, ruta):
+    """
+    Guarda los animales en un archivo binario.
+
+    Parámetros:
+        animales (iterable): animales a guardar
+        ruta (str): ruta del archivo
+    """
+    with open(ruta, "wb") as archivo:
+        archivo.write(serializar(animales))
+
+
+# ============================================================================
+# LECTURA
+# ============================================================================
+
+class LectorAnimales:
+    """
+    Lector de un buffer en formato binario de animales.
+
+    Trabaja sobre un memoryview del buffer (bytes, bytearray o mmap): los
+    registros se decodifican con struct.unpack_from sin copiar el buffer, y
+    cada texto de la tabla se decodifica una sola vez, la primera vez que se usa.
+    """
+
+    def __init__(self, buffer):
+        """
+        Constructor del lector.
+
+        Parámetros:
+            buffer: objeto compatible con el protocolo de buffer
+        """
+        self._mapa = None
+        self._vista = memoryview(buffer)
+        try:
+            magia, version, _, cantidad, posicion_tabla = _CABECERA.unpack_from(self._vista, 0)
+            if magia != MAGIA:
+                raise ValueError("El buffer no está en formato binario de animales")
+            if version > VERSION:
+                raise ValueError(f"Versión de formato no soportada: {version}")
+            (cantidad_cadenas,) = _ENTERO.unpack_from(self._vista, posicion_tabla)
+        except BaseException:
+            self._vista.release()
+            raise
+        self.version = version
+        self.cantidad = cantidad
+
+        inicio_fines = posicion_tabla + _ENTERO.size
+        self._inicio_fines = inicio_fines
+        self._inicio_textos = inicio_fines + _POSICION.size * cantidad_cadenas
+        self._cadenas = [None] * cantidad_cadenas
+        self._listas = {}      # índice -> tupla de textos ya decodificada
+        self._posiciones = None
+
+    @classmethod
+    def abrir(cls, ruta):
+        """
+        Abre un archivo mapeándolo en memoria (mmap, solo lectura).
+
+        Usar con "with" para cerrar el mapa al terminar. Si el archivo no
+        es válido, el mapa se cierra antes de propagar el error.
+        """
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            lector = cls(mapa)
+        except BaseException:
+            mapa.close()
+            raise
+        lector._mapa = mapa
+        return lector
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        """Libera las vistas y cierra el archivo mapeado (si lo hay)."""
+        self._vista.release()
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def __len__(self):
+        return self.cantidad
+
+    def _entrada(self, indice):
+        """Bytes (memoryview) de la entrada de la tabla en el índice."""
+        fines = self._inicio_fines
+        inicio = _POSICION.unpack_from(self._vista, fines + 8 * (indice - 1))[0] if indice else 0
+        fin = _POSICION.unpack_from(self._vista, fines + 8 * indice)[0]
+        base = self._inicio_textos
+        return self._vista[base + inicio:base + fin]
+
+    def _cadena(self, indice):
+        texto = self._cadenas[indice]
+        if texto is None:
+            texto = self._cadenas[indice] = str(self._entrada(indice), "utf-8")
+        return texto
+
+    def _lista(self, indice):
+        """Lista de textos de la entrada (una lista nueva en cada llamada)."""
+        textos = self._listas.get(indice)
+        if textos is None:
+            if self.version == 1:
+                texto = self._cadena(indice)
+                textos = tuple(texto.split(_SEPARADOR_LISTA)) if texto else ()
+            else:
+                textos = []
+                with self._entrada(indice) as entrada:
+                    posicion = 0
+                    while posicion < len(entrada):
+                        (largo,) = _ENTERO.unpack_from(entrada, posicion)
+                        posicion += _ENTERO.size
+                        textos.append(str(entrada[posicion:posicion + largo], "utf-8"))
+                        posicion += largo
+                textos = tuple(textos)
+            self._listas[indice] = textos
+        return list(textos)
+
+    def _decodificar(self, posicion):
+        """Decodifica el registro en la posición; retorna (animal, siguiente)."""
+        vista = self._vista
+        formato = _FORMATO_POR_ETIQUETA.get(vista[posicion])
+        if formato is None:
+            raise ValueError(f"Etiqueta de clase desconocida: {vista[posicion]}")
+        valores = list(formato.struct.unpack_from(vista, posicion))
+        del valores[0]  # etiqueta
+
+        cadenas = self._cadenas
+        for i in formato.textos:
+            texto = cadenas[valores[i]]
+            valores[i] = texto if texto is not None else self._cadena(valores[i])
+        for i in formato.listas:
+            valores[i] = self._lista(valores[i])
+
+        # Se crea el objeto sin llamar al constructor (que imprime mensajes)
+        animal = object.__new__(formato.clase)
+        animal.__dict__.update(zip(formato.nombres, valores))
+        return animal, posicion + formato.struct.size
+
+    def __iter__(self):
+        posicion = _CABECERA.size
+        for _ in range(self.cantidad):
+            animal, posicion = self._decodificar(posicion)
+            yield animal
+
+    def __getitem__(self, indice):
+        """Acceso aleatorio (la primera llamada indexa las posiciones)."""
+        if self._posiciones is None:
+            posiciones = []
+            posicion = _CABECERA.size
+            vista = self._vista
+            for _ in range(self.cantidad):
+                posiciones.append(posicion)
+                posicion += _FORMATO_POR_ETIQUETA[vista[posicion]].struct.size
+            self._posiciones = posiciones
+        return self._decodificar(self._posiciones[indice])[0]
+
+
+def deserializar(buffer):
+    """
+    Decodifica todos los animales de un buffer.
+
+    Returns:
+        list: objetos animales reconstruidos
+    """
+    lector = LectorAnimales(buffer)
+    try:
+        return list(lector)
+    finally:
+        lector.cerrar()
+
+
+def cargar_archivo(ruta):
+    """Carga todos los animales de un archivo (mapeado en memoria)."""
+    with LectorAnimales.abrir(ruta) as lector:
+        return list(lector)
+
+
+# ============================================================================
+# COMPARACIÓN CON PICKLE
+# ============================================================================
+
+def comparar_con_pickle(cantidad=100_000):
+    """
+    Compara tamaño y velocidad del formato binario contra pickle.
+
+    Parámetros:
+        cantidad (int): número de animales de prueba
+
+    Returns:
+        dict: {"binario": {...}, "pickle": {...}} con bytes, segundos de
+              escritura y segundos de lectura
+    """
+    import contextlib
+    import io
+
+    especies = ((Perro, "Labrador"), (Gato, "negro"), (Aguila, 2.3), (Pinguino, "Emperador"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        animales = [
+            especies[i % 4][0](f"Animal {i % 1000}", i % 15, 5.0 + i % 40, especies[i % 4][1])
+            for i in range(cantidad)
+        ]
+
+    resultados = {}
+    for nombre, escribir, leer in (
+        ("binario", serializar, deserializar),
+        ("pickle", lambda datos: pickle.dumps(datos, protocol=pickle.HIGHEST_PROTOCOL),
+         pickle.loads),
+    ):
+        inicio = time.perf_counter()
+        contenido = escribir(animales)
+        escritura = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        leer(contenido)
+        lectura = time.perf_counter() - inicio
+        resultados[nombre] = {"bytes": len(contenido), "escritura": escritura, "lectura": lectura}
+    return resultados
+
+
+if __name__ == "__main__":
+    resultados = comparar_con_pickle()
+    print(f"{'Formato':<10}{'Bytes':>14}{'Escritura (s)':>16}{'Lectura (s)':>14}")
+    for nombre, datos in resultados.items():
+        print(f"{nombre:<10}{datos['bytes']:>14,}{datos['escritura']:>16.3f}{datos['lectura']:>14.3f}")
@@ -0,0 +1,367 @@
+"""
+SIMULACIÓN PARALELA DE ANIMALES CON MEMORIA COMPARTIDA
+======================================================
+
+Un intérprete de Python solo usa un núcleo. Para simular poblaciones grandes
+de animales en varios núcleos, este módulo:
+
+1. Copia el estado numérico de los animales a arreglos en memoria compartida
+   (multiprocessing.shared_memory):
+
+       edad | peso | temperatura_corporal | estado
+
+2. Divide la población en FRAGMENTOS contiguos, uno por proceso trabajador
+3. Cada trabajador avanza su fragmento un tick y espera en una BARRERA a los
+   demás, de modo que todos los procesos empiezan cada tick al mismo tiempo
+4. Al final, volcar() escribe el estado de vuelta en los objetos
+
+Como cada animal solo depende de su propio estado, el resultado es idéntico
+sin importar el número de procesos.
+
+Uso:
+    with SimulacionParalela(animales) as simulacion:
+        simulacion.ejecutar(ticks=365, procesos=4)
+        simulacion.volcar()
+
+Benchmark de escalado (1 a 16 núcleos):
+    python -m clases_objetos.simulacion_paralela
+"""
+
+import math
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+
+
+# Códigos de estado guardados en la columna "estado"
+ESTADOS = ("vivo", "muerto")
+VIVO, MUERTO = 0, 1
+
+# Parámetros del paso diario por defecto
+DIAS_POR_ANIO = 365
+ESPERANZA_VIDA = 20          # años
+TEMPERATURA_OBJETIVO = 37.0  # °C, mamíferos
+AJUSTE_TEMPERATURA = 0.1     # fracción que se corrige por tick
+CRECIMIENTO_JUVENIL = 0.001  # aumento diario de peso antes de los 2 años
+
+# Segundos máximos de espera en la barrera por tick (un trabajador colgado
+# o terminado a la fuerza no bloquea la simulación para siempre)
+TIEMPO_ESPERA = 600
+
+# Columnas de tipo float64 en el bloque compartido, en orden
+_COLUMNAS_REALES = ("edad", "peso", "temperatura_corporal")
+
+
+def paso_diario(columnas, inicio, fin, tick):
+    """
+    Avanza un día a los animales del fragmento [inicio, fin).
+
+    - Los animales vivos envejecen un día
+    - Los jóvenes (menos de 2 años) ganan peso
+    - Los mamíferos regulan su temperatura hacia 37 °C
+    - Al superar la esperanza de vida el animal pasa a "muerto"
+
+    Parámetros:
+        columnas (dict): {nombre: memoryview} con edad, peso,
+                         temperatura_corporal y estado
+        inicio, fin (int): rango de animales a procesar
+        tick (int): número de tick (no se usa en el paso por defecto)
+    """
+    edad = columnas["edad"]
+    peso = columnas["peso"]
+    temperatura = columnas["temperatura_corporal"]
+    estado = columnas["estado"]
+    dia = 1 / DIAS_POR_ANIO
+
+    for i in range(inicio, fin):
+        if estado[i] == MUERTO:
+            continue
+        e = edad[i] + dia
+        edad[i] = e
+        if e < 2:
+            peso[i] *= 1 + CRECIMIENTO_JUVENIL
+        t = temperatura[i]
+        if t == t:  # NaN = el animal no es mamífero
+            temperatura[i] = t + (TEMPERATURA_OBJETIVO - t) * AJUSTE_TEMPERATURA
+        if e > ESPERANZA_VIDA:
+            estado[i] = MUERTO
+
+
+def _vistas(memoria, cantidad):
+    """Crea las vistas tipadas de cada columna sobre el bloque compartido."""
+    columnas = {}
+    desplazamiento = 0
+    for nombre in _COLUMNAS_REALES:
+        columnas[nombre] = memoria.buf[desplazamiento:desplazamiento + 8 * cantidad].cast("d")
+        desplazamiento += 8 * cantidad
+    columnas["estado"] = memoria.buf[desplazamiento:desplazamiento + cantidad].cast("b")
+    return columnas
+
+
+def _liberar(columnas):
+    """Libera las vistas (necesario antes de cerrar la memoria compartida)."""
+    for vista in columnas.values():
+        vista.release()
+
+
+def _trabajador(nombre_memoria, cantidad, inicio, fin, ticks, barrera, paso, sincronizar,
+                tiempo_espera):
+    """
+    Proceso trabajador: avanza su fragmento tick a tick.
+
+    Después de cada tick espera en la barrera; si el proceso principal
+    necesita leer el estado entre ticks, espera una segunda vez hasta que
+    el principal termine.
+
+    Si el paso falla, ROMPE la barrera (abort) antes de propagar el error,
+    para que el principal y los demás trabajadores no esperen para siempre.
+    Si otro proceso rompió la barrera, el trabajador termina sin error: el
+    principal ya sabe cuál falló.
+    """
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    columnas = _vistas(memoria, cantidad)
+    try:
+        for tick in range(ticks):
+            paso(columnas, inicio, fin, tick)
+            barrera.wait(tiempo_espera)
+            if sincronizar:
+                barrera.wait(tiempo_espera)
+    except threading.BrokenBarrierError:
+        return
+    except BaseException:
+        barrera.abort()
+        raise
+    finally:
+        _liberar(columnas)
+        memoria.close()
+
+
+def particionar(cantidad, fragmentos):
+    """
+    Divide range(cantidad) en fragmentos contiguos de tamaño casi igual.
+
+    Returns:
+        list: [(inicio, fin)] sin fragmentos vacíos
+    """
+    fragmentos = max(1, min(fragmentos, cantidad))
+    base, sobrante = divmod(cantidad, fragmentos)
+    rangos = []
+    inicio = 0
+    for i in range(fragmentos):
+        fin = inicio + base + (1 if i < sobrante else 0)
+        rangos.append((inicio, fin))
+        inicio = fin
+    return rangos
+
+
+class SimulacionParalela:
+    """
+    Estado numérico de una población de animales en memoria compartida.
+
+    Atributos:
+        animales (list): objetos originales (para volcar el resultado)
+        cantidad (int): número de animales
+    """
+
+    def __init__(self, animales):
+        """
+        Copia el estado de los animales a un bloque de memoria compartida.
+
+        Parámetros:
+            animales (iterable): objetos de la jerarquía Animal. Los que no
+                                 tienen temperatura_corporal (no mamíferos)
+                                 se marcan con NaN en esa columna.
+        """
+        self.animales = list(animales)
+        self.cantidad = len(self.animales)
+        # Valores originales: volcar() los restaura donde la simulación no
+        # cambió nada (edades con fracción, estados distintos de vivo/muerto)
+        self.edades_originales = [animal.edad for animal in self.animales]
+        self.estados_originales = [animal.estado for animal in self.animales]
+        tamano = max(1, self.cantidad * (8 * len(_COLUMNAS_REALES) + 1))
+        self.memoria = shared_memory.SharedMemory(create=True, size=tamano)
+        self.columnas = _vistas(self.memoria, self.cantidad)
+
+        edad = self.columnas["edad"]
+        peso = self.columnas["peso"]
+        temperatura = self.columnas["temperatura_corporal"]
+        estado = self.columnas["estado"]
+        try:
+            for i, animal in enumerate(self.animales):
+                edad[i] = animal.edad
+                peso[i] = animal.peso
+                temperatura[i] = getattr(animal, "temperatura_corporal", math.nan)
+                estado[i] = MUERTO if animal.estado == "muerto" else VIVO
+        except BaseException:
+            self.cerrar()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def ejecutar(self, ticks, procesos=1, paso=paso_diario, al_terminar_tick=None,
+                 tiempo_espera=TIEMPO_ESPERA):
+        """
+        Ejecuta la simulación repartiendo los animales entre procesos.
+
+        Parámetros:
+            ticks (int): número de pasos a simular
+            procesos (int): número de procesos trabajadores
+            paso (callable): función paso(columnas, inicio, fin, tick); debe
+                             estar definida a nivel de módulo para poder
+                             usarse en otros procesos
+            al_terminar_tick (callable): función opcional f(tick, columnas) que
+                                         el proceso principal llama entre ticks,
+                                         con todos los trabajadores detenidos
+            tiempo_espera (float): segundos máximos de espera por tick
+
+        Returns:
+            float: segundos que tardó la simulación
+
+        Raises:
+            RuntimeError: si un trabajador falla o no llega a tiempo a la
+                          barrera; la memoria compartida se libera, así
+                          que el objeto ya no puede volver a usarse
+        """
+        rangos = particionar(self.cantidad, procesos)
+        sincronizar = al_terminar_tick is not None
+        barrera = multiprocessing.Barrier(len(rangos) + 1)
+        trabajadores = [
+            multiprocessing.Process(
+                target=_trabajador,
+                args=(self.memoria.name, self.cantidad, inicio, fin, ticks,
+                      barrera, paso, sincronizar, tiempo_espera),
+            )
+            for inicio, fin in rangos
+        ]
+
+        inicio_tiempo = time.perf_counter()
+        completo = False
+        try:
+            for trabajador in trabajadores:
+                trabajador.start()
+            interrumpida = True
+            try:
+                for tick in range(ticks):
+                    barrera.wait(tiempo_espera)
+                    if sincronizar:
+                        al_terminar_tick(tick, self.columnas)
+                        barrera.wait(tiempo_espera)
+                interrumpida = False
+            except threading.BrokenBarrierError:
+                pass
+            finally:
+                if interrumpida:
+                    barrera.abort()
+                for trabajador in trabajadores:
+                    trabajador.join(tiempo_espera)
+                    if trabajador.is_alive():
+                        trabajador.terminate()
+                        trabajador.join()
+            duracion = time.perf_counter() - inicio_tiempo
+
+            fallidos = [t for t in trabajadores if t.exitcode != 0]
+            if fallidos:
+                codigos = ", ".join(str(t.exitcode) for t in fallidos)
+                raise RuntimeError(
+                    f"{len(fallidos)} proceso(s) trabajador(es) fallaron (código {codigos})"
+                )
+            if interrumpida:
+                raise RuntimeError("la simulación se interrumpió: un trabajador no llegó "
+                                   "a tiempo a la barrera")
+            completo = True
+        finally:
+            if not completo:
+                self.cerrar()
+        return duracion
+
+    def volcar(self):
+        """
+        Escribe el estado simulado de vuelta en los objetos animales.
+
+        La edad se guarda en la simulación con fracciones de año. Si el animal
+        tenía una edad entera, en el objeto se conserva la edad en años
+        cumplidos, como la usan las clases; si ya tenía fracción, se escribe
+        la edad simulada completa. El estado original (por ejemplo
+        "hibernando") se conserva salvo que el animal haya muerto en la
+        simulación, y los valores que la simulación no cambió se restauran
+        tal cual.
+        """
+        edad = self.columnas["edad"]
+        peso = self.columnas["peso"]
+        temperatura = self.columnas["temperatura_corporal"]
+        estado = self.columnas["estado"]
+        for i, animal in enumerate(self.animales):
+            edad_original = self.edades_originales[i]
+            if edad[i] == edad_original:
+                animal.edad = edad_original
+            elif isinstance(edad_original, int):
+                animal.edad = int(edad[i])
+            else:
+                animal.edad = edad[i]
+            animal.peso = peso[i]
+            if hasattr(animal, "temperatura_corporal"):
+                animal.temperatura_corporal = temperatura[i]
+            estado_original = self.estados_originales[i]
+            if estado[i] == (MUERTO if estado_original == "muerto" else VIVO):
+                animal.estado = estado_original
+            else:
+                animal.estado = ESTADOS[estado[i]]
+
+    def cerrar(self):
+        """Libera la memoria compartida."""
+        if self.memoria is None:
+            return
+        _liberar(self.columnas)
+        self.memoria.close()
+        self.memoria.unlink()
+        self.memoria = None
+
+
+def medir_escalado(cantidad=1_000_000, ticks=10, procesos=(1, 2, 4, 8, 16)):
+    """
+    Mide la eficiencia de escalado de la simulación al agregar procesos.
+
+    eficiencia = tiempo con 1 proceso / (procesos × tiempo con N procesos)
+
+    Parámetros:
+        cantidad (int): número de animales simulados
+        ticks (int): ticks por medición
+        procesos (tuple): cantidades de procesos a medir
+
+    Returns:
+        list: [(procesos, segundos, aceleración, eficiencia)]
+    """
+    from .animales_herencia import Animal
+
+    # Objetos livianos: se evita el constructor (imprime un mensaje por animal)
+    animales = []
+    for i in range(cantidad):
+        animal = object.__new__(Animal)
+        animal.__dict__.update(nombre=f"Animal {i}", edad=i % 15, peso=10.0, estado="vivo")
+        animales.append(animal)
+
+    # Cada medición parte de la misma población: la simulación modifica el
+    # bloque compartido, así que se crea uno nuevo por cantidad de procesos
+    resultados = []
+    base = None
+    for cantidad_procesos in procesos:
+        with SimulacionParalela(animales) as simulacion:
+            segundos = simulacion.ejecutar(ticks, procesos=cantidad_procesos)
+        base = base or segundos
+        aceleracion = base / segundos
+        resultados.append(
+            (cantidad_procesos, segundos, aceleracion, aceleracion / cantidad_procesos)
+        )
+    return resultados
+
+
+if __name__ == "__main__":
+    print(f"Núcleos disponibles: {multiprocessing.cpu_count()}")
+    print(f"{'Procesos':>10}{'Segundos':>12}{'Aceleración':>14}{'Eficiencia':>12}")
+    for cantidad_procesos, segundos, aceleracion, eficiencia in medir_escalado():
+        print(f"{cantidad_procesos:>10}{segundos:>12.3f}{aceleracion:>14.2f}{eficiencia:>12.0%}")
@@ -0,0 +1,125 @@
+"""
+PRESUPUESTO DE TIEMPO DE IMPORTACIÓN
+====================================
+
+Mide el tiempo de importación "en frío" (en un intérprete nuevo) de los
+módulos de modelos del paquete usando la opción `-X importtime` de Python,
+y falla si la suma supera un presupuesto.
+
+Uso:
+    python -m clases_objetos.tiempo_importacion
+    python -m clases_objetos.tiempo_importacion --presupuesto-ms 80 --repeticiones 5
+
+El proceso termina con código 1 si el presupuesto se supera, por lo que
+puede usarse como verificación automática antes de publicar cambios. La
+misma verificación corre con las pruebas (tests/test_tiempo_importacion.py).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+# Módulos de modelos cuya importación en frío se mide
+MODULOS_MODELOS = (
+    "clases_objetos.persona",
+    "clases_objetos.curso_estudiante",
+    "clases_objetos.animales_herencia",
+    "clases_objetos.empleados_polimorfismo",
+)
+
+# Presupuesto por defecto para importar todos los modelos (milisegundos)
+PRESUPUESTO_MS = 40.0
+
+_RAIZ_CURSO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def medir_importacion(modulos=MODULOS_MODELOS):
+    """
+    Importa los módulos en un intérprete nuevo con `-X importtime`.
+
+    Parámetros:
+        modulos (tuple): nombres completos de los módulos a importar
+
+    Returns:
+        dict: {nombre_modulo: tiempo_acumulado_en_microsegundos} para cada
+              módulo del paquete importado en primer nivel
+    """
+    codigo = "import " + ", ".join(modulos)
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=_RAIZ_CURSO,
+        capture_output=True,
+        text=True,
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(f"No se pudieron importar los modelos:\n{resultado.stderr}")
+
+    tiempos = {}
+    for linea in resultado.stderr.splitlines():
+        # Formato: "import time: <propio> | <acumulado> | <sangría><módulo>"
+        if not linea.startswith("import time:"):
+            continue
+        partes = linea[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue
+        # El primer espacio es el separador; los siguientes son la sangría
+        nombre = partes[2][1:].rstrip()
+        # Solo las importaciones de primer nivel (sin sangría), para no
+        # contar dos veces los submódulos anidados
+        if nombre.startswith(" ") or not nombre.startswith("clases_objetos"):
+            continue
+        tiempos[nombre] = int(partes[1])
+    return tiempos
+
+
+def verificar_presupuesto(presupuesto_ms=PRESUPUESTO_MS, repeticiones=3,
+                          modulos=MODULOS_MODELOS):
+    """
+    Verifica que la importación en frío de los modelos no supere el presupuesto.
+
+    Se toma la mejor de varias repeticiones para reducir el ruido del sistema.
+
+    Parámetros:
+        presupuesto_ms (float): tiempo máximo permitido en milisegundos
+        repeticiones (int): número de intérpretes nuevos a lanzar
+        modulos (tuple): módulos a medir
+
+    Returns:
+        tuple: (cumple: bool, mejor_total_ms: float, detalle: dict)
+    """
+    mejor_total = None
+    mejor_detalle = {}
+    for _ in range(repeticiones):
+        detalle = medir_importacion(modulos)
+        total = sum(detalle.values()) / 1000
+        if mejor_total is None or total < mejor_total:
+            mejor_total = total
+            mejor_detalle = detalle
+    return mejor_total <= presupuesto_ms, mejor_total, mejor_detalle
+
+
+def main(argumentos=None):
+    """Punto de entrada de línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--presupuesto-ms", type=float, default=PRESUPUESTO_MS)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    opciones = parser.parse_args(argumentos)
+
+    cumple, total, detalle = verificar_presupuesto(
+        opciones.presupuesto_ms, opciones.repeticiones
+    )
+    for nombre, microsegundos in detalle.items():
+        print(f"{nombre:.<50} {microsegundos / 1000:>8.2f} ms")
+    print(f"{'TOTAL':.<50} {total:>8.2f} ms (presupuesto: {opciones.presupuesto_ms:.2f} ms)")
+
+    if not cumple:
+        print("❌ La importación de los modelos supera el presupuesto")
+        return 1
+    print("✓ La importación de los modelos está dentro del presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Pruebas del censo de instancias vivas (clases_objetos.censo).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import gc
+import importlib.util
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos import censo  # noqa: E402
+from clases_objetos.empleados_polimorfismo import (  # noqa: E402
+    EmpleadoFreelance,
+    EmpleadoPorComision,
+    Proyecto,
+    SistemaNomina,
+)
+
+
+class FreelanceEnCiclo(EmpleadoFreelance):
+    """Subclase propia de la prueba, para contar solo sus instancias."""
+
+
+def cargar_como_script(carpeta, nombre):
+    """Carga un archivo de modelos como módulo suelto (como `import persona`)."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ruta = os.path.join(raiz, carpeta, f"{nombre}.py")
+    especificacion = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(especificacion)
+    sys.modules[nombre] = modulo
+    especificacion.loader.exec_module(modulo)
+    return modulo
+
+
+class PruebasCenso(unittest.TestCase):
+
+    def test_instantanea_con_empleado_por_comision(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            empleado = EmpleadoPorComision("Ana", "COM1", "01/01/2024", 1000, 0.05)
+            empleado.registrar_ventas([1500, 2500])
+
+        datos = censo.CensoInstancias().instantanea()
+
+        self.assertGreaterEqual(datos["EmpleadoPorComision"]["vivos"], 1)
+        self.assertGreaterEqual(datos["EmpleadoPorComision"]["nuevos"], 1)
+
+    def test_solo_censa_las_jerarquias_de_los_modelos(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            sistema = SistemaNomina("Empresa")  # noqa: F841
+
+        datos = censo.CensoInstancias().instantanea()
+
+        self.assertNotIn("SistemaNomina", datos)
+        self.assertNotIn("RegistroVentas", datos)
+
+    def test_cuenta_sin_seguimiento_lo_que_no_admite_weakref(self):
+        proyecto = Proyecto("Sitio web", 1000, False)  # noqa: F841
+
+        datos = censo.CensoInstancias(clases=(Proyecto,)).instantanea()
+
+        self.assertGreaterEqual(datos["Proyecto"]["vivos"], 1)
+        self.assertEqual(datos["Proyecto"]["vivos"], datos["Proyecto"]["sin_seguimiento"])
+
+    def test_ciclos_sin_liberar_no_se_cuentan(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            empleado = FreelanceEnCiclo("Ciclo", "FC1", "01/01/2024")
+        empleado.yo_mismo = empleado
+        del empleado
+        gc.disable()  # que el ciclo siga sin liberar hasta la instantánea
+        try:
+            datos = censo.CensoInstancias().instantanea()
+        finally:
+            gc.enable()
+
+        self.assertNotIn("FreelanceEnCiclo", datos)
+
+    def test_cuenta_las_clases_cargadas_como_script(self):
+        persona = cargar_como_script("1_Creacion_Clases", "persona")
+        self.addCleanup(sys.modules.pop, "persona", None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            suelta = persona.Persona("Ana", 30, "ana@correo.com")  # noqa: F841
+
+        datos = censo.CensoInstancias().instantanea()
+
+        self.assertGreaterEqual(datos["Persona"]["vivos"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Pruebas del motor de deducciones compilado (clases_objetos.deducciones).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.deducciones import (  # noqa: E402
+    REGLAS_EJEMPLO,
+    Aporte,
+    ImpuestoBeneficio,
+    Retencion,
+    aplicar_deducciones,
+)
+from clases_objetos.dinero import Dinero, fraccion, redondear  # noqa: E402
+from clases_objetos.empleados_polimorfismo import EmpleadoPorComision, SistemaNomina  # noqa: E402
+from clases_objetos.rendimiento_nomina import generar_empleados  # noqa: E402
+
+
+class ComisionConBono(EmpleadoPorComision):
+    def calcular_comision(self):
+        return super().calcular_comision() + Dinero(500)
+
+
+def crear_sistema(cantidad=300):
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Pruebas")
+        for empleado in generar_empleados(cantidad, semilla=5):
+            sistema.agregar_empleado(empleado)
+        empleado = ComisionConBono("Bono", "B1", "01/01/2024", 1000, 0.05)
+        empleado.registrar_ventas([87_500])
+        sistema.agregar_empleado(empleado)
+    return sistema
+
+
+def _tasa(valor):
+    return Fraction(*fraccion(valor))
+
+
+def _redondear(exacto):
+    return redondear(exacto.numerator, exacto.denominator)
+
+
+def deduccion_objeto(regla, empleado):
+    """Deducción de un empleado calculada directamente, en centavos."""
+    bruto = Dinero(empleado.calcular_salario()).centavos
+    if isinstance(regla, Retencion):
+        tramos = [(Dinero(desde).centavos, _tasa(tasa)) for desde, tasa in regla.tramos]
+        exacto = Fraction(0)
+        for i, (desde, tasa) in enumerate(tramos):
+            hasta = tramos[i + 1][0] if i + 1 < len(tramos) else bruto
+            exacto += max(0, min(bruto, hasta) - desde) * tasa
+        return _redondear(exacto)
+    if isinstance(regla, Aporte):
+        base = bruto if regla.tope is None else min(bruto, Dinero(regla.tope).centavos)
+        return _redondear(base * _tasa(regla.tasa))
+    valor = sum(Dinero(b["valor"]).centavos for b in getattr(empleado, "beneficios", ())
+                if b["nombre"] == regla.beneficio)
+    return _redondear(valor * _tasa(regla.tasa))
+
+
+class PruebasDeducciones(unittest.TestCase):
+
+    def test_igual_a_calcular_empleado_por_empleado(self):
+        sistema = crear_sistema()
+
+        resultado = aplicar_deducciones(sistema, REGLAS_EJEMPLO)
+
+        for regla in REGLAS_EJEMPLO:
+            esperado = [deduccion_objeto(regla, e) for e in sistema.empleados]
+            self.assertEqual(list(resultado["deducciones"][regla.nombre]), esperado, regla.nombre)
+
+    def test_bruto_igual_a_calcular_nomina_total(self):
+        sistema = crear_sistema()
+        with contextlib.redirect_stdout(io.StringIO()):
+            total = sistema.calcular_nomina_total()
+
+        resultado = aplicar_deducciones(sistema, REGLAS_EJEMPLO)
+
+        self.assertEqual(resultado["totales"]["bruto"], total)
+        deducido = sum((resultado["totales"][r.nombre] for r in REGLAS_EJEMPLO), Dinero(0))
+        self.assertEqual(resultado["totales"]["neto"], total - deducido)
+
+    def test_tasa_cero_con_tope(self):
+        sistema = crear_sistema(20)
+        reglas = (Aporte("nada", 0, tope=1_000), ImpuestoBeneficio("cero", "Seguro médico", 0))
+
+        resultado = aplicar_deducciones(sistema, reglas)
+
+        self.assertEqual(resultado["totales"]["nada"], Dinero(0))
+        self.assertEqual(resultado["totales"]["neto"], resultado["totales"]["bruto"])
+
+
+if __name__ == "__main__":
+    unittest.main()
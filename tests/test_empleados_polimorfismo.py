@@ -0,0 +1,87 @@
+"""
+Pruebas del salario en caché de los empleados (clases_objetos.empleados_polimorfismo).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import copy
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.dinero import Dinero  # noqa: E402
+from clases_objetos.empleados_polimorfismo import EmpleadoPorHoras, SistemaNomina  # noqa: E402
+
+
+class HorasPropias(EmpleadoPorHoras):
+    """Subclase propia de la prueba, con su propio recargo."""
+
+
+def crear_empleado(clase=EmpleadoPorHoras):
+    with contextlib.redirect_stdout(io.StringIO()):
+        empleado = clase("Luis", "PH1", "01/01/2024", 20)
+        empleado.registrar_horas_lote(160, 10)
+    return empleado
+
+
+class PruebasSalarioEnCache(unittest.TestCase):
+
+    def test_cambiar_el_recargo_invalida_el_salario(self):
+        empleado = crear_empleado()
+        self.assertEqual(empleado.salario_actual(), Dinero(3_500))
+        self.addCleanup(setattr, EmpleadoPorHoras, "RECARGO_HORAS_EXTRA",
+                        EmpleadoPorHoras.RECARGO_HORAS_EXTRA)
+
+        EmpleadoPorHoras.RECARGO_HORAS_EXTRA = 2
+
+        self.assertEqual(empleado.salario_actual(), Dinero(3_600))
+
+    def test_recargo_de_una_subclase(self):
+        empleado = crear_empleado(HorasPropias)
+        self.assertEqual(empleado.salario_actual(), Dinero(3_500))
+
+        HorasPropias.RECARGO_HORAS_EXTRA = 3
+        self.assertEqual(empleado.salario_actual(), Dinero(3_800))
+        del HorasPropias.RECARGO_HORAS_EXTRA
+        self.assertEqual(empleado.salario_actual(), Dinero(3_500))
+
+    def test_recalcular_nomina_ve_el_recargo_nuevo(self):
+        empleado = crear_empleado()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sistema = SistemaNomina("Pruebas")
+            sistema.agregar_empleado(empleado)
+        self.assertEqual(sistema.recalcular_nomina(), Dinero(3_500))
+        self.addCleanup(setattr, EmpleadoPorHoras, "RECARGO_HORAS_EXTRA",
+                        EmpleadoPorHoras.RECARGO_HORAS_EXTRA)
+
+        EmpleadoPorHoras.RECARGO_HORAS_EXTRA = 2
+
+        self.assertEqual(sistema.recalcular_nomina(), Dinero(3_600))
+        self.assertEqual(sistema.obtener_estadisticas()["total"], Dinero(3_600))
+
+
+class PruebasSalariosOrdenados(unittest.TestCase):
+
+    def test_quitar_una_copia_no_afecta_al_original(self):
+        original = crear_empleado()
+        copia = copy.copy(original)  # mismo numero_empleado
+        with contextlib.redirect_stdout(io.StringIO()):
+            sistema = SistemaNomina("Pruebas")
+            sistema.agregar_empleado(original)
+            sistema.agregar_empleado(copia)
+            self.assertEqual(len(sistema.top_salarios()), 2)
+
+            sistema.quitar_empleado(copia)
+            original.registrar_horas_lote(10)
+
+        self.assertEqual(sistema.top_salarios(), [(original, Dinero(3_700))])
+        self.assertEqual(sistema.rango_salario(original), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Pruebas de la simulación de escenarios de nómina (clases_objetos.escenarios).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.dinero import Dinero  # noqa: E402
+from clases_objetos.empleados_polimorfismo import (  # noqa: E402
+    EmpleadoPorHoras,
+    EmpleadoTiempoCompleto,
+    SistemaNomina,
+)
+from clases_objetos.escenarios import Escenario, Factor, SimuladorEscenarios  # noqa: E402
+
+
+class HorasConRecargoPropio(EmpleadoPorHoras):
+    RECARGO_HORAS_EXTRA = 2
+
+
+def crear_sistema():
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Pruebas")
+        for clase, tarifa in ((EmpleadoPorHoras, 20), (EmpleadoPorHoras, 18.5),
+                              (HorasConRecargoPropio, 20)):
+            empleado = clase("Horas", "PH", "01/01/2024", tarifa)
+            empleado.registrar_horas_lote(160, 12)
+            sistema.agregar_empleado(empleado)
+        sistema.agregar_empleado(EmpleadoTiempoCompleto("Ana", "TC", "01/01/2024", 3000))
+    return sistema
+
+
+class PruebasEscenarios(unittest.TestCase):
+
+    def setUp(self):
+        self.sistema = crear_sistema()
+        self.simulador = SimuladorEscenarios(self.sistema)
+
+    def test_base_igual_a_calcular_nomina_total(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            total = self.sistema.calcular_nomina_total()
+
+        self.assertEqual(self.simulador.base["total"], total)
+
+    def test_subclase_que_redefine_el_recargo_queda_sin_escenario(self):
+        self.assertEqual(self.simulador.base["sin_escenario"], 1)
+
+    def test_factor_sobre_un_parametro_multiplica_el_valor_de_la_clase(self):
+        con_factor = self.simulador.evaluar(
+            Escenario("doble", {(EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): Factor(2)})
+        )
+        con_valor = self.simulador.evaluar(
+            Escenario("tres", {(EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): 3})
+        )
+
+        self.addCleanup(setattr, EmpleadoPorHoras, "RECARGO_HORAS_EXTRA",
+                        EmpleadoPorHoras.RECARGO_HORAS_EXTRA)
+        EmpleadoPorHoras.RECARGO_HORAS_EXTRA = 3
+        with contextlib.redirect_stdout(io.StringIO()):
+            total = self.sistema.calcular_nomina_total()
+
+        self.assertEqual(con_factor["total"], con_valor["total"])
+        self.assertEqual(con_factor["total"], total)
+        self.assertGreater(con_factor["diferencia"], Dinero(0))
+
+    def test_parametro_que_no_es_un_numero(self):
+        with self.assertRaises(TypeError):
+            self.simulador.evaluar(
+                Escenario("mal", {(EmpleadoPorHoras, "RECARGO_HORAS_EXTRA"): [1.5]})
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Pruebas de los formateadores precompilados (clases_objetos.formato_info).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos import formato_info  # noqa: E402
+from clases_objetos.animales_herencia import Aguila, Perro  # noqa: E402
+
+
+# Nombre global de ESTE módulo que usa el f-string de PerroPesado
+UNIDAD = "kg"
+
+
+class PerroPesado(Perro):
+    """Subclase en otro módulo cuyo f-string lee un global de su módulo."""
+
+    def obtener_info(self):
+        info_base = super().obtener_info()
+        info_adicional = f"""        Peso con unidad: {self.peso} {UNIDAD}
+        """
+        return info_base + info_adicional
+
+
+def crear(clase, *argumentos):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return clase(*argumentos)
+
+
+class PruebasFormatoInfo(unittest.TestCase):
+
+    def test_masivo_igual_al_metodo(self):
+        animales = [crear(Perro, f"Rex {i}", i, 20.5, "Labrador") for i in range(3)]
+        animales += [crear(Aguila, "Sol", 4, 5.2, 2.1) for _ in range(2)]
+
+        self.assertEqual(formato_info.obtener_info_masivo(animales),
+                         [animal.obtener_info() for animal in animales])
+
+    def test_subclase_de_otro_modulo_usa_sus_globals(self):
+        animales = [crear(PerroPesado, "Max", 5, 31.0, "Mastín") for _ in range(3)]
+
+        textos = formato_info.obtener_info_masivo(animales)
+
+        self.assertEqual(textos, [animal.obtener_info() for animal in animales])
+        self.assertIn("31.0 kg", textos[0])
+
+    def test_si_el_compilado_falla_se_usa_el_metodo(self):
+        dueno = "Ana"
+
+        class PerroConDueno(Perro):
+            # El f-string lee una variable local de la prueba: compilado
+            # con los globals del módulo da NameError
+            def obtener_info(self):
+                info_base = super().obtener_info()
+                info_adicional = f"""        Dueño: {dueno}
+        """
+                return info_base + info_adicional
+
+        animales = [crear(PerroConDueno, "Toby", 2, 8.0, "Beagle") for _ in range(3)]
+
+        self.assertEqual(formato_info.obtener_info_masivo(animales),
+                         [animal.obtener_info() for animal in animales])
+
+
+if __name__ == "__main__":
+    unittest.main()
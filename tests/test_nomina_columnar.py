@@ -0,0 +1,92 @@
+"""
+Pruebas del motor de nómina por columnas (clases_objetos.nomina_columnar).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.dinero import Dinero  # noqa: E402
+from clases_objetos.empleados_polimorfismo import (  # noqa: E402
+    EmpleadoPorComision,
+    EmpleadoPorHoras,
+    SistemaNomina,
+)
+from clases_objetos.nomina_columnar import NominaColumnar, clase_con_formula  # noqa: E402
+from clases_objetos.rendimiento_nomina import generar_empleados  # noqa: E402
+
+
+class ComisionConBono(EmpleadoPorComision):
+    """Redefine calcular_comision(): la fórmula base no le sirve."""
+
+    def calcular_comision(self):
+        return super().calcular_comision() + Dinero(500)
+
+
+class VentasDobles(EmpleadoPorComision):
+    """Redefine calcular_total_ventas(): la fórmula base no le sirve."""
+
+    def calcular_total_ventas(self):
+        return super().calcular_total_ventas() * 2
+
+
+class HorasConRecargoDoble(EmpleadoPorHoras):
+    RECARGO_HORAS_EXTRA = 2
+
+
+class ComisionSinCambios(EmpleadoPorComision):
+    """Subclase que no cambia nada de la fórmula."""
+
+
+def sistema_de_prueba(cantidad=400):
+    """Población mixta más empleados de subclases que redefinen la fórmula."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Pruebas")
+        for empleado in generar_empleados(cantidad, semilla=7):
+            sistema.agregar_empleado(empleado)
+        for numero, clase in enumerate((ComisionConBono, VentasDobles, ComisionSinCambios)):
+            empleado = clase(f"Sub {numero}", f"SUB{numero}", "01/01/2024", 1000, 0.05)
+            empleado.registrar_ventas([8750, 1250.5])
+            sistema.agregar_empleado(empleado)
+        empleado = HorasConRecargoDoble("Horas", "HX", "01/01/2024", 20)
+        empleado.registrar_horas_lote(160, 10)
+        sistema.agregar_empleado(empleado)
+    return sistema
+
+
+def salarios_objetos(sistema):
+    """Salarios en centavos calculados con los métodos de cada objeto."""
+    return [Dinero(empleado.calcular_salario()).centavos for empleado in sistema.empleados]
+
+
+class PruebasNominaColumnar(unittest.TestCase):
+
+    def test_total_igual_al_de_los_objetos(self):
+        sistema = sistema_de_prueba()
+        with contextlib.redirect_stdout(io.StringIO()):
+            total = sistema.calcular_nomina_total()
+
+        self.assertEqual(NominaColumnar.desde_sistema(sistema).total(), total)
+
+    def test_cada_salario_igual_al_del_objeto(self):
+        sistema = sistema_de_prueba()
+
+        salarios = NominaColumnar.desde_sistema(sistema).calcular_salarios()
+
+        self.assertEqual(list(salarios), salarios_objetos(sistema))
+
+    def test_subclases_que_redefinen_la_formula_se_calculan_aparte(self):
+        for clase in (ComisionConBono, VentasDobles, HorasConRecargoDoble):
+            self.assertIsNone(clase_con_formula(clase), clase.__name__)
+        self.assertIs(clase_con_formula(ComisionSinCambios), EmpleadoPorComision)
+
+
+if __name__ == "__main__":
+    unittest.main()
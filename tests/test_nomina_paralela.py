@@ -0,0 +1,62 @@
+"""
+Pruebas de la nómina paralela por fragmentos (clases_objetos.nomina_paralela).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.dinero import Dinero  # noqa: E402
+from clases_objetos.empleados_polimorfismo import EmpleadoPorComision, SistemaNomina  # noqa: E402
+from clases_objetos.nomina_paralela import calcular_nomina_paralela  # noqa: E402
+from clases_objetos.rendimiento_nomina import generar_empleados  # noqa: E402
+
+
+class ComisionConBono(EmpleadoPorComision):
+    def calcular_comision(self):
+        return super().calcular_comision() + Dinero(500)
+
+
+def crear_sistema(cantidad=300):
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Pruebas")
+        for empleado in generar_empleados(cantidad, semilla=11):
+            sistema.agregar_empleado(empleado)
+        empleado = ComisionConBono("Bono", "B1", "01/01/2024", 1000, 0.05)
+        empleado.registrar_ventas([8750])
+        sistema.agregar_empleado(empleado)
+    return sistema
+
+
+class PruebasNominaParalela(unittest.TestCase):
+
+    def setUp(self):
+        self.sistema = crear_sistema()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.total = self.sistema.calcular_nomina_total()
+        self.salarios = [Dinero(e.salario_actual()).centavos for e in self.sistema.empleados]
+
+    def test_en_el_proceso_actual(self):
+        resultado = calcular_nomina_paralela(self.sistema, procesos=0, fragmentos=7)
+
+        self.assertEqual(resultado["total"], self.total)
+        self.assertEqual(list(resultado["salarios"]), self.salarios)
+
+    def test_con_varios_procesos(self):
+        resultado = calcular_nomina_paralela(self.sistema, procesos=2, fragmentos=5)
+
+        self.assertEqual(resultado["fallidos"], {})
+        self.assertEqual(resultado["total"], self.total)
+        self.assertEqual(list(resultado["salarios"]), self.salarios)
+        self.assertEqual(resultado["cantidad"], len(self.salarios))
+
+
+if __name__ == "__main__":
+    unittest.main()
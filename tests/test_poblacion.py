@@ -0,0 +1,42 @@
+"""
+Pruebas de la población de animales por columnas (clases_objetos.poblacion).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.animales_herencia import Aguila, Perro  # noqa: E402
+from clases_objetos.poblacion import PoblacionAnimales  # noqa: E402
+
+
+class PruebasPoblacion(unittest.TestCase):
+
+    def test_agregar_sin_el_argumento_del_constructor(self):
+        poblacion = PoblacionAnimales()
+
+        with self.assertRaises(TypeError):
+            poblacion.agregar(Perro, "Rex", 3, 20.0)
+        self.assertEqual(len(poblacion), 0)
+
+    def test_argumento_con_la_marca_de_la_plantilla(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            animales = [Perro("Rex", 3, 20.0, "Labrador"), Aguila("Sol", 4, 5.2, 2.1)]
+        poblacion = PoblacionAnimales.desde_animales(animales)
+        alimento = "pollo\x00asado"
+
+        resultado = poblacion.comer(alimento)
+
+        self.assertEqual(resultado[Perro], [animales[0].comer(alimento)])
+        self.assertEqual(resultado[Aguila], [animales[1].comer(alimento)])
+
+
+if __name__ == "__main__":
+    unittest.main()
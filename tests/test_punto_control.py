@@ -0,0 +1,116 @@
+"""
+Pruebas de los puntos de control de la nómina (clases_objetos.punto_control).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos import punto_control  # noqa: E402
+from clases_objetos.empleados_polimorfismo import (  # noqa: E402
+    Empleado,
+    EmpleadoTiempoCompleto,
+    SistemaNomina,
+)
+from clases_objetos.rendimiento_nomina import generar_empleados  # noqa: E402
+
+
+class SalarioEnFloat(EmpleadoTiempoCompleto):
+    """Subclase que devuelve el salario como float."""
+
+    def calcular_salario(self):
+        return float(self.salario_mensual) + 0.25
+
+
+class Interrupcion(Exception):
+    pass
+
+
+def crear_sistema(cantidad=250, semilla=3):
+    """Población mixta; los números de empleado empiezan siempre en 1."""
+    Empleado.contador_empleados = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        sistema = SistemaNomina("Pruebas")
+        for empleado in generar_empleados(cantidad, semilla):
+            sistema.agregar_empleado(empleado)
+        sistema.agregar_empleado(SalarioEnFloat("Flotante", "FL1", "01/01/2024", 2000))
+    return sistema
+
+
+def total_objetos(sistema):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sistema.calcular_nomina_total()
+
+
+def interrumpir_en(limite):
+    def progreso(procesados, total):
+        if procesados >= limite:
+            raise Interrupcion
+    return progreso
+
+
+class PruebasPuntoControl(unittest.TestCase):
+
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta = os.path.join(directorio.name, "nomina.ctl")
+
+    def calcular(self, sistema, **opciones):
+        return punto_control.calcular_nomina_con_control(
+            sistema, self.ruta, intervalo=0, tamano_bloque=50, **opciones
+        )
+
+    def test_total_igual_a_calcular_nomina_total(self):
+        sistema = crear_sistema()
+
+        resultado = self.calcular(sistema)
+
+        self.assertEqual(resultado["total"], total_objetos(sistema))
+        self.assertEqual(resultado["reanudado_desde"], 0)
+
+    def test_reanuda_tras_reconstruir_la_poblacion(self):
+        with self.assertRaises(Interrupcion):
+            self.calcular(crear_sistema(), progreso=interrumpir_en(150))
+        sistema = crear_sistema()  # como después de reiniciar el proceso
+
+        resultado = self.calcular(sistema)
+
+        self.assertEqual(resultado["reanudado_desde"], 150)
+        self.assertEqual(resultado["total"], total_objetos(sistema))
+
+    def test_cambio_en_medio_recalcula_desde_su_bloque(self):
+        with self.assertRaises(Interrupcion):
+            self.calcular(crear_sistema(), progreso=interrumpir_en(200))
+        sistema = crear_sistema()
+        empleado = next(e for e in sistema.empleados[60:]
+                        if isinstance(e, EmpleadoTiempoCompleto))
+        posicion = sistema.empleados.index(empleado)
+        empleado.salario_mensual = empleado.salario_mensual + 1000
+
+        resultado = self.calcular(sistema)
+
+        self.assertEqual(resultado["reanudado_desde"], posicion // 50 * 50)
+        self.assertEqual(resultado["total"], total_objetos(sistema))
+
+    def test_estado_con_otra_forma_se_ignora(self):
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("[1, 2, 3]")
+        sistema = crear_sistema()
+
+        resultado = self.calcular(sistema)
+
+        self.assertEqual(resultado["reanudado_desde"], 0)
+        self.assertEqual(resultado["total"], total_objetos(sistema))
+
+
+if __name__ == "__main__":
+    unittest.main()
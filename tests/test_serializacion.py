@@ -0,0 +1,47 @@
+"""
+Pruebas de la serialización binaria de animales (clases_objetos.serializacion).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos.animales_herencia import Aguila, Gato, Perro  # noqa: E402
+from clases_objetos.serializacion import deserializar, serializar  # noqa: E402
+
+
+def crear_animales():
+    with contextlib.redirect_stdout(io.StringIO()):
+        perro = Perro("Rex", 3, 20.0, "Labrador")
+        perro.aprender_truco("sentarse")
+        perro.aprender_truco("")
+        return [perro, Gato("Michi", 2, 4.5, "negro"), Aguila("Alta", 5, 6.0, 2.3)]
+
+
+class PruebasSerializacion(unittest.TestCase):
+
+    def test_ida_y_vuelta_conserva_los_atributos(self):
+        animales = crear_animales()
+
+        leidos = deserializar(serializar(animales))
+
+        self.assertEqual([type(a) for a in leidos], [type(a) for a in animales])
+        self.assertEqual([a.__dict__ for a in leidos], [a.__dict__ for a in animales])
+
+    def test_rechaza_atributos_fuera_del_esquema(self):
+        animales = crear_animales()
+        animales[1].dueno = "Ana"
+
+        with self.assertRaisesRegex(ValueError, "dueno"):
+            serializar(animales)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Pruebas de la simulación paralela de animales (clases_objetos.simulacion_paralela).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos import simulacion_paralela  # noqa: E402
+from clases_objetos.animales_herencia import Animal, Perro  # noqa: E402
+from clases_objetos.simulacion_paralela import SimulacionParalela  # noqa: E402
+
+
+def crear_animales():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [
+            Perro("Rex", 3, 20.0, "Labrador"),
+            Animal("Fraccion", 4.5, 8.0),
+            Animal("Oso", 7, 300.0),
+            Animal("Viejo", 30, 15.0),
+        ]
+
+
+class PruebasSimulacionParalela(unittest.TestCase):
+
+    def setUp(self):
+        self.animales = crear_animales()
+        self.animales[2].estado = "hibernando"
+        self.animales[3].estado = "muerto"
+
+    def test_volcar_sin_ticks_no_cambia_nada(self):
+        with SimulacionParalela(self.animales) as simulacion:
+            simulacion.ejecutar(ticks=0)
+            simulacion.volcar()
+
+        self.assertEqual([a.edad for a in self.animales], [3, 4.5, 7, 30])
+        self.assertEqual([a.estado for a in self.animales],
+                         ["vivo", "vivo", "hibernando", "muerto"])
+
+    def test_volcar_conserva_fracciones_y_estados_propios(self):
+        with SimulacionParalela(self.animales) as simulacion:
+            simulacion.ejecutar(ticks=2)
+            simulacion.volcar()
+
+        self.assertEqual(self.animales[0].edad, 3)
+        self.assertIsInstance(self.animales[0].edad, int)
+        self.assertAlmostEqual(self.animales[1].edad, 4.5 + 2 / 365)
+        self.assertEqual(self.animales[2].estado, "hibernando")
+        self.assertEqual(self.animales[3].edad, 30)
+
+    def test_volcar_marca_a_los_que_mueren(self):
+        self.animales[1].edad = 19.999
+        with SimulacionParalela(self.animales) as simulacion:
+            simulacion.ejecutar(ticks=1)
+            simulacion.volcar()
+
+        self.assertEqual(self.animales[1].estado, "muerto")
+
+    def test_medir_escalado_parte_de_la_misma_poblacion(self):
+        edades_iniciales = []
+        original = simulacion_paralela.SimulacionParalela.ejecutar
+
+        def ejecutar(simulacion, *argumentos, **opciones):
+            edades_iniciales.append(list(simulacion.columnas["edad"]))
+            return original(simulacion, *argumentos, **opciones)
+
+        with mock.patch.object(SimulacionParalela, "ejecutar", ejecutar):
+            simulacion_paralela.medir_escalado(cantidad=20, ticks=3, procesos=(1, 2))
+
+        self.assertEqual(len(edades_iniciales), 2)
+        self.assertEqual(edades_iniciales[0], edades_iniciales[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
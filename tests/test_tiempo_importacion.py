@@ -0,0 +1,39 @@
+"""
+Prueba del presupuesto de tiempo de importación (clases_objetos.tiempo_importacion).
+
+Ejecutar desde la raíz del curso:
+    python -m unittest discover tests
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clases_objetos import tiempo_importacion  # noqa: E402
+
+
+class PruebasTiempoImportacion(unittest.TestCase):
+
+    def test_modelos_dentro_del_presupuesto(self):
+        # Mejor de 5 intérpretes nuevos, para no fallar por ruido del sistema
+        cumple, total, detalle = tiempo_importacion.verificar_presupuesto(repeticiones=5)
+
+        self.assertTrue(cumple, f"{total:.2f} ms > {tiempo_importacion.PRESUPUESTO_MS} ms:"
+                                f" {detalle}")
+
+    def test_importar_el_paquete_no_importa_los_temas(self):
+        codigo = (
+            "import sys, clases_objetos\n"
+            "print(sorted(m for m in sys.modules if m.startswith('clases_objetos.')))"
+        )
+        resultado = subprocess.run([sys.executable, "-c", codigo], capture_output=True,
+                                   text=True, cwd=tiempo_importacion._RAIZ_CURSO, check=True)
+
+        self.assertEqual(resultado.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()